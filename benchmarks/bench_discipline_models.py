@@ -0,0 +1,103 @@
+# benchmarks/bench_discipline_models.py
+"""
+Порівняння пам'яті bundle програми: дисципліни як вкладені dict vs моделі (__slots__).
+
+Для кожного файлу з programm_data/ дані bundle (YAML програми та довідники
+extra_data) завантажуються двічі: як є, у вигляді словників (як до появи
+моделей), і з секціями дисциплін, заміненими моделями Discipline (як тепер у
+ProgramBundle). Вимірюється пам'ять, яку утримує кожен результат (tracemalloc).
+
+Запуск з кореня репозиторію:
+    python benchmarks/bench_discipline_models.py
+"""
+
+import os
+import sys
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tabulate import tabulate
+
+from core.config import AppConfig
+from core.data_manipulation import DISCIPLINE_SECTIONS, build_discipline_models
+from core.file_utils import load_yaml_data
+
+config = AppConfig()
+
+
+def load_sources(yaml_file: Path) -> tuple[dict, dict, dict, dict]:
+    """YAML програми, викладачі, зміст дисциплін та глосарій - як у bundle"""
+    sources = (
+        yaml_file,
+        config.lecturers_yaml,
+        config.discipline_content_yaml,
+        config.glossary_yaml,
+    )
+    return tuple(load_yaml_data(Path(source)) or {} for source in sources)
+
+
+def build_dicts(yaml_file: Path) -> tuple:
+    """Базова репрезентація: розпарсені YAML-словники без змін"""
+    return load_sources(yaml_file)
+
+
+def build_models(yaml_file: Path) -> tuple:
+    """Нова репрезентація: секції дисциплін замінені моделями"""
+    data, lecturers, discipline_content, glossary = load_sources(yaml_file)
+    for section in DISCIPLINE_SECTIONS:
+        if section in data:
+            data[section] = build_discipline_models(
+                data[section], lecturers, discipline_content
+            )
+    return data, lecturers, discipline_content, glossary
+
+
+def measure(builder: Callable, yaml_file: Path) -> int:
+    """Пам'ять у байтах, яку утримує результат builder(yaml_file)"""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = builder(yaml_file)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main() -> None:
+    rows = []
+    dict_total = model_total = 0
+    for yaml_file in sorted(config.yaml_data_folder.glob("*.yaml")):
+        # Прогрів дискового кешу YAML, щоб обидва виміри читали однаково
+        data = build_dicts(yaml_file)[0]
+        dict_bytes = measure(build_dicts, yaml_file)
+        model_bytes = measure(build_models, yaml_file)
+        dict_total += dict_bytes
+        model_total += model_bytes
+        rows.append(
+            [
+                yaml_file.name,
+                sum(len(data.get(section) or {}) for section in DISCIPLINE_SECTIONS),
+                f"{dict_bytes / 1024:.1f}",
+                f"{model_bytes / 1024:.1f}",
+                f"{model_bytes / dict_bytes:.0%}",
+            ]
+        )
+
+    rows.append(
+        [
+            "Разом",
+            "",
+            f"{dict_total / 1024:.1f}",
+            f"{model_total / 1024:.1f}",
+            f"{model_total / dict_total:.0%}",
+        ]
+    )
+    headers = ["Файл", "Дисциплін", "dict, КіБ", "slots, КіБ", "slots / dict"]
+    print(tabulate(rows, headers=headers, tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
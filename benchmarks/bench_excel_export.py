@@ -0,0 +1,152 @@
+# benchmarks/bench_excel_export.py
+"""
+Час і пікова пам'ять generate_excel_report на синтетичних програмах.
+
+Режими:
+  - pandas: pd.ExcelWriter, уся книга будується в пам'яті
+  - stream: write-only книга openpyxl, рядки пишуться одразу у файл
+
+Кожен вимір запускається в окремому процесі, щоб ru_maxrss показував пік
+саме цього режиму. "Приріст" - пік понад пам'ять процесу з уже розібраним YAML.
+
+Запуск з кореня репозиторію:
+    python benchmarks/bench_excel_export.py --disciplines 500 2000 8000
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import yaml
+from tabulate import tabulate
+
+from core.data_manipulation import load_program_bundle
+from core.excel_exporter import generate_excel_report
+
+MODES = ("pandas", "stream")
+
+
+def write_synthetic_program(
+    path: Path,
+    n_disciplines: int,
+    n_competencies: int,
+    n_results: int,
+    per_discipline: int,
+    seed: int,
+) -> None:
+    rng = random.Random(seed)
+    competencies = {f"ФК {i}": f"Компетентність {i}" for i in range(n_competencies)}
+    results = {f"ПРН {i}": f"Програмний результат {i}" for i in range(n_results)}
+    disciplines = {
+        f"ПВ {i:05d}": {"name": f"Дисципліна {i}"} for i in range(n_disciplines)
+    }
+    mappings = {
+        code: {
+            "competencies": rng.sample(
+                list(competencies), rng.randint(1, per_discipline)
+            ),
+            "program_results": rng.sample(list(results), rng.randint(1, 5)),
+        }
+        for code in disciplines
+    }
+    data = {
+        "metadata": {"year": "2024", "degree": "Бакалавр"},
+        "disciplines": disciplines,
+        "competencies": competencies,
+        "program_results": results,
+        "mappings": mappings,
+    }
+    path.write_text(yaml.safe_dump(data, allow_unicode=True), encoding="utf-8")
+
+
+def peak_rss_mib() -> float:
+    # ru_maxrss у КіБ на Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(
+    yaml_file: Path, mode: str, output_file: Path
+) -> tuple[float, float, float]:
+    """Виконується в дочірньому процесі: (час, пік RSS, приріст RSS)"""
+    logging.disable(logging.WARNING)
+    # Розбір YAML поза виміром: однаковий для обох режимів
+    load_program_bundle(yaml_file)
+    baseline = peak_rss_mib()
+
+    start = time.perf_counter()
+    generate_excel_report(yaml_file, output_file, stream=mode == "stream")
+    elapsed = time.perf_counter() - start
+
+    peak = peak_rss_mib()
+    return elapsed, peak, peak - baseline
+
+
+def run_isolated(yaml_file: Path, mode: str, output_file: Path) -> tuple:
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(measure, yaml_file, mode, output_file).result()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Excel export benchmark")
+    parser.add_argument("--disciplines", type=int, nargs="+", default=[500, 2000, 8000])
+    parser.add_argument("--competencies", type=int, default=300)
+    parser.add_argument("--program-results", type=int, default=100)
+    parser.add_argument("--per-discipline", type=int, default=15)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_disciplines in args.disciplines:
+            yaml_file = Path(tmp) / f"synthetic_{n_disciplines}.yaml"
+            write_synthetic_program(
+                yaml_file,
+                n_disciplines,
+                args.competencies,
+                args.program_results,
+                args.per_discipline,
+                args.seed,
+            )
+            for mode in args.modes:
+                output_file = Path(tmp) / f"{mode}_{n_disciplines}.xlsx"
+                elapsed, peak, growth = run_isolated(yaml_file, mode, output_file)
+                rows.append(
+                    [
+                        n_disciplines,
+                        mode,
+                        f"{elapsed:.2f}",
+                        f"{peak:.0f}",
+                        f"{growth:.0f}",
+                        f"{output_file.stat().st_size / 2**20:.1f}",
+                    ]
+                )
+
+    headers = [
+        "Дисциплін",
+        "Режим",
+        "Час, с",
+        "Пік RSS, МіБ",
+        "Приріст, МіБ",
+        "Файл, МіБ",
+    ]
+    print(
+        f"Компетентностей: {args.competencies}, ПРН: {args.program_results}, "
+        f"до {args.per_discipline} компетентностей на дисципліну"
+    )
+    print(tabulate(rows, headers=headers, tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
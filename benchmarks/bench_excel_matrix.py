@@ -0,0 +1,115 @@
+# benchmarks/bench_excel_matrix.py
+"""
+Побудова матриці компетентностей для Excel на синтетичній програмі.
+
+Порівнюються два режими:
+  - at:    DataFrame з "" та .at[comp, disc] = "+" на кожну відповідність (стара поведінка)
+  - numpy: build_incidence_matrix (булева матриця) + to_frame() для запису
+
+Запуск з кореня репозиторію:
+    python benchmarks/bench_excel_matrix.py --disciplines 2000 --competencies 300
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pandas as pd
+from tabulate import tabulate
+
+from core.incidence_matrix import build_incidence_matrix
+
+
+def synthetic_program(
+    n_disciplines: int, n_competencies: int, per_discipline: int, seed: int
+) -> tuple[list[str], list[str], dict[str, frozenset[str]]]:
+    """Коди дисциплін, компетентностей і відповідності як у DisciplineCatalog"""
+    rng = random.Random(seed)
+    disciplines = [f"ПВ {i:04d}" for i in range(n_disciplines)]
+    competencies = [f"ФК {i:03d}" for i in range(n_competencies)]
+    links = {
+        code: frozenset(rng.sample(competencies, rng.randint(1, per_discipline)))
+        for code in disciplines
+    }
+    return disciplines, competencies, links
+
+
+def build_with_at(
+    rows: list[str], columns: list[str], links: dict[str, frozenset[str]]
+) -> pd.DataFrame:
+    df = pd.DataFrame("", index=rows, columns=columns)
+    row_set = set(rows)
+    for column in columns:
+        for code in links.get(column, ()):
+            if code in row_set:
+                df.at[code, column] = "+"
+    return df
+
+
+def build_with_numpy(
+    rows: list[str], columns: list[str], links: dict[str, frozenset[str]]
+) -> pd.DataFrame:
+    return build_incidence_matrix(rows, columns, links).to_frame()
+
+
+def timed(func: Callable[[], object], repeat: int) -> tuple[float, object]:
+    """Найкращий час з repeat запусків у секундах та результат"""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Excel incidence matrix benchmark")
+    parser.add_argument("--disciplines", type=int, default=2000)
+    parser.add_argument("--competencies", type=int, default=300)
+    parser.add_argument("--per-discipline", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    columns, rows, links = synthetic_program(
+        args.disciplines, args.competencies, args.per_discipline, args.seed
+    )
+    n_links = sum(len(codes) for codes in links.values())
+
+    at_time, at_df = timed(lambda: build_with_at(rows, columns, links), args.repeat)
+    matrix_time, matrix = timed(
+        lambda: build_incidence_matrix(rows, columns, links), args.repeat
+    )
+    numpy_time, numpy_df = timed(
+        lambda: build_with_numpy(rows, columns, links), args.repeat
+    )
+    assert at_df.equals(numpy_df), "матриці не збігаються"
+
+    rows_table = [
+        [
+            "at",
+            f"{at_time * 1000:.1f}",
+            f"{at_df.memory_usage(deep=True).sum() / 2**20:.1f}",
+        ],
+        [
+            "numpy (bool)",
+            f"{matrix_time * 1000:.1f}",
+            f"{matrix.cells.nbytes / 2**20:.2f}",
+        ],
+        ["numpy + to_frame", f"{numpy_time * 1000:.1f}", "-"],
+    ]
+    headers = ["Режим", "Час, мс", "Пам'ять, МіБ"]
+    print(
+        f"{args.disciplines} дисциплін x {args.competencies} компетентностей, "
+        f"{n_links} відповідностей"
+    )
+    print(tabulate(rows_table, headers=headers, tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# benchmarks/bench_render.py
+"""
+Вартість рендерингу однієї сторінки дисципліни для generate --all.
+
+Порівнюються три режими:
+  - fresh:    нове Environment на кожну сторінку без кешу байткоду (стара поведінка)
+  - bytecode: нове Environment на кожну сторінку, але з FileSystemBytecodeCache
+  - shared:   спільне Environment на процес (get_jinja_environment)
+
+Запуск з кореня репозиторію:
+    python benchmarks/bench_render.py [bachelor2024.yaml]
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from jinja2 import Environment
+from tabulate import tabulate
+
+from core.config import AppConfig
+from core.data_manipulation import load_program_bundle
+from core.html_generator import build_discipline_context
+from core.junja_environment import create_jinja_environment, get_jinja_environment
+
+config = AppConfig()
+
+TEMPLATE = "discipline_template.html"
+
+
+def render_all(contexts: list[dict], env_factory: Callable[[], Environment]) -> float:
+    """Рендерить усі сторінки і повертає загальний час у секундах"""
+    start = time.perf_counter()
+    for context in contexts:
+        env_factory().get_template(TEMPLATE).render(context)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Discipline page render benchmark")
+    parser.add_argument("yaml_file", nargs="?", default="bachelor2024.yaml")
+    args = parser.parse_args()
+
+    yaml_file = config.yaml_data_folder / args.yaml_file
+    codes = list(load_program_bundle(yaml_file).all_disciplines)
+    contexts = [build_discipline_context(yaml_file, code) for code in codes]
+
+    # Прогріваємо кеш байткоду, щоб режим bytecode міряв саме читання з кешу
+    create_jinja_environment().get_template(TEMPLATE)
+
+    modes = {
+        "fresh": lambda: create_jinja_environment(use_bytecode_cache=False),
+        "bytecode": create_jinja_environment,
+        "shared": get_jinja_environment,
+    }
+
+    rows = []
+    for name, env_factory in modes.items():
+        total = render_all(contexts, env_factory)
+        rows.append(
+            [
+                name,
+                len(contexts),
+                f"{total * 1000:.1f}",
+                f"{total / len(contexts) * 1000:.2f}",
+            ]
+        )
+
+    headers = ["Режим", "Сторінок", "Разом, мс", "На сторінку, мс"]
+    print(f"{yaml_file.name}: {TEMPLATE}")
+    print(tabulate(rows, headers=headers, tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
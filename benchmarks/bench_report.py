@@ -0,0 +1,111 @@
+# benchmarks/bench_report.py
+"""
+Час і пікова пам'ять generate_html_report на синтетичних програмах.
+
+Режими:
+  - render: template.render() у рядок і save_html_file
+  - stream: template.stream().dump() фрагментами у файл з атомарною заміною
+
+Кожен вимір запускається в окремому процесі (як у bench_excel_export.py).
+
+Запуск з кореня репозиторію:
+    python benchmarks/bench_report.py --disciplines 500 2000 8000
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from bench_excel_export import peak_rss_mib, write_synthetic_program
+from tabulate import tabulate
+
+from core.data_manipulation import load_program_bundle
+from core.html_generator import generate_html_report
+
+MODES = ("render", "stream")
+
+
+def measure(
+    yaml_file: Path, mode: str, output_file: Path
+) -> tuple[float, float, float]:
+    """Виконується в дочірньому процесі: (час, пік RSS, приріст RSS)"""
+    logging.disable(logging.WARNING)
+    # Розбір YAML поза виміром: однаковий для обох режимів
+    load_program_bundle(yaml_file)
+    baseline = peak_rss_mib()
+
+    start = time.perf_counter()
+    generate_html_report(str(yaml_file), str(output_file), stream=mode == "stream")
+    elapsed = time.perf_counter() - start
+
+    peak = peak_rss_mib()
+    return elapsed, peak, peak - baseline
+
+
+def run_isolated(yaml_file: Path, mode: str, output_file: Path) -> tuple:
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(measure, yaml_file, mode, output_file).result()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTML report render benchmark")
+    parser.add_argument("--disciplines", type=int, nargs="+", default=[500, 2000, 8000])
+    parser.add_argument("--competencies", type=int, default=300)
+    parser.add_argument("--program-results", type=int, default=100)
+    parser.add_argument("--per-discipline", type=int, default=15)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_disciplines in args.disciplines:
+            yaml_file = Path(tmp) / f"synthetic_{n_disciplines}.yaml"
+            write_synthetic_program(
+                yaml_file,
+                n_disciplines,
+                args.competencies,
+                args.program_results,
+                args.per_discipline,
+                args.seed,
+            )
+            for mode in args.modes:
+                output_file = Path(tmp) / f"{mode}_{n_disciplines}.html"
+                elapsed, peak, growth = run_isolated(yaml_file, mode, output_file)
+                rows.append(
+                    [
+                        n_disciplines,
+                        mode,
+                        f"{elapsed:.2f}",
+                        f"{peak:.0f}",
+                        f"{growth:.0f}",
+                        f"{output_file.stat().st_size / 2**20:.1f}",
+                    ]
+                )
+
+    headers = [
+        "Дисциплін",
+        "Режим",
+        "Час, с",
+        "Пік RSS, МіБ",
+        "Приріст, МіБ",
+        "Файл, МіБ",
+    ]
+    print(
+        f"Компетентностей: {args.competencies}, ПРН: {args.program_results}, "
+        f"до {args.per_discipline} компетентностей на дисципліну"
+    )
+    print(tabulate(rows, headers=headers, tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# benchmarks/bench_upload.py
+"""
+Пропускна здатність upload_all_pages проти локального fake WordPress.
+
+Режими:
+  - sequential: один потік, нове з'єднання на кожен запит (Connection: close)
+  - pooled:     один потік, keep-alive з'єднання з пулу сесії
+  - concurrent: пул потоків (--concurrency)
+  - adaptive:   пул потоків з AIMD-обмежувачем одночасних запитів
+  - batch:      пакетні запити /batch/v1
+
+Кожен режим завантажує всі сторінки програми (force=True) на свіжий сервер.
+
+Запуск з кореня репозиторію:
+    python benchmarks/bench_upload.py [bachelor2024.yaml] --latency 0.05 --error-rate 0.02
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# WordPressConfig вимагає облікові дані навіть для локального сервера
+os.environ.setdefault("WP_USER", "bench")
+os.environ.setdefault("WP_PASSWORD", "bench")
+
+from fake_wordpress import FakeWordPress, FakeWordPressConfig
+from requests.auth import HTTPBasicAuth
+from tabulate import tabulate
+
+from core import wordpress_uploader
+from core.config import AppConfig
+from core.handlers import handle_generate_all_disciplines
+from core.wordpress_client import WordPressClient
+from core.wordpress_uploader import upload_all_pages
+
+config = AppConfig()
+
+MODES = ("sequential", "pooled", "concurrent", "adaptive", "batch")
+
+
+def percentile(values: list[float], p: int) -> float:
+    """p-й перцентиль у мілісекундах"""
+    if len(values) < 2:
+        return values[0] * 1000 if values else 0.0
+    return statistics.quantiles(values, n=100)[p - 1] * 1000
+
+
+def run_mode(
+    mode: str, yaml_file: Path, cache_dir: Path, args: argparse.Namespace
+) -> list:
+    fake_config = FakeWordPressConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        allow_batch=mode == "batch",
+        seed=args.seed,
+    )
+    concurrency = args.concurrency if mode == "concurrent" else 1
+
+    with FakeWordPress(fake_config) as fake:
+        client = WordPressClient(
+            fake.api_url,
+            HTTPBasicAuth("bench", "bench"),
+            pool_size=max(10, concurrency),
+            backoff_factor=args.backoff,
+            requests_per_second=args.rps,
+            cache_dir=cache_dir,
+        )
+        if mode == "sequential":
+            # Як до появи сесії: окреме з'єднання на кожен запит
+            client.session.headers["Connection"] = "close"
+
+        latencies: list[float] = []
+        client.session.hooks["response"].append(
+            lambda response, *_, **__: latencies.append(
+                response.elapsed.total_seconds()
+            )
+        )
+
+        start = time.perf_counter()
+        wp_data = upload_all_pages(
+            yaml_file,
+            client,
+            concurrency=concurrency,
+            force=True,
+            adaptive=mode == "adaptive",
+        )
+        elapsed = time.perf_counter() - start
+        client.close()
+
+    uploaded = len(wp_data["links"]) if wp_data else 0
+    return [
+        mode,
+        uploaded,
+        f"{elapsed:.2f}",
+        f"{uploaded / elapsed:.1f}",
+        fake.stats.requests,
+        f"{percentile(latencies, 50):.0f}",
+        f"{percentile(latencies, 95):.0f}",
+        f"{percentile(latencies, 99):.0f}",
+        client.retries,
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="WordPress upload benchmark")
+    parser.add_argument("yaml_file", nargs="?", default="bachelor2024.yaml")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--concurrency", "-c", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--backoff", type=float, default=0.05)
+    parser.add_argument("--rps", type=float, default=None, help="Client rate limit")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    yaml_file = config.yaml_data_folder / args.yaml_file
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # upload_all_pages читає HTML і пише журнали за шляхами з AppConfig
+        wordpress_uploader.config.output_dir = Path(tmp) / "disciplines"
+        wordpress_uploader.config.wp_links_dir = Path(tmp) / "wp_links"
+        handle_generate_all_disciplines(yaml_file, wordpress_uploader.config.output_dir)
+
+        rows = [
+            run_mode(mode, yaml_file, Path(tmp) / "cache", args) for mode in args.modes
+        ]
+
+    headers = [
+        "Режим",
+        "Сторінок",
+        "Час, с",
+        "Сторінок/с",
+        "HTTP запитів",
+        "p50, мс",
+        "p95, мс",
+        "p99, мс",
+        "Повторів",
+    ]
+    print(
+        f"{yaml_file.name}: latency {args.latency * 1000:.0f}±{args.jitter * 1000:.0f} мс, "
+        f"errors {args.error_rate:.0%}, 429 {args.throttle_rate:.0%}"
+    )
+    print(tabulate(rows, headers=headers, tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# benchmarks/bench_yaml_loaders.py
+"""
+Порівняння бекендів YAML (чистий Python vs libyaml) на файлах проєкту.
+
+Запуск з кореня репозиторію:
+    python benchmarks/bench_yaml_loaders.py [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tabulate import tabulate
+
+from core.config import AppConfig
+from core.file_utils import YAML_BACKENDS, load_yaml_data
+
+config = AppConfig()
+
+
+def measure(yaml_file: Path, loader: type, repeat: int) -> tuple[float, float]:
+    """Повертає (найкращий час парсингу в мс, пік пам'яті в КіБ)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load_yaml_data(yaml_file, loader, use_cache=False)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    load_yaml_data(yaml_file, loader, use_cache=False)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best * 1000, peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="YAML loader benchmark")
+    parser.add_argument("--repeat", "-r", type=int, default=5)
+    args = parser.parse_args()
+
+    files = sorted(config.yaml_data_folder.glob("*.yaml")) + sorted(
+        config.yaml_extra_data_folder.glob("*.yaml")
+    )
+
+    rows = []
+    totals = {name: 0.0 for name in YAML_BACKENDS}
+    for yaml_file in files:
+        row = [yaml_file.name, f"{yaml_file.stat().st_size / 1024:.1f}"]
+        for name, (loader, _) in YAML_BACKENDS.items():
+            elapsed, peak = measure(yaml_file, loader, args.repeat)
+            totals[name] += elapsed
+            row += [f"{elapsed:.1f}", f"{peak:.0f}"]
+        rows.append(row)
+
+    headers = ["Файл", "КіБ"]
+    for name in YAML_BACKENDS:
+        headers += [f"{name}, мс", f"{name}, пік КіБ"]
+    print(tabulate(rows, headers=headers, tablefmt="grid"))
+
+    for name, total in totals.items():
+        print(f"{name}: {total:.1f} мс на всі файли")
+    if "libyaml" not in YAML_BACKENDS:
+        print("libyaml недоступний: PyYAML зібрано без C-розширення")
+
+
+if __name__ == "__main__":
+    main()
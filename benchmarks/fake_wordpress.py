@@ -0,0 +1,310 @@
+# benchmarks/fake_wordpress.py
+"""
+Локальна заміна WordPress REST API сторінок для навантажувальних тестів.
+
+Реалізує лише те, чим користується WordPressClient:
+  - GET     /wp-json/wp/v2/pages            (slug, parent, status, modified_after,
+                                             page, per_page, _fields)
+  - GET     /wp-json/wp/v2/pages/<id>
+  - POST    /wp-json/wp/v2/pages            (створення, 201)
+  - POST    /wp-json/wp/v2/pages/<id>       (оновлення, 200)
+  - OPTIONS /wp-json/wp/v2/pages            (allow_batch)
+  - POST    /wp-json/batch/v1               (до 25 запитів)
+
+Затримка, джитер, частка помилок 503 та відповідей 429 з Retry-After
+налаштовуються через FakeWordPressConfig.
+
+Окремий запуск з кореня репозиторію:
+    python benchmarks/fake_wordpress.py --port 8080 --latency 0.05
+"""
+
+import argparse
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+API_PREFIX = "/wp-json/wp/v2"
+BATCH_PATH = "/wp-json/batch/v1"
+MAX_BATCH_SIZE = 25
+
+PAGE_PATH = re.compile(r"^/wp/v2/pages(?:/(\d+))?$")
+
+
+@dataclass
+class FakeWordPressConfig:
+    latency: float = 0.05  # секунд на HTTP запит
+    jitter: float = 0.01  # +- секунд до latency
+    write_time: float = 0.005  # секунд на запис однієї сторінки
+    error_rate: float = 0.0  # частка відповідей 503
+    throttle_rate: float = 0.0  # частка відповідей 429
+    retry_after: int = 1  # значення Retry-After для 429
+    allow_batch: bool = True
+    seed: int | None = None
+
+
+@dataclass
+class FakeWordPressStats:
+    requests: int = 0
+    errors: int = 0
+    throttled: int = 0
+    writes: int = 0
+    batches: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, name: str, value: int = 1) -> None:
+        with self.lock:
+            setattr(self, name, getattr(self, name) + value)
+
+
+class FakeWordPress:
+    """HTTP сервер з in-memory сховищем сторінок"""
+
+    def __init__(
+        self, config: FakeWordPressConfig | None = None, host: str = "127.0.0.1"
+    ) -> None:
+        self.config = config or FakeWordPressConfig()
+        self.host = host
+        self.pages: dict[int, dict] = {}
+        self.stats = FakeWordPressStats()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+        self._server: ThreadingHTTPServer | None = None
+
+    @property
+    def api_url(self) -> str:
+        return f"http://{self.host}:{self._server.server_port}{API_PREFIX}"
+
+    def start(self, port: int = 0) -> str:
+        """Запускає сервер у фоновому потоці і повертає api_url"""
+        self._server = ThreadingHTTPServer((self.host, port), FakeWordPressHandler)
+        self._server.fake = self
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.api_url
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self) -> "FakeWordPress":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    # ----------------------------------------------------------------------
+    # Модель сторінок
+    # ----------------------------------------------------------------------
+
+    def list_pages(self, query: dict[str, str]) -> list[dict]:
+        with self._lock:
+            pages = list(self.pages.values())
+        if "slug" in query:
+            pages = [p for p in pages if p["slug"] == query["slug"]]
+        if "parent" in query:
+            pages = [p for p in pages if str(p["parent"]) == query["parent"]]
+        if "status" in query:
+            pages = [p for p in pages if p["status"] == query["status"]]
+        if "modified_after" in query:
+            pages = [p for p in pages if p["modified"] > query["modified_after"]]
+        return pages
+
+    def write_page(self, page_id: int | None, data: dict) -> tuple[int, dict]:
+        time.sleep(self.config.write_time)
+        # Як у WordPress: локальний час з точністю до секунди
+        now = datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            if page_id is not None and page_id not in self.pages:
+                return 404, {"code": "rest_post_invalid_id"}
+            if page_id is None:
+                page_id = next(self._ids)
+                page = {"id": page_id, "date": now, "status": "publish"}
+                status = 201
+            else:
+                page = self.pages[page_id]
+                status = 200
+            page.update(
+                {
+                    key: data[key]
+                    for key in ("title", "content", "slug", "parent", "status")
+                    if key in data
+                }
+            )
+            page["link"] = f"http://{self.host}/{page.get('slug', page_id)}/"
+            page["modified"] = now
+            self.pages[page_id] = page
+        self.stats.add("writes")
+        return status, dict(page)
+
+
+class FakeWordPressHandler(BaseHTTPRequestHandler):
+    """Обробник запитів; сервер має атрибут fake з екземпляром FakeWordPress"""
+
+    protocol_version = "HTTP/1.1"
+    # Заголовки і тіло пишуться окремо; без TCP_NODELAY keep-alive
+    # з'єднання впираються в delayed ACK (~40 мс на відповідь)
+    disable_nagle_algorithm = True
+
+    @property
+    def fake(self) -> FakeWordPress:
+        return self.server.fake
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+    def _reply(self, status: int, body: object, headers: dict | None = None) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, str(value))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_json(self) -> dict:
+        return json.loads(self._body or b"{}")
+
+    def _simulate_network(self) -> bool:
+        """Затримка та ін'єкція помилок; False - відповідь вже надіслана"""
+        # Тіло читаємо до відповіді, інакше його залишок на keep-alive
+        # з'єднанні буде прийнято за наступний запит
+        length = int(self.headers.get("Content-Length", 0))
+        self._body = self.rfile.read(length)
+
+        config = self.fake.config
+        self.fake.stats.add("requests")
+        delay = config.latency + self.fake._random.uniform(
+            -config.jitter, config.jitter
+        )
+        time.sleep(max(0.0, delay))
+
+        roll = self.fake._random.random()
+        if roll < config.throttle_rate:
+            self.fake.stats.add("throttled")
+            self._reply(
+                429,
+                {"code": "too_many_requests"},
+                {"Retry-After": config.retry_after},
+            )
+            return False
+        if roll < config.throttle_rate + config.error_rate:
+            self.fake.stats.add("errors")
+            self._reply(503, {"code": "service_unavailable"})
+            return False
+        return True
+
+    def _route(self) -> tuple[re.Match | None, dict[str, str]]:
+        url = urlparse(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        route = url.path.removeprefix("/wp-json")
+        return PAGE_PATH.match(route), query
+
+    def do_OPTIONS(self) -> None:
+        if not self._simulate_network():
+            return
+        match, _ = self._route()
+        if not match:
+            return self._reply(404, {"code": "rest_no_route"})
+        body = {"namespace": "wp/v2", "methods": ["GET", "POST"]}
+        if self.fake.config.allow_batch:
+            body["allow_batch"] = {"v1": True}
+        self._reply(200, body)
+
+    def do_GET(self) -> None:
+        if not self._simulate_network():
+            return
+        match, query = self._route()
+        if not match:
+            return self._reply(404, {"code": "rest_no_route"})
+
+        if match.group(1):
+            page = self.fake.pages.get(int(match.group(1)))
+            if page is None:
+                return self._reply(404, {"code": "rest_post_invalid_id"})
+            return self._reply(200, page)
+
+        pages = self.fake.list_pages(query)
+        per_page = int(query.get("per_page", 10))
+        page_number = int(query.get("page", 1))
+        total_pages = max(1, -(-len(pages) // per_page))
+        chunk = pages[(page_number - 1) * per_page : page_number * per_page]
+        if "_fields" in query:
+            fields = query["_fields"].split(",")
+            chunk = [{k: p[k] for k in fields if k in p} for p in chunk]
+        headers = {"X-WP-Total": len(pages), "X-WP-TotalPages": total_pages}
+        self._reply(200, chunk, headers)
+
+    def do_POST(self) -> None:
+        if not self._simulate_network():
+            return
+        if urlparse(self.path).path == BATCH_PATH:
+            return self._batch(self._read_json())
+
+        match, _ = self._route()
+        if not match:
+            return self._reply(404, {"code": "rest_no_route"})
+        page_id = int(match.group(1)) if match.group(1) else None
+        self._reply(*self.fake.write_page(page_id, self._read_json()))
+
+    def _batch(self, body: dict) -> None:
+        sub_requests = body.get("requests", [])
+        if not self.fake.config.allow_batch:
+            return self._reply(404, {"code": "rest_no_route"})
+        if len(sub_requests) > MAX_BATCH_SIZE:
+            return self._reply(400, {"code": "rest_invalid_param"})
+
+        self.fake.stats.add("batches")
+        responses = []
+        for sub_request in sub_requests:
+            match = PAGE_PATH.match(sub_request.get("path", ""))
+            if not match or sub_request.get("method", "POST") != "POST":
+                status, sub_body = 404, {"code": "rest_no_route"}
+            else:
+                page_id = int(match.group(1)) if match.group(1) else None
+                status, sub_body = self.fake.write_page(
+                    page_id, sub_request.get("body", {})
+                )
+            responses.append({"status": status, "body": sub_body})
+        self._reply(207, {"responses": responses})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fake WordPress pages API")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--no-batch", action="store_true")
+    args = parser.parse_args()
+
+    fake = FakeWordPress(
+        FakeWordPressConfig(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate,
+            allow_batch=not args.no_batch,
+        )
+    )
+    print(f"Fake WordPress API: {fake.start(args.port)}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        fake.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,14 +7,18 @@ from requests.auth import HTTPBasicAuth
 from core.config import AppConfig, WordPressConfig
 from core.handlers import (
     clean_output_directory,
+    handle_cache_stats,
     handle_dir_discipline,
     handle_generate_all_disciplines,
     handle_generate_excel,
     handle_generate_index,
+    handle_generate_programs_excel,
     handle_generate_report,
     handle_generate_single_discipline,
     handle_generate_syllabus,
+    handle_http_stats,
     handle_parse_index_links,
+    handle_pipeline_all_disciplines,
     handle_upload_all_disciplines,
     handle_upload_discipline,
     handle_upload_index,
@@ -27,7 +31,15 @@ from core.wordpress_client import WordPressClient
 def create_wordpress_client() -> WordPressClient:
     wp_config = WordPressConfig()
     auth = HTTPBasicAuth(wp_config.username, wp_config.password)
-    return WordPressClient(api_url=wp_config.api_url, auth=auth)
+    return WordPressClient(
+        api_url=wp_config.api_url,
+        auth=auth,
+        timeout=wp_config.timeout,
+        pool_size=wp_config.pool_size,
+        max_retries=wp_config.max_retries,
+        backoff_factor=wp_config.backoff_factor,
+        requests_per_second=wp_config.requests_per_second,
+    )
 
 
 logger = get_logger(__name__)
@@ -47,7 +59,9 @@ def resolve_yaml_path(yaml_arg: str) -> Path:
 
 def handle_generate(args: str, yaml_file: Path, output_dir: Path) -> None:
     if args.all:
-        handle_generate_all_disciplines(yaml_file, output_dir)
+        handle_generate_all_disciplines(
+            yaml_file, output_dir, args.jobs, args.incremental
+        )
         logger.info("All disciplines generated")
     elif args.discipline:
         handle_generate_single_discipline(
@@ -63,7 +77,15 @@ def handle_generate(args: str, yaml_file: Path, output_dir: Path) -> None:
 def handle_upload(args: str, yaml_file: Path, client: WordPressClient) -> None:
     if args.all:
         wp_links_file = config.wp_links_dir / f"wp_links_{yaml_file.stem}.yaml"
-        handle_upload_all_disciplines(yaml_file, wp_links_file, client)
+        handle_upload_all_disciplines(
+            yaml_file,
+            wp_links_file,
+            client,
+            args.concurrency,
+            args.force,
+            args.resume,
+            args.adaptive,
+        )
         logger.info("All disciplines uploaded")
     elif args.discipline:
         handle_upload_discipline(args.discipline, yaml_file, client)
@@ -79,7 +101,7 @@ def handle_index(
     args: str, yaml_file: Path, client: WordPressClient, output_dir: Path
 ) -> None:
     if getattr(args, "generate", False):
-        handle_generate_index(yaml_file, output_dir / "index.html")
+        handle_generate_index(yaml_file, output_dir / "index.html", stream=args.stream)
         logger.info("Index file generated")
     if getattr(args, "parse", False):
         handle_parse_index_links(yaml_file)
@@ -99,13 +121,22 @@ def handle_syllabus(
         logger.info("Syllabus file uploaded")
 
 
-def handle_report(yaml_file: Path, output_dir: Path) -> None:
-    handle_generate_report(yaml_file, output_dir / f"report_{yaml_file.stem}.html")
+def handle_report(args: str, yaml_file: Path, output_dir: Path) -> None:
+    handle_generate_report(
+        yaml_file, output_dir / f"report_{yaml_file.stem}.html", stream=args.stream
+    )
     logger.info("Report file generated")
 
 
-def handle_excel(yaml_file: Path, output_dir: Path) -> None:
-    handle_generate_excel(yaml_file, output_dir / f"report_{yaml_file.stem}.xlsx")
+def handle_excel(args: str, yaml_file: Path, output_dir: Path) -> None:
+    if args.all:
+        handle_generate_programs_excel(
+            config.yaml_data_folder, output_dir / "report_all.xlsx", args.jobs
+        )
+    else:
+        handle_generate_excel(
+            yaml_file, output_dir / f"report_{yaml_file.stem}.xlsx", stream=args.stream
+        )
     logger.info("Excell report file generated")
 
 
@@ -113,20 +144,46 @@ def handle_scenario(
     args: str, yaml_file: Path, client: WordPressClient, output_dir: Path
 ) -> None:
     if getattr(args, "full", False):
-        clean_output_directory(output_dir)
-        logger.info("Folder cleaned")
-
-        handle_generate_all_disciplines(yaml_file, output_dir)
-        logger.info("All disciplines generated")
+        incremental = getattr(args, "incremental", False)
+        if not incremental:
+            clean_output_directory(output_dir)
+            logger.info("Folder cleaned")
 
         wp_links_file = config.wp_links_dir / f"wp_links_{yaml_file.stem}.yaml"
-        handle_upload_all_disciplines(yaml_file, wp_links_file, client)
-        logger.info("All disciplines uploaded")
+        if getattr(args, "pipeline", False):
+            handle_pipeline_all_disciplines(
+                yaml_file,
+                output_dir,
+                wp_links_file,
+                client,
+                args.concurrency,
+                args.force,
+                args.resume,
+                args.adaptive,
+                incremental,
+            )
+            logger.info("All disciplines generated and uploaded")
+        else:
+            handle_generate_all_disciplines(
+                yaml_file, output_dir, incremental=incremental
+            )
+            logger.info("All disciplines generated")
+
+            handle_upload_all_disciplines(
+                yaml_file,
+                wp_links_file,
+                client,
+                args.concurrency or 1,
+                args.force,
+                args.resume,
+                args.adaptive,
+            )
+            logger.info("All disciplines uploaded")
 
-        handle_generate_index(yaml_file, output_dir / "index.html")
-        handle_parse_index_links(yaml_file)
+        # Індекс рендериться одразу з WordPress посиланнями на дисципліни
+        handle_generate_index(yaml_file, output_dir / "index.html", wp_links=True)
         handle_upload_index(yaml_file, client)
-        logger.info("Index page generated, parsed, and uploaded")
+        logger.info("Index page generated and uploaded")
     else:
         logger.error("Specify --full for scenario")
 
@@ -161,29 +218,64 @@ def handle_all(
         logger.info(f"[{i}/{len(yaml_files)}] Processing {yaml_file.name}...")
 
         try:
-            # Очистка папки перед каждым файлом
-            clean_output_directory(output_dir)
-            logger.info("Output directory cleaned")
-
-            # Генерация всех дисциплин
-            handle_generate_all_disciplines(yaml_file, output_dir)
-            logger.info(f"All disciplines generated for {yaml_file.name}")
-
-            # Генерация индекса
-            handle_generate_index(yaml_file, output_dir / "index.html")
-            logger.info(f"Index generated for {yaml_file.name}")
+            # Очистка папки перед каждым файлом (кроме инкрементального режима)
+            incremental = getattr(args, "incremental", False)
+            if not incremental:
+                clean_output_directory(output_dir)
+                logger.info("Output directory cleaned")
+            # В инкрементальном режиме у каждой программы своя папка и манифест:
+            # общие коды дисциплин иначе перезаписывают страницы друг друга
+            disciplines_dir = output_dir / yaml_file.stem if incremental else output_dir
+
+            upload = getattr(args, "upload", False)
+            pipeline = upload and getattr(args, "pipeline", False)
+            wp_links_file = config.wp_links_dir / f"wp_links_{yaml_file.stem}.yaml"
+
+            # Генерация всех дисциплин (в конвейере - вместе с загрузкой)
+            if pipeline:
+                handle_pipeline_all_disciplines(
+                    yaml_file,
+                    disciplines_dir,
+                    wp_links_file,
+                    client,
+                    args.concurrency,
+                    args.force,
+                    args.resume,
+                    args.adaptive,
+                    incremental,
+                )
+                logger.info(
+                    f"All disciplines generated and uploaded for {yaml_file.name}"
+                )
+            else:
+                handle_generate_all_disciplines(
+                    yaml_file, disciplines_dir, getattr(args, "jobs", 1), incremental
+                )
+                logger.info(f"All disciplines generated for {yaml_file.name}")
 
             # Загрузка дисциплин на WordPress
-            if getattr(args, "upload", False):
-                wp_links_file = config.wp_links_dir / f"wp_links_{yaml_file.stem}.yaml"
-                handle_upload_all_disciplines(yaml_file, wp_links_file, client)
+            if upload and not pipeline:
+                handle_upload_all_disciplines(
+                    yaml_file,
+                    wp_links_file,
+                    client,
+                    args.concurrency or 1,
+                    args.force,
+                    args.resume,
+                    args.adaptive,
+                    disciplines_dir,
+                )
                 logger.info(f"All disciplines uploaded for {yaml_file.name}")
 
-                # Парсинг ссылок из WordPress
-                handle_parse_index_links(yaml_file)
-                logger.info(f"Index links parsed for {yaml_file.name}")
+            # Генерация индекса (после загрузки - сразу с WP ссылками). Локальный
+            # индекс ссылается на файлы дисциплин рядом с ним, а загружаемый
+            # читается из output_dir
+            index_dir = output_dir if upload else disciplines_dir
+            handle_generate_index(yaml_file, index_dir / "index.html", wp_links=upload)
+            logger.info(f"Index generated for {yaml_file.name}")
 
-                # Загрузка индекса
+            # Загрузка индекса
+            if upload:
                 handle_upload_index(yaml_file, client)
                 logger.info(f"Index uploaded for {yaml_file.name}")
 
@@ -218,9 +310,9 @@ def dispatch_command(args: str, yaml_file: Path, client: WordPressClient) -> Non
         case "syllabus":
             handle_syllabus(args, yaml_file, client, output_dir)
         case "report":
-            handle_report(yaml_file, report_dir)
+            handle_report(args, yaml_file, report_dir)
         case "excel":
-            handle_excel(yaml_file, report_dir)
+            handle_excel(args, yaml_file, report_dir)
         case "dir":
             handle_dir_discipline(yaml_file)
         case "clean":
@@ -246,6 +338,17 @@ def build_parser() -> argparse.ArgumentParser:
         help="Clean directory before generation",
     )
 
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Show YAML cache stats and cold vs warm load times",
+    )
+    parser.add_argument(
+        "--http-stats",
+        action="store_true",
+        help="Show HTTP connection reuse and retry stats",
+    )
+
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # =========================
@@ -256,6 +359,14 @@ def build_parser() -> argparse.ArgumentParser:
     gen_parser.add_argument(
         "--all", "-a", action="store_true", help="Generate all disciplines"
     )
+    gen_parser.add_argument(
+        "--jobs", "-j", type=int, default=1, help="Worker processes for --all"
+    )
+    gen_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Re-render only pages whose inputs changed",
+    )
 
     # =========================
     # upload
@@ -268,6 +379,26 @@ def build_parser() -> argparse.ArgumentParser:
     upload_parser.add_argument(
         "--index", "-i", action="store_true", help="Upload index page"
     )
+    upload_parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=1,
+        help="Upload threads (requests/sec is capped by WordPressConfig)",
+    )
+    upload_parser.add_argument(
+        "--force", action="store_true", help="Upload pages even if unchanged"
+    )
+    upload_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted upload from its journal",
+    )
+    upload_parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Adjust concurrent requests to server latency and throttling",
+    )
 
     # =========================
     # index
@@ -282,6 +413,9 @@ def build_parser() -> argparse.ArgumentParser:
     index_parser.add_argument(
         "--upload", "-u", action="store_true", help="Upload index page"
     )
+    index_parser.add_argument(
+        "--stream", action="store_true", help="Render HTML straight into the file"
+    )
 
     # =========================
     # syllabus
@@ -298,8 +432,25 @@ def build_parser() -> argparse.ArgumentParser:
     # report
     # =========================
 
-    subparsers.add_parser("report", help="Create report page")
-    subparsers.add_parser("excel", help="Create excel report page")
+    report_parser = subparsers.add_parser("report", help="Create report page")
+    report_parser.add_argument(
+        "--stream", action="store_true", help="Render HTML straight into the file"
+    )
+    excel_parser = subparsers.add_parser("excel", help="Create excel report page")
+    excel_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write rows directly with a write-only workbook (large programs)",
+    )
+    excel_parser.add_argument(
+        "--all",
+        "-a",
+        action="store_true",
+        help="One streamed workbook for every YAML in the data folder",
+    )
+    excel_parser.add_argument(
+        "--jobs", "-j", type=int, help="Worker processes for loading YAML files"
+    )
 
     # =========================
     # dir / clean
@@ -317,6 +468,30 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Generate all, upload all, and rebuild index",
     )
+    scenario_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Keep output folder and re-render only changed pages",
+    )
+    scenario_parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Upload pages while they are being rendered",
+    )
+    scenario_parser.add_argument("--concurrency", "-c", type=int, help="Upload threads")
+    scenario_parser.add_argument(
+        "--force", action="store_true", help="Upload pages even if unchanged"
+    )
+    scenario_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted upload from its journal",
+    )
+    scenario_parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Adjust concurrent requests to server latency and throttling",
+    )
 
     # =========================
     # all (NEW)
@@ -328,6 +503,33 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Upload generated content to WordPress",
     )
+    all_parser.add_argument(
+        "--jobs", "-j", type=int, default=1, help="Worker processes for generation"
+    )
+    all_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Keep output folder and re-render only changed pages",
+    )
+    all_parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="With --upload, upload pages while they are being rendered",
+    )
+    all_parser.add_argument("--concurrency", "-c", type=int, help="Upload threads")
+    all_parser.add_argument(
+        "--force", action="store_true", help="Upload pages even if unchanged"
+    )
+    all_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted upload from its journal",
+    )
+    all_parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Adjust concurrent requests to server latency and throttling",
+    )
 
     return parser
 
@@ -342,6 +544,10 @@ def main(*args: tuple) -> None:
 
     try:
         dispatch_command(args, yaml_file, client)
+        if args.cache_stats:
+            handle_cache_stats(yaml_file)
+        if args.http_stats:
+            handle_http_stats(client)
     except KeyboardInterrupt:
         logger.warning("Operation cancelled by user")
         sys.exit(130)
@@ -15,14 +15,30 @@ config = AppConfig()
 # ====== Список команд и флагов для автодополнения ======
 completer = NestedCompleter.from_nested_dict(
     {
-        "generate": {"-a": None, "-d": None},
-        "upload": {"-a": None, "-d": None, "-i": None},
-        "index": {"-g": None, "-p": None, "-u": None},
+        "generate": {"-a": None, "-d": None, "-j": None, "--incremental": None},
+        "upload": {
+            "-a": None,
+            "-d": None,
+            "-i": None,
+            "-c": None,
+            "--force": None,
+            "--resume": None,
+            "--adaptive": None,
+        },
+        "index": {"-g": None, "-p": None, "-u": None, "--stream": None},
         "syllabus": {"-g": None, "-u": None},
-        "scenario": {"-f": None},
+        "scenario": {
+            "-f": None,
+            "--incremental": None,
+            "--pipeline": None,
+            "-c": None,
+            "--force": None,
+            "--resume": None,
+            "--adaptive": None,
+        },
         "dir": None,
-        "report": None,
-        "excel": None,
+        "report": {"--stream": None},
+        "excel": {"--stream": None, "-a": None, "-j": None},
         "clean": None,
         "exit": None,
         "quit": None,
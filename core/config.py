@@ -16,6 +16,16 @@ class WordPressConfig:
     # api_url: str = "https://apd.ipt.kpi.ua"
     username: str = field(default_factory=lambda: os.getenv("WP_USER", ""))
     password: str = field(default_factory=lambda: os.getenv("WP_PASSWORD", ""))
+    timeout: int = 30
+    pool_size: int = 10
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    requests_per_second: float = 5.0
+    # Межі адаптивної кількості одночасних запитів (upload --adaptive)
+    min_concurrency: int = 1
+    max_concurrency: int = 8
+    # Скільки секунд кеш інвентаря сторінок вважається свіжим без запитів
+    inventory_ttl: int = 900
 
     def __post_init__(self) -> None:
         if not self.username or not self.password:
@@ -38,6 +48,11 @@ class AppConfig:
     output_dir: Path = Path("disciplines")
     report_dir: Path = Path("docs")
     wp_links_dir: Path = Path("wp_links")
+    cache_dir: Path = Path(".matrix3_cache")
+    template_cache_size: int = 50
+    generation_manifest: str = ".manifest.json"
+    pipeline_upload_workers: int = 2
+    pipeline_queue_size: int = 8
     lecturers_yaml: Path = yaml_extra_data_folder / "lecturers.yaml"
     discipline_content_yaml: Path = yaml_extra_data_folder / "discipline_content.yaml"
     glossary_yaml: Path = yaml_extra_data_folder / "glossary.yaml"
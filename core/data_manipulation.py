@@ -1,125 +1,320 @@
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 from core.config import AppConfig
 from core.exceptions import DisciplineGeneratorError
 from core.file_utils import load_yaml_data
 from core.logging_config import get_logger
+from core.models import Discipline, Lecturer
 from core.validators import validate_yaml_schema
 
 logger = get_logger(__name__)
 
 config = AppConfig()
 
+# Ключ файлу: (абсолютний шлях, mtime_ns, size)
+FileKey = tuple[str, int, int]
 
-def get_mapped_competencies(
-    discipline_code: str, mappings: dict, all_competencies: dict
-) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
-    """Отримує компетентності для конкретної дисципліни"""
-    if discipline_code not in mappings:
-        return [], []
+_parsed_files: dict[str, tuple[FileKey, dict]] = {}
+_bundles: dict[str, tuple[tuple[FileKey, ...], "ProgramBundle"]] = {}
+# Секції YAML програми, словники яких замінюються моделями Discipline
+DISCIPLINE_SECTIONS = ("disciplines", "elevative_disciplines")
+# Кеші спільні для потоків процесу; RLock, бо load_program_bundle викликає
+# load_cached_yaml. Розбір під блокуванням: спільні файли extra_data
+# парсяться один раз, а паралелізму потоки під GIL все одно не дають
+_cache_lock = threading.RLock()
 
-    mapped_comps = mappings[discipline_code].get("competencies", [])
-    general_competencies = []
-    professional_competencies = []
 
-    for comp_code in mapped_comps:
-        if comp_code in all_competencies:
-            comp_desc = all_competencies[comp_code]
-            if comp_code.startswith("ЗК"):
-                general_competencies.append((comp_code, comp_desc))
-            elif comp_code.startswith("ФК"):
-                professional_competencies.append((comp_code, comp_desc))
+# ============================================================================
+# ProgramBundle - спільний кеш розпарсених YAML на весь процес
+# ============================================================================
 
-    return general_competencies, professional_competencies
 
+@dataclass(frozen=True)
+class ProgramBundle:
+    """
+    Розпарсені дані освітньої програми разом з довідниками з extra_data.
 
-def get_mapped_program_results(
-    discipline_code: str, mappings: dict, all_program_results: dict
-) -> list[tuple[str, str]]:
-    """Отримує програмні результати навчання для дисципліни"""
-    if discipline_code not in mappings:
-        return []
+    У data секції дисциплін уже замінені моделями Discipline: сирі словники
+    дисциплін після побудови моделей не зберігаються.
+    """
 
-    mapped_results = mappings[discipline_code].get("program_results", [])
-    program_results = []
+    yaml_file: Path
+    data: dict
+    lecturers: dict
+    discipline_content: dict
+    glossary: dict
+    # Ключі (шлях, mtime, size) файлів, з яких зібрано bundle
+    source_keys: tuple[FileKey, ...] = ()
 
-    for prn_code in mapped_results:
-        if prn_code in all_program_results:
-            program_results.append((prn_code, all_program_results[prn_code]))
+    @property
+    def metadata(self) -> dict:
+        return self.data.get("metadata", {})
 
-    return program_results
+    @property
+    def disciplines(self) -> dict[str, Discipline]:
+        return self.data.get("disciplines", {})
 
+    @property
+    def all_disciplines(self) -> dict[str, Discipline]:
+        """Обов'язкові та вибіркові дисципліни в одному словнику"""
+        return self.disciplines | self.data.get("elevative_disciplines", {})
 
-def load_discipline_data(
-    yaml_file: str | Path, discipline_code: str
-) -> tuple[dict | None, dict | None]:
-    """Завантажує дані дисципліни та інформацію про викладачів"""
-    try:
-        data = load_yaml_data(yaml_file)
-        lecturers = load_yaml_data(config.lecturers_yaml)
-        discipline_content = load_yaml_data(config.discipline_content_yaml)
+    @cached_property
+    def catalog(self) -> "DisciplineCatalog":
+        """Індекси дисциплін програми, будуються один раз на bundle"""
+        return DisciplineCatalog(self.data)
 
-        validate_yaml_schema(data)
 
-        all_disciplines = data["disciplines"].copy()
-        if "elevative_disciplines" in data:
-            all_disciplines.update(data["elevative_disciplines"])
+# ============================================================================
+# DisciplineCatalog - прямі та зворотні індекси по дисциплінах програми
+# ============================================================================
 
-        if discipline_code not in all_disciplines:
-            logger.debug("Discipline not found", discipline_code=discipline_code)
-            return None, None
 
-        discipline = all_disciplines[discipline_code]
+class DisciplineCatalog:
+    """Прямі та зворотні індекси дисциплін, компетентностей і ПРН програми"""
 
-        if "lecturer_id" in discipline:
-            lecturer_id = discipline["lecturer_id"]
-            if lecturer_id in lecturers:
-                discipline["lecturer"] = lecturers[lecturer_id]
-            else:
-                logger.debug("Lecturer not found", lecturer_id=lecturer_id)
+    GROUP_PREFIXES = ("ЗО", "ПО", "ПВ", "НК", "ВК")
 
-        if "discipline_id" in discipline:
-            discipline_id = discipline["discipline_id"]
-            if discipline_id in discipline_content:
-                content = discipline_content[discipline_id]
-                discipline["description"] = content.get("description")
-                discipline["content"] = content.get("sections", [])
-                discipline["outside_resources"] = content.get("outside_resources", [])
-            else:
-                logger.debug("Discipline ID not found", discipline_id=discipline_id)
+    def __init__(self, data: dict) -> None:
+        disciplines = data.get("disciplines", {})
+        mappings = data.get("mappings", {})
 
-        return data, discipline
+        self.competencies: dict[str, str] = data.get("competencies", {})
+        self.program_results: dict[str, str] = data.get("program_results", {})
 
-    except Exception as e:
-        logger.error("Failed to load discipline data", error=str(e))
-        raise DisciplineGeneratorError(f"Error loading discipline data: {e}")
+        # code -> discipline (обов'язкові та вибіркові)
+        self.by_code: dict[str, Discipline] = disciplines | data.get(
+            "elevative_disciplines", {}
+        )
 
+        # Lookup для пре-/постреквізитів на сторінці дисципліни
+        self.disciplines_by_code: dict[str, Discipline] = disciplines
+        self.disciplines_by_id: dict[str, Discipline] = {}
+        self.code_by_discipline_id: dict[str, str] = {}
+        for code, discipline in disciplines.items():
+            discipline_id = discipline.discipline_id
+            if discipline_id:
+                self.disciplines_by_id[discipline_id] = discipline
+                self.code_by_discipline_id[discipline_id] = code
 
-def prepare_disciplines_with_totals(disciplines: dict) -> dict:
-    """Додає розраховані підсумки до кожної дисципліни"""
-    for _, discipline in disciplines.items():
-        total_credits, all_controls = calculate_subdiscipline_totals(discipline)
-        discipline["total_credits"] = total_credits
-        discipline["all_controls"] = all_controls
+        self.codes_by_lecturer: dict[str, set[str]] = defaultdict(set)
+        self.codes_by_group: dict[str, list[str]] = {
+            prefix: [] for prefix in self.GROUP_PREFIXES
+        }
+        for code, discipline in self.by_code.items():
+            lecturer_id = discipline.lecturer_id
+            if lecturer_id:
+                self.codes_by_lecturer[lecturer_id].add(code)
+            group = code[:2]
+            if group in self.codes_by_group:
+                self.codes_by_group[group].append(code)
 
-    return disciplines
+        # Прямі (дисципліна -> коди) та зворотні (код -> дисципліни) індекси
+        self.competencies_by_code: dict[str, frozenset[str]] = {}
+        self.program_results_by_code: dict[str, frozenset[str]] = {}
+        self.codes_by_competency: dict[str, set[str]] = defaultdict(set)
+        self.codes_by_program_result: dict[str, set[str]] = defaultdict(set)
 
+        # Списки для сторінок дисциплін у порядку з mappings
+        comp_kind = {comp_code: comp_code[:2] for comp_code in self.competencies}
+        self._general: dict[str, list[tuple[str, str]]] = {}
+        self._professional: dict[str, list[tuple[str, str]]] = {}
+        self._results: dict[str, list[tuple[str, str]]] = {}
 
-def calculate_subdiscipline_totals(discipline: dict) -> tuple[int, str]:
-    """Розраховує загальні кредити та форми контролю для піддисциплін"""
-    if "subdisciplines" not in discipline or not discipline["subdisciplines"]:
-        return discipline.get("credits", 0), discipline.get("control", "")
+        for code, mapping in mappings.items():
+            comps = mapping.get("competencies") or []
+            results = mapping.get("program_results") or []
+            self.competencies_by_code[code] = frozenset(comps)
+            self.program_results_by_code[code] = frozenset(results)
+            for comp_code in comps:
+                self.codes_by_competency[comp_code].add(code)
+            for prn_code in results:
+                self.codes_by_program_result[prn_code].add(code)
 
-    total_credits = sum(
-        sub.get("credits", 0) for sub in discipline["subdisciplines"].values()
-    )
+            self._general[code] = [
+                (c, self.competencies[c]) for c in comps if comp_kind.get(c) == "ЗК"
+            ]
+            self._professional[code] = [
+                (c, self.competencies[c]) for c in comps if comp_kind.get(c) == "ФК"
+            ]
+            self._results[code] = [
+                (p, self.program_results[p])
+                for p in results
+                if p in self.program_results
+            ]
 
-    controls = list(
-        {
-            sub.get("control")
-            for sub in discipline["subdisciplines"].values()
-            if sub.get("control")
-        }
+        self._mappings = mappings
+
+    def __contains__(self, discipline_code: str) -> bool:
+        return discipline_code in self.by_code
+
+    def has_competency(self, discipline_code: str, comp_code: str) -> bool:
+        """Чи відповідає дисципліна компетентності (O(1))"""
+        return comp_code in self.competencies_by_code.get(discipline_code, ())
+
+    def has_program_result(self, discipline_code: str, prn_code: str) -> bool:
+        """Чи відповідає дисципліна програмному результату (O(1))"""
+        return prn_code in self.program_results_by_code.get(discipline_code, ())
+
+    def is_mapped(self, discipline_code: str) -> bool:
+        return discipline_code in self._mappings
+
+    def mapped_competencies(
+        self, discipline_code: str
+    ) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+        """Загальні (ЗК) та фахові (ФК) компетентності дисципліни"""
+        return (
+            self._general.get(discipline_code, []),
+            self._professional.get(discipline_code, []),
+        )
+
+    def mapped_program_results(self, discipline_code: str) -> list[tuple[str, str]]:
+        """Програмні результати навчання дисципліни"""
+        return self._results.get(discipline_code, [])
+
+
+def _file_key(path: str | Path) -> FileKey:
+    """Повертає ключ кешу файлу: шлях + mtime + розмір"""
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return str(resolved), stat.st_mtime_ns, stat.st_size
+
+
+def load_cached_yaml(path: str | Path) -> dict:
+    """Парсить YAML лише якщо файл змінився з моменту попереднього читання"""
+    key = _file_key(path)
+    with _cache_lock:
+        cached = _parsed_files.get(key[0])
+        if cached and cached[0] == key:
+            return cached[1]
+
+        data = load_yaml_data(Path(path)) or {}
+        _parsed_files[key[0]] = (key, data)
+    logger.debug(f"YAML parsed: {path}")
+    return data
+
+
+def load_program_bundle(yaml_file: str | Path) -> ProgramBundle:
+    """Повертає ProgramBundle для програми, розбираючи кожен файл один раз"""
+    sources = (
+        yaml_file,
+        config.lecturers_yaml,
+        config.discipline_content_yaml,
+        config.glossary_yaml,
     )
+    keys = tuple(_file_key(source) for source in sources)
+
+    with _cache_lock:
+        cached = _bundles.get(keys[0][0])
+        if cached and cached[0] == keys:
+            return cached[1]
 
-    return total_credits, ", ".join(controls)
+        # YAML програми не кешується в _parsed_files: після побудови моделей
+        # його словники дисциплін не потрібні
+        data = load_yaml_data(Path(yaml_file)) or {}
+        lecturers, discipline_content, glossary = (
+            load_cached_yaml(source) for source in sources[1:]
+        )
+        validate_yaml_schema(data)
+        for section in DISCIPLINE_SECTIONS:
+            if section in data:
+                data[section] = build_discipline_models(
+                    data[section], lecturers, discipline_content
+                )
+
+        bundle = ProgramBundle(
+            yaml_file=Path(yaml_file),
+            data=data,
+            lecturers=lecturers,
+            discipline_content=discipline_content,
+            glossary=glossary,
+            source_keys=keys,
+        )
+        _bundles[keys[0][0]] = (keys, bundle)
+    return bundle
+
+
+def register_program_bundle(bundle: ProgramBundle) -> None:
+    """Додає вже розпарсений bundle у кеш процесу (напр. у воркері пулу)"""
+    keys = bundle.source_keys
+    with _cache_lock:
+        _bundles[keys[0][0]] = (keys, bundle)
+
+
+def build_discipline_models(
+    disciplines: dict, lecturers: dict, discipline_content: dict
+) -> dict[str, Discipline]:
+    """Моделі дисциплін секції YAML; модель викладача спільна для його дисциплін"""
+    lecturer_models: dict[str, Lecturer | None] = {}
+    for discipline in disciplines.values():
+        lecturer_id = (
+            discipline.get("lecturer_id") if isinstance(discipline, dict) else None
+        )
+        if lecturer_id in lecturers and lecturer_id not in lecturer_models:
+            lecturer = lecturers[lecturer_id]
+            lecturer_models[lecturer_id] = (
+                Lecturer.from_dict(lecturer) if lecturer else None
+            )
+
+    return {
+        code: build_discipline_model(
+            code, discipline, lecturer_models, discipline_content
+        )
+        for code, discipline in disciplines.items()
+    }
+
+
+def build_discipline_model(
+    discipline_code: str,
+    discipline: dict | str,
+    lecturers: dict,
+    discipline_content: dict,
+) -> Discipline:
+    """
+    Будує компактну модель дисципліни з викладачем та змістом курсу.
+
+    Дисципліна, задана в YAML лише рядком, - це її назва.
+    """
+    if isinstance(discipline, str):
+        discipline = {"name": discipline}
+
+    lecturer = None
+    if "lecturer_id" in discipline:
+        lecturer_id = discipline["lecturer_id"]
+        if lecturer_id in lecturers:
+            lecturer = lecturers[lecturer_id]
+        else:
+            logger.debug(f"Lecturer not found: {lecturer_id}")
+
+    content = None
+    if "discipline_id" in discipline:
+        discipline_id = discipline["discipline_id"]
+        if discipline_id in discipline_content:
+            content = discipline_content[discipline_id]
+        else:
+            logger.debug(f"Discipline ID not found: {discipline_id}")
+
+    return Discipline.from_dict(discipline_code, discipline, lecturer, content)
+
+
+def load_discipline_data(
+    yaml_file: str | Path, discipline_code: str
+) -> tuple[dict | None, Discipline | None]:
+    """Завантажує дані програми та модель дисципліни з викладачем і змістом"""
+    try:
+        bundle = load_program_bundle(yaml_file)
+        discipline = bundle.all_disciplines.get(discipline_code)
+
+        if discipline is None:
+            logger.debug(f"Discipline not found: {discipline_code}")
+            return None, None
+
+        return bundle.data, discipline
+
+    except Exception as e:
+        logger.error(f"Failed to load discipline data: {e}")
+        raise DisciplineGeneratorError(f"Error loading discipline data: {e}")
@@ -1,80 +1,220 @@
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, NamedStyle
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 
-from core.file_utils import load_yaml_data
+from core.data_manipulation import ProgramBundle, load_program_bundle
+from core.incidence_matrix import IncidenceMatrix, build_incidence_matrix
 from core.logging_config import get_logger
+from core.models import Discipline
 
 logger = get_logger(__name__)
 
 
+SUMMARY_COLUMNS = {
+    "Код": 10,
+    "Дисципліна": 50,
+    "Компетентності": 40,
+    "Програмні результати": 40,
+    "Кількість компетентностей": 15,
+    "Кількість ПРН": 15,
+}
+
+PROGRAMS_COLUMNS = {
+    "Програма": 16,
+    "Назва": 50,
+    "Рівень": 12,
+    "Рік": 8,
+    "Дисциплін": 12,
+    "Компетентностей": 16,
+    "ПРН": 8,
+    "Зв'язків з компетентностями": 16,
+    "Зв'язків з ПРН": 16,
+    "Дисциплін без зв'язків": 16,
+    "Компетентностей без дисциплін": 16,
+    "ПРН без дисциплін": 16,
+}
+
+# Ширина колонок матриць у потоковому режимі
+MATRIX_CODE_WIDTH = 12
+MATRIX_DISCIPLINE_WIDTH = 10
+
+# Один іменований стиль на книгу: комірки заголовків посилаються на нього
+HEADER_STYLE = NamedStyle(
+    name="Заголовок",
+    font=Font(bold=True),
+    alignment=Alignment(horizontal="center", vertical="top", wrap_text=True),
+)
+
+MAX_SHEET_TITLE = 31
+
+
+@dataclass(frozen=True)
+class ProgramMatrices:
+    """Дані однієї програми для запису в Excel"""
+
+    name: str
+    metadata: dict
+    competencies: IncidenceMatrix
+    program_results: IncidenceMatrix
+    discipline_names: list[str]
+    summary_rows: list[list]
+
+
 def generate_excel_report(
-    yaml_file: str, output_file: str | Path = "matrices.xlsx"
+    yaml_file: str, output_file: str | Path = "matrices.xlsx", stream: bool = False
 ) -> None:
     """
     Генерує Excel файл з матрицями компетентності та програмних результатів на основі YAML конфігу
+
+    stream=True пише рядки одразу у write-only книгу openpyxl без DataFrame,
+    тож пам'ять не росте разом з кількістю дисциплін.
     """
 
     # Завантажуємо YAML
-    config = load_yaml_data(yaml_file)
+    program = build_program_matrices(load_program_bundle(yaml_file))
 
-    disciplines = config["disciplines"]
-    competencies = config["competencies"]
-    program_results = config["program_results"]
-    mappings = config["mappings"]
+    if stream:
+        write_excel_streaming(output_file, program)
+    else:
+        write_excel_pandas(output_file, program)
 
-    # === МАТРИЦЯ КОМПЕТЕНТНОСТЕЙ ===
-    comp_df = pd.DataFrame(
-        "", index=list(competencies.keys()), columns=list(disciplines.keys())
+    disciplines = len(program.discipline_names)
+    logger.info(f"✅ Матриці згенеровано: {output_file}")
+    logger.info(f"📊 Компетентності: {len(program.competencies.rows)} x {disciplines}")
+    logger.info(
+        f"📊 Програмні результати: {len(program.program_results.rows)} x {disciplines}"
     )
+    logger.info(f"📋 Зведена таблиця: {disciplines} дисциплін")
 
-    # === МАТРИЦЯ ПРОГРАМНИХ РЕЗУЛЬТАТІВ ===
-    prog_df = pd.DataFrame(
-        "", index=list(program_results.keys()), columns=list(disciplines.keys())
-    )
 
-    # Заповнюємо матриці на основі mappings
-    for discipline_code, mapping in mappings.items():
-        if discipline_code in disciplines:
-            # Компетентності
-            for comp_code in mapping.get("competencies", []):
-                if comp_code in comp_df.index:
-                    comp_df.at[comp_code, discipline_code] = "+"
+def generate_programs_excel_report(
+    yaml_files: Sequence[Path],
+    output_file: str | Path = "matrices.xlsx",
+    jobs: int | None = None,
+) -> None:
+    """
+    Одна книга для кількох програм: лист порівняння програм, далі матриці та
+    зведена таблиця кожної програми. Книга пишеться одним потоковим проходом.
+
+    З jobs > 1 програми завантажуються пулом процесів, і назад передаються
+    лише їхні матриці. Інакше послідовно: розбір YAML зазвичай береться з
+    кешу на диску.
+    """
+    if jobs and jobs > 1 and len(yaml_files) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            programs = list(executor.map(load_program_matrices, yaml_files))
+    else:
+        programs = [load_program_matrices(yaml_file) for yaml_file in yaml_files]
 
-            # Програмні результати
-            for prog_code in mapping.get("program_results", []):
-                if prog_code in prog_df.index:
-                    prog_df.at[prog_code, discipline_code] = "+"
+    workbook = create_streaming_workbook()
+    write_programs_sheet(workbook, programs)
+    for program in programs:
+        write_program_sheets(workbook, program, prefix=program.name)
+    workbook.save(output_file)
 
-    # Створюємо багаторівневі заголовки колонок
-    comp_columns = pd.MultiIndex.from_tuples(
-        [
-            (
-                disciplines[code].get("name", code)
-                if isinstance(disciplines[code], dict)
-                else disciplines[code],
-                code,
-            )
-            for code in comp_df.columns
+    logger.info(f"✅ Матриці згенеровано: {output_file}")
+    logger.info(f"📊 Програм: {len(programs)}, аркушів: {len(workbook.worksheets)}")
+
+
+def load_program_matrices(yaml_file: str | Path) -> ProgramMatrices:
+    """Матриці програми з YAML; верхній рівень модуля, щоб працювати в пулі"""
+    return build_program_matrices(load_program_bundle(yaml_file))
+
+
+def build_program_matrices(bundle: ProgramBundle) -> ProgramMatrices:
+    config = bundle.data
+    catalog = bundle.catalog
+    disciplines = config["disciplines"]
+
+    # === МАТРИЦІ КОМПЕТЕНТНОСТЕЙ ТА ПРОГРАМНИХ РЕЗУЛЬТАТІВ ===
+    # Булеві матриці з індексів каталогу; "+" підставляється лише для запису
+    return ProgramMatrices(
+        name=bundle.yaml_file.stem,
+        metadata=bundle.metadata,
+        competencies=build_incidence_matrix(
+            config["competencies"], disciplines, catalog.competencies_by_code
+        ),
+        program_results=build_incidence_matrix(
+            config["program_results"], disciplines, catalog.program_results_by_code
+        ),
+        discipline_names=[
+            get_discipline_name(disc_info, code)
+            for code, disc_info in disciplines.items()
         ],
-        names=["Дисципліна", "Код"],
+        summary_rows=build_summary_rows(disciplines, config["mappings"]),
     )
 
-    prog_columns = pd.MultiIndex.from_tuples(
-        [
-            (
-                disciplines[code].get("name", code)
-                if isinstance(disciplines[code], dict)
-                else disciplines[code],
-                code,
-            )
-            for code in prog_df.columns
-        ],
+
+def get_discipline_name(disc_info: Discipline, disc_code: str) -> str:
+    return disc_info.name or disc_code
+
+
+def build_summary_rows(disciplines: dict, mappings: dict) -> list[list]:
+    """Рядки зведеної таблиці в порядку SUMMARY_COLUMNS"""
+    summary_rows = []
+    for disc_code, disc_info in disciplines.items():
+        mapping = mappings.get(disc_code, {})
+        comps = mapping.get("competencies", [])
+        progs = mapping.get("program_results", [])
+        summary_rows.append(
+            [
+                disc_code,
+                get_discipline_name(disc_info, disc_code),
+                ", ".join(comps) if comps else "",
+                ", ".join(progs) if progs else "",
+                len(comps),
+                len(progs),
+            ]
+        )
+    return summary_rows
+
+
+def build_programs_row(program: ProgramMatrices) -> list:
+    """Рядок листа порівняння програм у порядку PROGRAMS_COLUMNS"""
+    comp, prog = program.competencies, program.program_results
+    unlinked = (comp.column_counts == 0) & (prog.column_counts == 0)
+    return [
+        program.name,
+        program.metadata.get("title", ""),
+        program.metadata.get("degree", ""),
+        program.metadata.get("year", ""),
+        len(program.discipline_names),
+        len(comp.rows),
+        len(prog.rows),
+        int(comp.cells.sum()),
+        int(prog.cells.sum()),
+        int(unlinked.sum()),
+        int((comp.row_counts == 0).sum()),
+        int((prog.row_counts == 0).sum()),
+    ]
+
+
+# ============================================================================
+# Запис через pandas
+# ============================================================================
+
+
+def write_excel_pandas(output_file: str | Path, program: ProgramMatrices) -> None:
+    """Запис через pd.ExcelWriter: уся книга будується в пам'яті"""
+    comp_df = program.competencies.to_frame()
+    prog_df = program.program_results.to_frame()
+
+    # Створюємо багаторівневі заголовки колонок
+    columns = pd.MultiIndex.from_tuples(
+        list(zip(program.discipline_names, program.competencies.columns)),
         names=["Дисципліна", "Код"],
     )
-
-    comp_df.columns = comp_columns
-    prog_df.columns = prog_columns
+    comp_df.columns = columns
+    prog_df.columns = columns
 
     # Зберігаємо в один Excel файл з трьома листами
     with pd.ExcelWriter(output_file, engine="openpyxl") as writer:
@@ -82,42 +222,119 @@ def generate_excel_report(
         prog_df.to_excel(writer, sheet_name="Програмні результати")
 
         # === ЗВЕДЕНА ТАБЛИЦЯ ===
-        summary_data = []
-        for disc_code, disc_info in disciplines.items():
-            # 🔧 ВИПРАВЛЕННЯ: обробка словника або рядка
-            disc_name = (
-                disc_info.get("name", disc_code)
-                if isinstance(disc_info, dict)
-                else disc_info
-            )
-            mapping = mappings.get(disc_code, {})
-            comps = mapping.get("competencies", [])
-            progs = mapping.get("program_results", [])
-
-            summary_data.append(
-                {
-                    "Код": disc_code,
-                    "Дисципліна": disc_name,
-                    "Компетентності": ", ".join(comps) if comps else "",
-                    "Програмні результати": ", ".join(progs) if progs else "",
-                    "Кількість компетентностей": len(comps),
-                    "Кількість ПРН": len(progs),
-                }
-            )
-
-        summary_df = pd.DataFrame(summary_data)
+        summary_df = pd.DataFrame(program.summary_rows, columns=list(SUMMARY_COLUMNS))
         summary_df.to_excel(writer, sheet_name="Зведена таблиця", index=False)
 
         # Налаштовуємо ширину колонок для зведеної таблиці
         worksheet = writer.sheets["Зведена таблиця"]
-        worksheet.column_dimensions["A"].width = 10  # Код
-        worksheet.column_dimensions["B"].width = 50  # Дисципліна
-        worksheet.column_dimensions["C"].width = 40  # Компетентності
-        worksheet.column_dimensions["D"].width = 40  # Програмні результати
-        worksheet.column_dimensions["E"].width = 15  # Кількість компетентностей
-        worksheet.column_dimensions["F"].width = 15  # Кількість ПРН
+        for i, width in enumerate(SUMMARY_COLUMNS.values(), start=1):
+            worksheet.column_dimensions[get_column_letter(i)].width = width
 
-    logger.info(f"✅ Матриці згенеровано: {output_file}")
-    logger.info(f"📊 Компетентності: {len(competencies)} x {len(disciplines)}")
-    logger.info(f"📊 Програмні результати: {len(program_results)} x {len(disciplines)}")
-    logger.info(f"📋 Зведена таблиця: {len(disciplines)} дисциплін")
+
+# ============================================================================
+# Потоковий запис (write-only книга openpyxl)
+# ============================================================================
+
+
+def write_excel_streaming(output_file: str | Path, program: ProgramMatrices) -> None:
+    """
+    Запис через write-only книгу openpyxl: рядки йдуть одразу у файл.
+
+    Розміщення комірок таке ж, як у pandas (дворівневий заголовок і порожній
+    рядок під ним), заголовки додатково виділені жирним.
+    """
+    workbook = create_streaming_workbook()
+    write_program_sheets(workbook, program)
+    workbook.save(output_file)
+
+
+def create_streaming_workbook() -> Workbook:
+    workbook = Workbook(write_only=True)
+    workbook.add_named_style(HEADER_STYLE)
+    return workbook
+
+
+def sheet_title(title: str, prefix: str = "") -> str:
+    """Назва листа з префіксом програми в межах 31 символу Excel"""
+    if not prefix:
+        return title
+    return f"{prefix} {title}"[:MAX_SHEET_TITLE]
+
+
+def write_program_sheets(
+    workbook: Workbook, program: ProgramMatrices, prefix: str = ""
+) -> None:
+    """Матриці та зведена таблиця програми; prefix розрізняє програми в одній книзі"""
+    write_matrix_sheet(
+        workbook,
+        sheet_title("Компетентності", prefix),
+        program.competencies,
+        program.discipline_names,
+    )
+    # "<програма> Програмні результати" не вміщується в 31 символ
+    write_matrix_sheet(
+        workbook,
+        sheet_title("Програмні результати" if not prefix else "ПРН", prefix),
+        program.program_results,
+        program.discipline_names,
+    )
+
+    # === ЗВЕДЕНА ТАБЛИЦЯ ===
+    write_table_sheet(
+        workbook,
+        sheet_title("Зведена таблиця", prefix),
+        SUMMARY_COLUMNS,
+        program.summary_rows,
+    )
+
+
+def write_programs_sheet(workbook: Workbook, programs: list[ProgramMatrices]) -> None:
+    """Лист порівняння програм за розмірами та покриттям матриць"""
+    write_table_sheet(
+        workbook,
+        "Програми",
+        PROGRAMS_COLUMNS,
+        [build_programs_row(program) for program in programs],
+    )
+
+
+def write_table_sheet(
+    workbook: Workbook, title: str, columns: dict[str, int], rows: list[list]
+) -> None:
+    """Простий лист: рядок заголовків з columns (назва -> ширина) і рядки даних"""
+    worksheet = workbook.create_sheet(title)
+    for i, width in enumerate(columns.values(), start=1):
+        worksheet.column_dimensions[get_column_letter(i)].width = width
+    worksheet.append([header_cell(worksheet, name) for name in columns])
+    for row in rows:
+        worksheet.append(row)
+
+
+def write_matrix_sheet(
+    workbook: Workbook, title: str, matrix: IncidenceMatrix, names: list[str]
+) -> None:
+    """Лист матриці: ширини та заголовки до рядків, далі по рядку з matrix.cells"""
+    worksheet = workbook.create_sheet(title)
+    worksheet.column_dimensions["A"].width = MATRIX_CODE_WIDTH
+    for i in range(2, len(matrix.columns) + 2):
+        letter = get_column_letter(i)
+        worksheet.column_dimensions[letter].width = MATRIX_DISCIPLINE_WIDTH
+    worksheet.freeze_panes = "B4"
+
+    worksheet.append(
+        [header_cell(worksheet, value) for value in ["Дисципліна", *names]]
+    )
+    worksheet.append(
+        [header_cell(worksheet, value) for value in ["Код", *matrix.columns]]
+    )
+    worksheet.append([])
+
+    # Рядок за рядком, щоб не тримати в пам'яті всю матрицю з "+"
+    for code, cells in zip(matrix.rows, matrix.cells):
+        worksheet.append([code, *np.where(cells, "+", None).tolist()])
+
+
+def header_cell(worksheet: WriteOnlyWorksheet, value: str) -> WriteOnlyCell:
+    cell = WriteOnlyCell(worksheet, value=value)
+    cell.style = HEADER_STYLE.name
+    return cell
@@ -1,13 +1,41 @@
+import hashlib
+import json
+import os
+import pickle
 import sys
+import tempfile
+import time
 from pathlib import Path
 
 import yaml
 
+from core.config import AppConfig
 from core.exceptions import ParrentIdError
 from core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+config = AppConfig()
+
+# Бекенди YAML: libyaml (C) якщо доступний, інакше чистий Python
+YAML_BACKENDS: dict[str, tuple[type, type]] = {
+    "python": (yaml.SafeLoader, yaml.SafeDumper),
+}
+if getattr(yaml, "__with_libyaml__", False):
+    YAML_BACKENDS["libyaml"] = (yaml.CSafeLoader, yaml.CSafeDumper)
+
+DEFAULT_YAML_BACKEND = "libyaml" if "libyaml" in YAML_BACKENDS else "python"
+YamlLoader, YamlDumper = YAML_BACKENDS[DEFAULT_YAML_BACKEND]
+
+# Версія формату дискового кешу; збільшити, якщо змінюється структура даних
+YAML_CACHE_VERSION = 1
+
+# Результат _read_yaml_cache без запису: None - теж коректний розбір YAML
+CACHE_MISS = object()
+
+# Статистика дискового кешу YAML за поточний процес
+yaml_cache_stats = {"hits": 0, "misses": 0, "seconds": 0.0}
+
 
 def get_safe_filename(discipline_code: str) -> str:
     """Створює безпечне ім'я файлу з коду дисципліни"""
@@ -28,14 +56,193 @@ def save_html_file(content: str, output_file: str | Path) -> None:
         raise
 
 
-def load_yaml_data(yaml_path: Path) -> dict | None:
-    """Завантаження YAML файлу"""
+def get_yaml_cache_path(yaml_path: Path, raw: bytes, loader: type = YamlLoader) -> Path:
+    """
+    Шлях до кешу: <файл>-<хеш вмісту файлу + версія завантажувача>.pickle
+
+    Префікс однаковий для всіх версій вмісту одного файлу з одним
+    завантажувачем, тож застарілі записи можна знайти й видалити.
+    """
+    loader_version = f"{YAML_CACHE_VERSION}:{yaml.__version__}:{loader.__name__}"
+    source = f"{Path(yaml_path).resolve()}:{loader.__name__}"
+    prefix = hashlib.sha256(source.encode()).hexdigest()[:16]
+    digest = hashlib.sha256(loader_version.encode() + b"\0" + raw).hexdigest()
+    return config.cache_dir / f"{prefix}-{digest}.pickle"
+
+
+def _read_yaml_cache(cache_path: Path) -> object:
+    """Читає розпарсені дані з кешу; CACHE_MISS якщо запису немає чи він пошкоджений"""
+    if not cache_path.exists():
+        return CACHE_MISS
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except Exception as e:
+        logger.debug(f"Пошкоджений запис кешу {cache_path}: {e}")
+        return CACHE_MISS
+
+
+def _prune_yaml_cache(cache_path: Path) -> None:
+    """Видаляє записи того ж файлу, збережені для його попереднього вмісту"""
+    prefix = cache_path.name.split("-", 1)[0]
+    for stale in cache_path.parent.glob(f"{prefix}-*.pickle"):
+        if stale != cache_path:
+            stale.unlink(missing_ok=True)
+
+
+def replace_file_atomically(target: Path, content: bytes) -> None:
+    """
+    Записує content у target через тимчасовий файл поруч і os.replace.
+
+    Ім'я тимчасового файлу унікальне для кожного запису (mkstemp), тож
+    потоки й процеси, що пишуть той самий target, не заважають один одному.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _write_yaml_cache(cache_path: Path, data: dict | None) -> None:
+    """Атомарно записує розпарсені дані в кеш"""
+    try:
+        replace_file_atomically(
+            cache_path, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        _prune_yaml_cache(cache_path)
+    except Exception as e:
+        logger.warning(f"Не вдалося записати кеш {cache_path}: {e}")
+
+
+def load_yaml_data(
+    yaml_path: Path, loader: type = YamlLoader, use_cache: bool = True
+) -> dict | None:
+    """
+    Завантаження YAML файлу (за замовчуванням через libyaml, якщо він є).
+
+    Спочатку шукає розпарсені дані в config.cache_dir за хешем вмісту файлу,
+    і лише при промаху парсить YAML та зберігає результат у кеш, видаляючи
+    записи для попереднього вмісту цього файлу.
+    """
+    start = time.perf_counter()
     try:
-        with open(yaml_path, encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        raw = Path(yaml_path).read_bytes()
+        if not use_cache:
+            return yaml.load(raw.decode("utf-8"), Loader=loader)
+
+        cache_path = get_yaml_cache_path(yaml_path, raw, loader)
+        data = _read_yaml_cache(cache_path)
+        if data is not CACHE_MISS:
+            yaml_cache_stats["hits"] += 1
+            return data
+
+        yaml_cache_stats["misses"] += 1
+        data = yaml.load(raw.decode("utf-8"), Loader=loader)
+        _write_yaml_cache(cache_path, data)
+        return data
     except Exception as e:
         logger.error(f"Помилка читання YAML файлу: {e}")
         sys.exit(1)
+    finally:
+        if use_cache:
+            yaml_cache_stats["seconds"] += time.perf_counter() - start
+
+
+def _load_json_state(state_file: Path) -> dict:
+    """Читає JSON-файл стану; відсутній або пошкоджений файл - порожній стан"""
+    if not state_file.exists():
+        return {}
+    try:
+        return json.loads(state_file.read_text(encoding="utf-8"))
+    except Exception as e:
+        logger.warning(f"Файл стану {state_file} пошкоджено, ігноруємо: {e}")
+        return {}
+
+
+def _save_json_state(state: dict, state_file: Path) -> None:
+    """Атомарно зберігає JSON-файл стану"""
+    replace_file_atomically(
+        state_file,
+        json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8"),
+    )
+
+
+def load_generation_manifest(manifest_file: Path) -> dict[str, str]:
+    """Завантажує маніфест генерації: ім'я HTML файлу -> хеш вхідних даних"""
+    return _load_json_state(manifest_file)
+
+
+def save_generation_manifest(manifest: dict[str, str], manifest_file: Path) -> None:
+    """Атомарно зберігає маніфест генерації"""
+    _save_json_state(manifest, manifest_file)
+
+
+def prune_generation_manifest(
+    manifest: dict[str, str], output_dir: Path, file_names: set[str]
+) -> list[str]:
+    """
+    Видаляє з маніфесту та з output_dir сторінки, яких немає в file_names
+    (дисципліни, прибрані з програми). Повертає імена видалених файлів.
+    """
+    stale = [name for name in manifest if name not in file_names]
+    for name in stale:
+        (output_dir / name).unlink(missing_ok=True)
+        del manifest[name]
+    return stale
+
+
+def load_upload_ledger(ledger_file: Path) -> dict[str, dict]:
+    """Завантажує журнал завантажень: код дисципліни -> стан відправленої сторінки"""
+    return _load_json_state(ledger_file)
+
+
+def save_upload_ledger(ledger: dict[str, dict], ledger_file: Path) -> None:
+    """Атомарно зберігає журнал завантажень"""
+    _save_json_state(ledger, ledger_file)
+
+
+def get_inventory_cache_path(
+    parent_id: int, cache_dir: Path = config.cache_dir
+) -> Path:
+    """Шлях до кешу інвентаря дочірніх сторінок WordPress для parent_id"""
+    return cache_dir / "wp_inventory" / f"pages_{parent_id}.json"
+
+
+def load_remote_inventory(cache_file: Path) -> dict:
+    """Завантажує кеш інвентаря: {"api_url", "synced_at", "watermark", "pages"}"""
+    return _load_json_state(cache_file)
+
+
+def save_remote_inventory(inventory: dict, cache_file: Path) -> None:
+    """Атомарно зберігає кеш інвентаря"""
+    _save_json_state(inventory, cache_file)
+
+
+def append_jsonl_record(record: dict, journal_file: Path) -> None:
+    """Дописує один запис у JSONL-журнал і одразу скидає його на диск"""
+    journal_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(journal_file, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def load_jsonl_records(journal_file: Path) -> list[dict]:
+    """Читає JSONL-журнал; обірваний останній рядок (після падіння) пропускається"""
+    if not journal_file.exists():
+        return []
+    records = []
+    for line in journal_file.read_text(encoding="utf-8").splitlines():
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            logger.warning(f"Пропущено пошкоджений запис журналу {journal_file}")
+    return records
 
 
 def get_discipline_parent_id(yaml_data: dict) -> int:
@@ -70,6 +277,6 @@ def save_wp_links_yaml(wp_data: dict, output_file: str = "wp_links.yaml") -> Non
     output_path = Path(output_file)
 
     with open(output_path, "w", encoding="utf-8") as f:
-        yaml.dump(wp_data, f, allow_unicode=True)
+        yaml.dump(wp_data, f, Dumper=YamlDumper, allow_unicode=True)
 
     logger.info(f"📋 WP посилання збережені в {output_path}")
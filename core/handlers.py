@@ -1,21 +1,36 @@
 import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from tabulate import tabulate
 
-from core.excel_exporter import generate_excel_report
-from core.file_utils import load_yaml_data, save_wp_links_yaml
+from core.config import AppConfig
+from core.data_manipulation import load_program_bundle, register_program_bundle
+from core.excel_exporter import generate_excel_report, generate_programs_excel_report
+from core.file_utils import (
+    load_yaml_data,
+    save_generation_manifest,
+    save_wp_links_yaml,
+    yaml_cache_stats,
+)
 from core.html_generator import (
     generate_discipline_page,
     generate_html_report,
     generate_index_page,
     generate_syllabus_page,
+    get_discipline_input_hash,
+    get_discipline_output_path,
+    load_incremental_manifest,
 )
+from core.link_resolver import load_link_resolver
 from core.logging_config import get_logger
 from core.models import WordPressPage
 from core.parse_index_links import parse_index_links
 from core.wordpress_client import WordPressClient
 from core.wordpress_uploader import (
+    pipeline_upload_all_pages,
     upload_all_pages,
     upload_discipline_page,
     upload_index,
@@ -64,14 +79,13 @@ def handle_dir_discipline(yaml_file: str | Path, max_len: int = 80) -> None:
         None: Функція нічого не повертає, лише виводить таблицю у консоль.
     """
 
-    data = load_yaml_data(yaml_file)
-    all_disciplines = data.get("disciplines", {}).copy()
-    if "elevative_disciplines" in data:
-        all_disciplines.update(data.get("elevative_disciplines", {}))
+    bundle = load_program_bundle(yaml_file)
+    data = bundle.data
+    all_disciplines = bundle.all_disciplines
 
     table_data = []
     for discipline_code, info in all_disciplines.items():
-        name = info.get("name", "")
+        name = info.name
         if len(name) > max_len:
             name = name[: max_len - 3] + "..."  # обрізаємо і додаємо три крапки
         table_data.append(
@@ -86,21 +100,94 @@ def handle_dir_discipline(yaml_file: str | Path, max_len: int = 80) -> None:
     print(tabulate(table_data, headers=headers, tablefmt="grid"))
 
 
+def handle_cache_stats(yaml_file: str | Path) -> None:
+    """
+    Виводить статистику дискового кешу YAML та порівняння холодного і теплого старту.
+
+    Холодний старт - парсинг YAML без кешу, теплий - читання з config.cache_dir.
+    """
+    config = AppConfig()
+    run_stats = dict(yaml_cache_stats)  # знімок до власних вимірювань
+    sources = [
+        Path(yaml_file),
+        config.lecturers_yaml,
+        config.discipline_content_yaml,
+        config.glossary_yaml,
+    ]
+
+    table_data = []
+    cold_total = warm_total = 0.0
+    for source in sources:
+        start = time.perf_counter()
+        load_yaml_data(source, use_cache=False)
+        cold = time.perf_counter() - start
+
+        load_yaml_data(source)  # гарантуємо, що запис у кеші є
+        start = time.perf_counter()
+        load_yaml_data(source)
+        warm = time.perf_counter() - start
+
+        cold_total += cold
+        warm_total += warm
+        table_data.append([source.name, f"{cold * 1000:.1f}", f"{warm * 1000:.1f}"])
+
+    table_data.append(["Разом", f"{cold_total * 1000:.1f}", f"{warm_total * 1000:.1f}"])
+    headers = ["Файл", "Холодний, мс", "Теплий, мс"]
+    print(tabulate(table_data, headers=headers, tablefmt="grid"))
+    print(
+        f"Кеш ({config.cache_dir}) за цей запуск: "
+        f"{run_stats['hits']} влучань, {run_stats['misses']} промахів, "
+        f"{run_stats['seconds'] * 1000:.1f} мс на завантаження YAML"
+    )
+
+
+def handle_http_stats(client: WordPressClient) -> None:
+    """Виводить статистику перевикористання HTTP з'єднань і повторів запитів"""
+    stats = client.connection_stats()
+    if not stats:
+        print("HTTP запитів не було")
+        return
+
+    table_data = [
+        [host, s["requests"], s["connections"], s["reused"]]
+        for host, s in stats.items()
+    ]
+    headers = ["Хост", "Запитів", "З'єднань", "Перевикористано"]
+    print(tabulate(table_data, headers=headers, tablefmt="grid"))
+    print(f"Повторів запитів (429/502/503/504): {client.retries}")
+
+
 # ==================================================================================
 # Handlers для створення звіту
 # ==================================================================================
 
 
-def handle_generate_report(yaml_file: str | Path, output_filename: Path) -> bool:
+def handle_generate_report(
+    yaml_file: str | Path, output_filename: Path, stream: bool = False
+) -> bool:
     """CLI хендлер для генерації звітніх таблиць"""
 
-    return generate_html_report(str(yaml_file), str(output_filename))
+    return generate_html_report(str(yaml_file), str(output_filename), stream=stream)
 
 
-def handle_generate_excel(yaml_file: str | Path, output_filename: Path) -> bool:
+def handle_generate_excel(
+    yaml_file: str | Path, output_filename: Path, stream: bool = False
+) -> bool:
     """CLI хендлер для генерації звітніх таблиць в excel"""
 
-    return generate_excel_report(str(yaml_file), str(output_filename))
+    return generate_excel_report(str(yaml_file), str(output_filename), stream=stream)
+
+
+def handle_generate_programs_excel(
+    folder: Path, output_filename: Path, jobs: int | None = None
+) -> None:
+    """CLI хендлер для однієї excel книги з усіма програмами з папки"""
+
+    yaml_files = sorted(folder.glob("*.yaml")) + sorted(folder.glob("*.yml"))
+    if not yaml_files:
+        logger.warning(f"No YAML files found in {folder}")
+        return
+    generate_programs_excel_report(yaml_files, output_filename, jobs)
 
 
 # ==================================================================================
@@ -121,35 +208,99 @@ def handle_generate_single_discipline(
     )
 
 
+def _generate_discipline_task(
+    yaml_file: str, output_dir: Path, discipline_code: str
+) -> bool:
+    """Задача для пулу процесів: генерує одну сторінку дисципліни"""
+    output_filename = output_dir / f"{discipline_code}.html"
+    return generate_discipline_page(yaml_file, discipline_code, str(output_filename))
+
+
+def _plan_incremental_generation(
+    yaml_file: Path, output_dir: Path, codes: list[str], manifest: dict[str, str]
+) -> dict[str, tuple[str, str]]:
+    """
+    Повертає дисципліни, сторінки яких треба перегенерувати:
+    code -> (ім'я HTML файлу, новий хеш вхідних даних).
+    """
+    pending = {}
+    for discipline_code in codes:
+        output_path = get_discipline_output_path(output_dir / f"{discipline_code}.html")
+        input_hash = get_discipline_input_hash(yaml_file, discipline_code)
+        if manifest.get(output_path.name) != input_hash or not output_path.exists():
+            pending[discipline_code] = (output_path.name, input_hash)
+    return pending
+
+
 def handle_generate_all_disciplines(
-    yaml_file: Path, output_dir: Path
+    yaml_file: Path, output_dir: Path, jobs: int = 1, incremental: bool = False
 ) -> dict[str, bool]:
-    """CLI handler for generating all disciplines with a progress bar."""
+    """
+    CLI handler for generating all disciplines with a progress bar.
 
-    data = load_yaml_data(yaml_file)
+    With jobs > 1 pages are rendered by a process pool. Each worker receives
+    the already parsed ProgramBundle once through the pool initializer, and
+    results are collected in discipline order.
 
-    # Get all disciplines
-    all_disciplines = data.get("disciplines", {}).copy()
-    if "elevative_disciplines" in data:
-        all_disciplines.update(data.get("elevative_disciplines", {}))
+    With incremental=True pages whose input hash matches the manifest in
+    output_dir (and whose HTML file still exists) are not rendered again, and
+    pages of disciplines removed from the program are deleted.
+    """
 
-    total = len(all_disciplines)
-    logger.info(f"🎯 Generating {total} disciplines from {yaml_file.name}")
+    # Program YAML is parsed once and shared by every page below
+    bundle = load_program_bundle(yaml_file)
+    codes = list(bundle.all_disciplines)
 
-    results = {}
-    successful = 0
+    total = len(codes)
+    logger.info(f"🎯 Generating {total} disciplines from {yaml_file.name}")
 
-    # Generate disciplines with progress
-    for i, discipline_code in enumerate(all_disciplines.keys(), 1):
-        output_filename = output_dir / f"{discipline_code}.html"
-        logger.info(f"[{i}/{total}] Generating {discipline_code}...")
-        success = generate_discipline_page(
-            str(yaml_file), discipline_code, str(output_filename)
+    manifest_file = output_dir / AppConfig().generation_manifest
+    if incremental:
+        manifest = load_incremental_manifest(output_dir, codes)
+        plan = _plan_incremental_generation(yaml_file, output_dir, codes, manifest)
+        pending = [code for code in codes if code in plan]
+        logger.info(
+            f"Incremental: {total - len(pending)} unchanged, {len(pending)} to render"
         )
-        results[discipline_code] = success
-        if success:
-            successful += 1
-
+    else:
+        pending = codes
+
+    # Незмінені сторінки вважаються успішними
+    results = {code: True for code in codes}
+
+    generate = partial(_generate_discipline_task, str(yaml_file), output_dir)
+
+    if jobs > 1 and len(pending) > 1:
+        logger.info(f"Using {jobs} worker processes")
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=register_program_bundle,
+            initargs=(bundle,),
+        ) as executor:
+            # map() повертає результати в порядку дисциплін, прогрес пише лише
+            # батьківський процес, тому лог не перемішується
+            outcomes = executor.map(
+                generate, pending, chunksize=max(1, len(pending) // (jobs * 4))
+            )
+            for i, (discipline_code, success) in enumerate(zip(pending, outcomes), 1):
+                logger.info(f"[{i}/{len(pending)}] Generated {discipline_code}")
+                results[discipline_code] = success
+    else:
+        # Generate disciplines with progress
+        for i, discipline_code in enumerate(pending, 1):
+            logger.info(f"[{i}/{len(pending)}] Generating {discipline_code}...")
+            results[discipline_code] = generate(discipline_code)
+
+    if incremental:
+        for discipline_code in pending:
+            file_name, input_hash = plan[discipline_code]
+            if results[discipline_code]:
+                manifest[file_name] = input_hash
+            else:
+                manifest.pop(file_name, None)
+        save_generation_manifest(manifest, manifest_file)
+
+    successful = sum(results.values())
     logger.info(f"Results: {successful}/{total} successful")
     return results
 
@@ -166,7 +317,8 @@ def handle_upload_discipline(
 
     try:
         # Завантажуємо дані з YAML
-        yaml_data = load_yaml_data(yaml_file)
+        bundle = load_program_bundle(yaml_file)
+        yaml_data = bundle.data
 
         # Отримуємо parent_id з метаданих
         wp_parent_id = yaml_data.get("metadata", {}).get("page_id")
@@ -178,10 +330,7 @@ def handle_upload_discipline(
             return False
 
         # Отримуємо всі дисципліни
-        all_disciplines = {
-            **yaml_data.get("disciplines", {}),
-            **yaml_data.get("elevative_disciplines", {}),
-        }
+        all_disciplines = bundle.all_disciplines
 
         # Перевіряємо чи існує дисципліна
         if discipline_code not in all_disciplines:
@@ -211,7 +360,14 @@ def handle_upload_discipline(
 
 
 def handle_upload_all_disciplines(
-    yaml_file: str | Path, wp_links_file: Path, client: WordPressClient
+    yaml_file: str | Path,
+    wp_links_file: Path,
+    client: WordPressClient,
+    concurrency: int = 1,
+    force: bool = False,
+    resume: bool = False,
+    adaptive: bool = False,
+    html_dir: Path | None = None,
 ) -> bool:
     """
     Handler для завантаження всіх дисциплін на WordPress.
@@ -220,12 +376,25 @@ def handle_upload_all_disciplines(
         yaml_file: шлях до YAML файлу з даними дисциплін
         parent_id: ID батьківської сторінки у WordPress
         client: інстанс WordPressClient
+        concurrency: кількість потоків завантаження
+        force: відправити всі сторінки, ігноруючи журнал завантажень
+        resume: продовжити перерваний запуск з журналу відновлення
+        adaptive: підбирати кількість одночасних запитів (AIMD) замість concurrency
+        html_dir: папка з HTML дисциплін, типово output_dir з AppConfig
 
     Повертає:
         True якщо хоча б одна сторінка завантажена, False інакше
     """
     try:
-        wp_data = upload_all_pages(yaml_file=yaml_file, client=client)
+        wp_data = upload_all_pages(
+            yaml_file=yaml_file,
+            client=client,
+            concurrency=concurrency,
+            force=force,
+            resume=resume,
+            adaptive=adaptive,
+            html_dir=html_dir,
+        )
         if wp_data:
             logger.info(f"Успішно завантажено {len(wp_data)} сторінок")
             save_wp_links_yaml(wp_data, wp_links_file)
@@ -238,22 +407,82 @@ def handle_upload_all_disciplines(
         return False
 
 
+def handle_pipeline_all_disciplines(
+    yaml_file: str | Path,
+    output_dir: Path,
+    wp_links_file: Path,
+    client: WordPressClient,
+    concurrency: int | None = None,
+    force: bool = False,
+    resume: bool = False,
+    adaptive: bool = False,
+    incremental: bool = False,
+) -> bool:
+    """
+    Handler для конвеєрної генерації та завантаження всіх дисциплін.
+
+    Рендеринг і завантаження виконуються одночасно: згенерований HTML
+    передається завантажувачам через чергу, без повторного читання з диску.
+    Без concurrency кількість завантажувачів береться з AppConfig, з adaptive -
+    з меж WordPressConfig. З incremental незмінені за маніфестом сторінки
+    не рендеряться.
+
+    Повертає:
+        True якщо хоча б одна сторінка завантажена, False інакше
+    """
+    try:
+        start = time.perf_counter()
+        wp_data = pipeline_upload_all_pages(
+            yaml_file=Path(yaml_file),
+            output_dir=output_dir,
+            client=client,
+            workers=concurrency or AppConfig().pipeline_upload_workers,
+            force=force,
+            resume=resume,
+            adaptive=adaptive,
+            incremental=incremental,
+        )
+        if wp_data and wp_data["links"]:
+            elapsed = time.perf_counter() - start
+            logger.info(
+                f"Успішно завантажено {len(wp_data['links'])} сторінок "
+                f"за {elapsed:.1f} с"
+            )
+            save_wp_links_yaml(wp_data, wp_links_file)
+            return True
+        else:
+            logger.warning("Жодної сторінки не було завантажено")
+            return False
+    except Exception as e:
+        logger.error(f"Помилка під час конвеєрного завантаження: {e}")
+        return False
+
+
 # ==================================================================================
 # Handler для створення індексу
 # ==================================================================================
 
 
 def handle_generate_index(
-    yaml_file: str | Path, output_file: str = "index.html"
+    yaml_file: str | Path,
+    output_file: str = "index.html",
+    wp_links: bool = False,
+    stream: bool = False,
 ) -> bool:
-    """CLI хендлер для генерації індексної сторінки зі списком дисциплін"""
+    """
+    CLI хендлер для генерації індексної сторінки зі списком дисциплін.
+
+    З wp_links сторінки дисциплін одразу посилаються на WordPress,
+    stream пише HTML у файл фрагментами.
+    """
 
     logger.info(f"📄 Generating index page from: {yaml_file}")
     logger.info(f"📁 Output: {output_file}")
 
     try:
         # Генеруємо індексну сторінку
-        generate_index_page(str(yaml_file), str(output_file))
+        links = load_link_resolver(yaml_file) if wp_links else None
+        generate_index_page(str(yaml_file), str(output_file), links, stream)
         logger.debug("Index page generated successfully!")
         return True
 
@@ -309,16 +538,17 @@ def handle_upload_index(
 # ==================================================================================
 
 def handle_generate_syllabus(
-    yaml_file: str | Path, output_file: str = "syllabus.html"
+    yaml_file: str | Path, output_file: str = "syllabus.html", wp_links: bool = False
 ) -> bool:
-    """CLI хендлер для генерації сторінки силабусів"""
+    """CLI хендлер для генерації сторінки силабусів; wp_links - як в індексі"""
 
     logger.info(f"📄 Generating syllabus page from: {yaml_file}")
     logger.info(f"📁 Output: {output_file}")
 
     try:
         # Генеруємо сторінку силабусів
-        generate_syllabus_page(str(yaml_file), str(output_file))
+        links = load_link_resolver(yaml_file) if wp_links else None
+        generate_syllabus_page(str(yaml_file), str(output_file), links)
         logger.debug("Syllabus page generated successfully!")
         return True
 
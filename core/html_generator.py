@@ -1,18 +1,25 @@
 # import webbrowser
+import hashlib
+import json
+from collections.abc import Iterable
+from dataclasses import asdict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from core.config import AppConfig
-from core.data_manipulation import (
-    get_mapped_competencies,
-    get_mapped_program_results,
-    load_discipline_data,
-    prepare_disciplines_with_totals,
+from core.data_manipulation import load_discipline_data, load_program_bundle
+from core.file_utils import (
+    get_safe_filename,
+    load_generation_manifest,
+    load_yaml_data,
+    prune_generation_manifest,
+    save_html_file,
 )
-from core.file_utils import get_safe_filename, load_yaml_data, save_html_file
+from core.incidence_matrix import build_incidence_matrix
+from core.link_resolver import LinkResolver
 from core.logging_config import get_logger
-from core.render_html import render_template
-from core.validators import validate_yaml_schema
+from core.render_html import render_template, render_template_to_file
 
 logger = get_logger(__name__)
 
@@ -23,16 +30,37 @@ def generate_html_report(
     yaml_file: str,
     output_filename: str | None = None,
     template_filename: str = "report_template.html",
+    stream: bool = False,
 ) -> None:
-    """Генеррує звітні таблиці по компетентностям та програмним результатам навчання"""
-    config = load_yaml_data(yaml_file)
+    """
+    Генеррує звітні таблиці по компетентностям та програмним результатам навчання
+
+    stream=True рендерить шаблон фрагментами прямо у файл (з атомарною заміною),
+    тож пам'ять не залежить від розміру звіту.
+    """
+    bundle = load_program_bundle(yaml_file)
+    config = bundle.data
+    catalog = bundle.catalog
 
     disciplines = config["disciplines"]
     competencies = config["competencies"]
     program_results = config["program_results"]
     mappings = config.get("mappings", {})
     metadata = config.get("metadata", {})
-    unfilled_disciplines = [code for code in disciplines if code not in mappings]
+    unfilled_codes = [code for code in disciplines if not catalog.is_mapped(code)]
+    # Незаповнені дисципліни звіт показує так, як вони записані в YAML програми
+    unfilled_disciplines = {}
+    if unfilled_codes:
+        raw_disciplines = (load_yaml_data(Path(yaml_file)) or {})["disciplines"]
+        unfilled_disciplines = {code: raw_disciplines[code] for code in unfilled_codes}
+
+    # Комірки матриць рахуються тут за індексами каталогу, шаблон лише виводить
+    competency_matrix = build_incidence_matrix(
+        competencies, disciplines, catalog.competencies_by_code
+    ).to_report(competencies)
+    program_result_matrix = build_incidence_matrix(
+        program_results, disciplines, catalog.program_results_by_code
+    ).to_report(program_results)
 
     context = {
         "metadata": metadata,
@@ -40,16 +68,23 @@ def generate_html_report(
         "competencies": competencies,
         "program_results": program_results,
         "mappings": mappings,
+        "competency_matrix": competency_matrix,
+        "program_result_matrix": program_result_matrix,
         "unfilled_disciplines": unfilled_disciplines,
         "generated_at": datetime.now().strftime("%d.%m.%Y о %H:%M"),
     }
 
-    # Генеруємо HTML контент
-    html_content = render_template(template_filename, context)
+    output_path = Path(output_filename)
+    output_path = output_path.with_name(get_safe_filename(output_path.name))
 
-    # Зберігаємо HTML файл
-    output_filename = get_safe_filename(output_filename)
-    save_html_file(html_content, output_filename)
+    if stream:
+        render_template_to_file(template_filename, context, output_path)
+    else:
+        # Генеруємо HTML контент
+        html_content = render_template(template_filename, context)
+
+        # Зберігаємо HTML файл
+        save_html_file(html_content, output_path)
 
     # webbrowser.open(f"file://{Path(output_filename).absolute()}")
     # logger.info(f"📊 HTML звіт відкрито в браузері: {output_filename}")
@@ -75,58 +110,37 @@ def get_control_description(control_abbr: str, education_control: dict) -> str:
     return control_abbr
 
 
-def generate_discipline_page(
-    yaml_file: str,
-    discipline_code: str,
-    output_filename: str | None = None,
-    template_filename: str = "discipline_template.html",
-) -> bool:
-    """Генерує HTML-сторінку для конкретної дисципліни з використанням конфігурації"""
+def build_discipline_context(
+    yaml_file: str | Path, discipline_code: str
+) -> dict | None:
+    """Формує контекст шаблону сторінки дисципліни; None якщо дисципліни немає"""
 
     # Використовуємо load_discipline_data для завантаження даних
     data, discipline = load_discipline_data(yaml_file, discipline_code)
 
-    education_control = load_yaml_data(config.glossary_yaml)
-
     if data is None or discipline is None:
         logger.debug("Failed to load discipline data")
-        return False
+        return None
+
+    bundle = load_program_bundle(yaml_file)
+    education_control = bundle.glossary
 
     # Отримуємо метадані з завантажених даних
     metadata = data.get("metadata", {})
 
-    # Отримуємо всі дисципліни для lookup
-    all_disciplines = data.get("disciplines", {})
-
-    # Створюємо два словники для lookup
-    disciplines_by_id = {}
-    disciplines_by_code = {}
-
-    for disc_code, disc_data in all_disciplines.items():
-        # По коду дисципліни (ЗО 06, тощо)
-        disciplines_by_code[disc_code] = disc_data
-
-        # По discipline_id (mechanics, elmag, тощо)
-        disc_id = disc_data.get("discipline_id")
-        if disc_id:
-            disciplines_by_id[disc_id] = disc_data
+    # Індекси для lookup побудовані один раз на програму
+    catalog = bundle.catalog
 
     # Отримуємо компетентності та результати навчальної програми
-    general_comps, professional_comps = get_mapped_competencies(
-        discipline_code, data.get("mappings", {}), data.get("competencies", {})
-    )
-    program_results = get_mapped_program_results(
-        discipline_code,
-        data.get("mappings", {}),
-        data.get("program_results", {}),
-    )
+    general_comps, professional_comps = catalog.mapped_competencies(discipline_code)
+    program_results = catalog.mapped_program_results(discipline_code)
 
     # Формуємо контекст для шаблону
-    context = {
+    return {
         "discipline_code": discipline_code,
         "discipline": discipline,
-        "disciplines_by_id": disciplines_by_id,
-        "disciplines_by_code": disciplines_by_code,
+        "disciplines_by_id": catalog.disciplines_by_id,
+        "disciplines_by_code": catalog.disciplines_by_code,
         "metadata": metadata,
         "general_competencies": general_comps,
         "professional_competencies": professional_comps,
@@ -137,36 +151,141 @@ def generate_discipline_page(
         ),
     }
 
+
+@lru_cache(maxsize=None)
+def _template_source_hash(template_filename: str, mtime_ns: int) -> str:
+    source = (config.template_dir / template_filename).read_bytes()
+    return hashlib.sha256(source).hexdigest()
+
+
+def get_discipline_input_hash(
+    yaml_file: str | Path,
+    discipline_code: str,
+    template_filename: str = "discipline_template.html",
+) -> str | None:
+    """
+    Хеш усіх вхідних даних сторінки дисципліни.
+
+    Враховує саму дисципліну (з викладачем і змістом курсу), глосарій,
+    відповідні компетентності та ПРН, назви пре-/постреквізитів, метадані
+    програми та вихідний код шаблону.
+    """
+    bundle = load_program_bundle(yaml_file)
+    discipline = bundle.all_disciplines.get(discipline_code)
+    if discipline is None:
+        return None
+
+    catalog = bundle.catalog
+    requisites = {}
+    for ref in discipline.prerequisites + discipline.postrequisites:
+        linked = catalog.disciplines_by_id.get(ref) or catalog.disciplines_by_code.get(
+            ref
+        )
+        requisites[ref] = linked.name if linked else None
+
+    template_path = config.template_dir / template_filename
+    inputs = {
+        "discipline": asdict(discipline),
+        "glossary": bundle.glossary,
+        "competencies": catalog.mapped_competencies(discipline_code),
+        "program_results": catalog.mapped_program_results(discipline_code),
+        "requisites": requisites,
+        "metadata": bundle.metadata,
+        "template": _template_source_hash(
+            template_filename, template_path.stat().st_mtime_ns
+        ),
+    }
+    payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def render_discipline_page(
+    yaml_file: str | Path,
+    discipline_code: str,
+    template_filename: str = "discipline_template.html",
+) -> str | None:
+    """Рендерить HTML сторінки дисципліни в пам'ять; None якщо дисципліни немає"""
+    context = build_discipline_context(yaml_file, discipline_code)
+    if context is None:
+        return None
+    return render_template(template_filename, context)
+
+
+def get_discipline_output_path(output_filename: str | Path) -> Path:
+    """Шлях до HTML файлу дисципліни (безпечним робимо лише ім'я, а не весь шлях)"""
+    output_path = Path(output_filename)
+    return output_path.with_name(get_safe_filename(output_path.name))
+
+
+def load_incremental_manifest(output_dir: Path, codes: Iterable[str]) -> dict[str, str]:
+    """
+    Маніфест генерації з output_dir. Сторінки дисциплін, яких уже немає серед
+    codes, видаляються з диску та з маніфесту.
+    """
+    manifest = load_generation_manifest(output_dir / config.generation_manifest)
+    file_names = {
+        get_discipline_output_path(output_dir / f"{code}.html").name for code in codes
+    }
+    stale = prune_generation_manifest(manifest, output_dir, file_names)
+    if stale:
+        logger.info(f"Removed {len(stale)} stale pages")
+    return manifest
+
+
+def generate_discipline_page(
+    yaml_file: str,
+    discipline_code: str,
+    output_filename: str | None = None,
+    template_filename: str = "discipline_template.html",
+) -> bool:
+    """Генерує HTML-сторінку для конкретної дисципліни з використанням конфігурації"""
+
     # Генеруємо HTML контент
-    html_content = render_template(template_filename, context)
+    html_content = render_discipline_page(yaml_file, discipline_code, template_filename)
+    if html_content is None:
+        return False
 
     # Зберігаємо HTML файл
-    output_filename = get_safe_filename(output_filename)
-    save_html_file(html_content, output_filename)
+    save_html_file(html_content, get_discipline_output_path(output_filename))
 
     logger.debug("Discipline page created")
     return True
 
 
 def generate_index_page(
-    yaml_file: str | Path, output_file: str | Path = "index.html"
+    yaml_file: str | Path,
+    output_file: str | Path = "index.html",
+    links: LinkResolver | None = None,
+    stream: bool = False,
 ) -> bool:
-    """Генерує індексну сторінку зі списком всіх дисциплін"""
-    try:
-        data = load_yaml_data(yaml_file)
-        validate_yaml_schema(data)
-
-        metadata = data.get("metadata", {})
-        disciplines = data.get("disciplines", {}) | data.get(
-            "elevative_disciplines", {}
-        )
-
-        disciplines = prepare_disciplines_with_totals(disciplines)
-
-        context = {"metadata": metadata, "disciplines": disciplines}
+    """
+    Генерує індексну сторінку зі списком всіх дисциплін.
 
-        html_content = render_template("index_template.html", context)
-        save_html_file(html_content, output_file)
+    links дає адреси сторінок дисциплін; без нього - локальні <code>.html.
+    stream - як у generate_html_report.
+    """
+    try:
+        bundle = load_program_bundle(yaml_file)
+
+        metadata = bundle.metadata
+        disciplines = bundle.all_disciplines
+        discipline_groups = {
+            prefix: [(code, disciplines[code]) for code in codes]
+            for prefix, codes in bundle.catalog.codes_by_group.items()
+        }
+
+        context = {
+            "metadata": metadata,
+            "disciplines": disciplines,
+            "discipline_groups": discipline_groups,
+            "discipline_url": links or LinkResolver(),
+        }
+
+        if stream:
+            render_template_to_file("index_template.html", context, output_file)
+        else:
+            html_content = render_template("index_template.html", context)
+            save_html_file(html_content, output_file)
 
         logger.debug("Index page created: %s", str(output_file))
         return True  # Успіх
@@ -177,21 +296,27 @@ def generate_index_page(
 
 
 def generate_syllabus_page(
-    yaml_file: str | Path, output_file: str | Path = "syllabus.html"
+    yaml_file: str | Path,
+    output_file: str | Path = "syllabus.html",
+    links: LinkResolver | None = None,
 ) -> bool:
-    """Генерує сторінку силабусу зі списком всіх дисциплін"""
+    """Генерує сторінку силабусу зі списком всіх дисциплін; links - як в індексі"""
     try:
-        data = load_yaml_data(yaml_file)
-        validate_yaml_schema(data)
-
-        metadata = data.get("metadata", {})
-        disciplines = data.get("disciplines", {}) | data.get(
-            "elevative_disciplines", {}
-        )
-
-        disciplines = prepare_disciplines_with_totals(disciplines)
-
-        context = {"metadata": metadata, "disciplines": disciplines}
+        bundle = load_program_bundle(yaml_file)
+
+        metadata = bundle.metadata
+        disciplines = bundle.all_disciplines
+        discipline_groups = {
+            prefix: [(code, disciplines[code]) for code in codes]
+            for prefix, codes in bundle.catalog.codes_by_group.items()
+        }
+
+        context = {
+            "metadata": metadata,
+            "disciplines": disciplines,
+            "discipline_groups": discipline_groups,
+            "discipline_url": links or LinkResolver(),
+        }
 
         html_content = render_template("syllabus_template.html", context)
         save_html_file(html_content, output_file)
@@ -0,0 +1,94 @@
+# core/incidence_matrix.py
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True, slots=True)
+class IncidenceMatrix:
+    """
+    Булева матриця відповідностей: рядки - компетентності або ПРН,
+    колонки - дисципліни. "+"/"" з'являються лише під час виводу.
+    """
+
+    rows: tuple[str, ...]
+    columns: tuple[str, ...]
+    cells: np.ndarray  # bool, (len(rows), len(columns))
+
+    @property
+    def row_counts(self) -> np.ndarray:
+        """Кількість дисциплін для кожного рядка"""
+        return self.cells.sum(axis=1)
+
+    @property
+    def column_counts(self) -> np.ndarray:
+        """Кількість рядків для кожної дисципліни"""
+        return self.cells.sum(axis=0)
+
+    def to_report(self, descriptions: Mapping[str, str]) -> "ReportMatrix":
+        """Рядкова модель для HTML звіту; descriptions - код рядка -> опис"""
+        return ReportMatrix(
+            rows=[
+                MatrixRow(code, descriptions.get(code, ""), cells)
+                for code, cells in zip(self.rows, self.cells.tolist())
+            ]
+        )
+
+    def to_frame(self, filled: str = "+", empty: str = "") -> pd.DataFrame:
+        """DataFrame з filled/empty замість True/False для запису в Excel"""
+        return pd.DataFrame(
+            np.where(self.cells, filled, empty).astype(object),
+            index=list(self.rows),
+            columns=list(self.columns),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MatrixRow:
+    code: str
+    description: str
+    cells: list[bool]
+
+
+@dataclass(frozen=True, slots=True)
+class ReportMatrix:
+    """
+    Матриця для шаблону звіту: рядки з готовими прапорцями комірок, щоб
+    шаблон лише ітерував і виводив.
+    """
+
+    rows: list[MatrixRow]
+
+
+def build_incidence_matrix(
+    rows: Iterable[str],
+    columns: Iterable[str],
+    links: Mapping[str, Iterable[str]],
+) -> IncidenceMatrix:
+    """
+    Будує матрицю з links: дисципліна -> коди рядків (напр. catalog.competencies_by_code).
+
+    Коди переводяться в індекси рядків за один прохід по колонках, np.fromiter
+    збирає їх у плаский масив, індекси колонок дає np.repeat за кількостями, а
+    всі комірки заповнюються одним fancy-indexed присвоєнням. Коди, яких немає
+    в rows або columns, ігноруються.
+    """
+    rows = tuple(rows)
+    columns = tuple(columns)
+    row_index = {code: i for i, code in enumerate(rows)}
+
+    row_ids = [
+        [row_index[code] for code in links.get(column, ()) if code in row_index]
+        for column in columns
+    ]
+    counts = np.fromiter(map(len, row_ids), dtype=np.intp, count=len(columns))
+    flat_row_ids = np.fromiter(
+        chain.from_iterable(row_ids), dtype=np.intp, count=int(counts.sum())
+    )
+
+    cells = np.zeros((len(rows), len(columns)), dtype=bool)
+    cells[flat_row_ids, np.repeat(np.arange(len(columns)), counts)] = True
+    return IncidenceMatrix(rows, columns, cells)
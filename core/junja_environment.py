@@ -1,4 +1,6 @@
-from jinja2 import Environment, FileSystemLoader
+from functools import lru_cache
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from core.config import AppConfig
 from core.exceptions import TemplateRenderError
@@ -6,15 +8,32 @@ from core.exceptions import TemplateRenderError
 config = AppConfig()
 
 
-def get_jinja_environment() -> Environment:
+def create_jinja_environment(use_bytecode_cache: bool = True) -> Environment:
     """Створює налаштоване Jinja2 Environment"""
     templates_dir = config.template_dir
     if not templates_dir.exists():
         raise TemplateRenderError(f"Templates directory not found: {templates_dir}")
 
+    bytecode_cache = None
+    if use_bytecode_cache:
+        # Скомпільовані шаблони між запусками зберігаються на диску
+        bytecode_dir = config.cache_dir / "jinja"
+        bytecode_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(bytecode_dir))
+
     return Environment(
         loader=FileSystemLoader(str(templates_dir)),
         autoescape=True,
         trim_blocks=True,
         lstrip_blocks=True,
+        cache_size=config.template_cache_size,
+        # Шаблон перезавантажується лише якщо змінився його mtime
+        auto_reload=True,
+        bytecode_cache=bytecode_cache,
     )
+
+
+@lru_cache(maxsize=1)
+def get_jinja_environment() -> Environment:
+    """Повертає спільне на весь процес Jinja2 Environment"""
+    return create_jinja_environment()
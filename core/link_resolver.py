@@ -0,0 +1,119 @@
+# core/link_resolver.py
+from pathlib import Path
+
+import yaml
+from slugify import slugify
+
+from core.config import AppConfig, WordPressConfig
+from core.data_manipulation import load_program_bundle
+from core.file_utils import (
+    get_inventory_cache_path,
+    get_safe_filename,
+    load_remote_inventory,
+)
+from core.logging_config import get_logger
+from core.models import Discipline
+
+logger = get_logger(__name__)
+
+config = AppConfig()
+
+
+class LinkResolver:
+    """
+    Адреси сторінок дисциплін для шаблонів: resolver(code) -> URL.
+
+    Без links (локальний перегляд) веде на <code>.html поруч з індексом.
+    З links - на сторінки WordPress, а дисципліни без сторінки отримують missing.
+    """
+
+    def __init__(self, links: dict[str, str] | None = None, missing: str = "#") -> None:
+        self.links = links
+        self.missing = missing
+
+    def __call__(self, discipline_code: str) -> str:
+        if self.links is None:
+            return f"{get_safe_filename(discipline_code)}.html"
+        return self.links.get(discipline_code, self.missing)
+
+
+def get_discipline_slug(
+    discipline_code: str, discipline_info: Discipline, programm_year: str
+) -> str:
+    """Slug сторінки дисципліни на WordPress"""
+    discipline_code_safe = get_safe_filename(discipline_code)
+    return slugify(f"{discipline_code_safe}: {discipline_info.name}-{programm_year}")
+
+
+def get_wp_links_path(yaml_file: str | Path) -> Path:
+    """Шлях до YAML з WordPress посиланнями програми"""
+    return config.wp_links_dir / f"wp_links_{Path(yaml_file).stem}.yaml"
+
+
+def load_wp_links(yaml_file: str | Path, wp_links_file: Path) -> dict | None:
+    """Завантажує WP посилання; None, якщо метадані не збігаються з YAML програми"""
+    wp_data = yaml.safe_load(wp_links_file.read_text(encoding="utf-8"))
+    metadata = load_program_bundle(yaml_file).metadata
+
+    # Перевірка збігу метаданих (рік і ступінь)
+    if (wp_data.get("year"), wp_data.get("degree")) != (
+        metadata.get("year"),
+        metadata.get("degree"),
+    ):
+        logger.error(
+            f"Метадані не збігаються: WP ({wp_data.get('year')}/{wp_data.get('degree')}) "
+            f"vs YAML ({metadata.get('year')}/{metadata.get('degree')})"
+        )
+        return None
+
+    return wp_data.get("links", {})
+
+
+def resolve_cached_links(
+    yaml_file: str | Path, api_url: str | None = None
+) -> dict[str, str]:
+    """
+    Посилання на сторінки дисциплін з кешу інвентаря, без запитів до WordPress.
+
+    Кеш використовується лише якщо його знято з того ж сайту: api_url
+    (типово з WordPressConfig) має збігатися з api_url інвентаря.
+    Дисципліни, яких у кеші немає, пропускаються.
+    """
+    bundle = load_program_bundle(yaml_file)
+    year = bundle.metadata.get("year")
+    inventory = load_remote_inventory(
+        get_inventory_cache_path(bundle.metadata["page_id"])
+    )
+    if inventory.get("api_url") != (api_url or WordPressConfig().api_url):
+        logger.debug("Кеш інвентаря знято з іншого WordPress, ігноруємо")
+        return {}
+
+    pages = inventory.get("pages", {})
+
+    links = {}
+    for discipline_code, discipline_info in bundle.all_disciplines.items():
+        page = pages.get(get_discipline_slug(discipline_code, discipline_info, year))
+        if page and page.get("link"):
+            links[discipline_code] = page["link"]
+    return links
+
+
+def load_link_resolver(
+    yaml_file: str | Path, api_url: str | None = None
+) -> LinkResolver:
+    """
+    LinkResolver з WordPress посиланнями програми.
+
+    Посилання беруться з wp_links_<program>.yaml, а без нього - з кешу
+    інвентаря сайту api_url. Якщо їх немає ніде, лишаються локальні посилання.
+    """
+    wp_links_file = get_wp_links_path(yaml_file)
+    if wp_links_file.exists():
+        links = load_wp_links(yaml_file, wp_links_file)
+    else:
+        links = resolve_cached_links(yaml_file, api_url)
+
+    if not links:
+        logger.warning("⚠️ WordPress посилань не знайдено, лишаємо локальні посилання")
+        return LinkResolver()
+    return LinkResolver(links)
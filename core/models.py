@@ -1,5 +1,7 @@
 # cor/models.py
 
+import sys
+from dataclasses import dataclass, field
 from typing import TypedDict
 
 from pydantic import BaseModel, field_validator
@@ -13,6 +15,155 @@ class DisciplineData(TypedDict):
     subdisciplines: dict[str, object] | None
 
 
+# ============================================================================
+# Компактні моделі дисциплін (__slots__, frozen) замість вкладених dict
+# ============================================================================
+
+
+def _intern(value: object) -> object:
+    """Інтернує рядки, що часто повторюються (форми контролю, коди)"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_all(values: list | None) -> tuple:
+    return tuple(_intern(value) for value in values or ())
+
+
+@dataclass(frozen=True, slots=True)
+class Lecturer:
+    full_name: str = ""
+    degree: str = ""
+    rank: str = ""
+    profile_url: str = ""
+    photo_url: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Lecturer":
+        return cls(
+            full_name=data.get("full_name", ""),
+            degree=_intern(data.get("degree", "")),
+            rank=_intern(data.get("rank", "")),
+            profile_url=data.get("profile_url", ""),
+            photo_url=data.get("photo_url", ""),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ContentSection:
+    title: str = ""
+    topics: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ContentSection":
+        return cls(title=data.get("title", ""), topics=tuple(data.get("topics") or ()))
+
+
+@dataclass(frozen=True, slots=True)
+class Subdiscipline:
+    name: str = ""
+    credits: float | None = None
+    control: str = ""
+    name_en: str = ""
+    syllabus_url: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Subdiscipline":
+        return cls(
+            name=data.get("name", ""),
+            credits=data.get("credits"),
+            control=_intern(data.get("control", "")),
+            name_en=data.get("name_en", ""),
+            syllabus_url=data.get("syllabus_url", ""),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Discipline:
+    """Дисципліна програми разом з викладачем та змістом з extra_data"""
+
+    code: str
+    name: str = ""
+    name_en: str = ""
+    credits: float | None = None
+    control: str = ""
+    controls: tuple[str, ...] = ()
+    type: str = ""
+    category: str = ""
+    discipline_id: str = ""
+    lecturer_id: str = ""
+    syllabus_url: str = ""
+    online_resources: str = ""
+    prerequisites: tuple[str, ...] = ()
+    postrequisites: tuple[str, ...] = ()
+    subdisciplines: dict[str, Subdiscipline] = field(default_factory=dict)
+    lecturer: Lecturer | None = None
+    description: str = ""
+    content: tuple[ContentSection, ...] = ()
+    outside_resources: str = ""
+
+    @property
+    def total_credits(self) -> float:
+        """Кредити дисципліни або сума кредитів її піддисциплін"""
+        if not self.subdisciplines:
+            return 0 if self.credits is None else self.credits
+        return sum(sub.credits or 0 for sub in self.subdisciplines.values())
+
+    @property
+    def all_controls(self) -> str:
+        """Форма контролю дисципліни або всі форми контролю піддисциплін"""
+        if not self.subdisciplines:
+            return self.control
+        controls = list(
+            {sub.control for sub in self.subdisciplines.values() if sub.control}
+        )
+        return ", ".join(controls)
+
+    @classmethod
+    def from_dict(
+        cls,
+        code: str,
+        data: dict,
+        lecturer: "Lecturer | dict | None" = None,
+        content: dict | None = None,
+    ) -> "Discipline":
+        """
+        Будує модель з YAML-словника дисципліни та довідників extra_data.
+
+        lecturer може бути вже готовою моделлю, спільною для всіх дисциплін
+        викладача.
+        """
+        if isinstance(lecturer, dict):
+            lecturer = Lecturer.from_dict(lecturer) if lecturer else None
+        content = content or {}
+        return cls(
+            code=_intern(code),
+            name=data.get("name", ""),
+            name_en=data.get("name_en", ""),
+            credits=data.get("credits"),
+            control=_intern(data.get("control", "")),
+            controls=_intern_all(data.get("controls")),
+            type=_intern(data.get("type", "")),
+            category=_intern(data.get("category", "")),
+            discipline_id=_intern(data.get("discipline_id", "")),
+            lecturer_id=_intern(data.get("lecturer_id", "")),
+            syllabus_url=data.get("syllabus_url", ""),
+            online_resources=data.get("online_resources", ""),
+            prerequisites=_intern_all(data.get("prerequisites")),
+            postrequisites=_intern_all(data.get("postrequisites")),
+            subdisciplines={
+                _intern(sub_code): Subdiscipline.from_dict(sub)
+                for sub_code, sub in (data.get("subdisciplines") or {}).items()
+            },
+            lecturer=lecturer,
+            description=content.get("description", ""),
+            content=tuple(
+                ContentSection.from_dict(section)
+                for section in content.get("sections") or ()
+            ),
+            outside_resources=content.get("outside_resources", ""),
+        )
+
+
 class UploadResult(BaseModel):
     success: bool
     link: str | None
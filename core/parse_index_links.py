@@ -1,9 +1,8 @@
 import re
 from pathlib import Path
 
-import yaml
-
 from core.config import AppConfig
+from core.link_resolver import get_wp_links_path, load_wp_links, resolve_cached_links
 from core.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -12,33 +11,31 @@ config = AppConfig()
 
 
 def parse_index_links(data_yaml: str | Path) -> bool:
-    """Заменяет локальные ссылки на дисциплины в index.html на WP ссылки."""
+    """
+    Заменяет локальные ссылки на дисциплины в index.html на WP ссылки.
+
+    Без файла wp_links ссылки берутся из кеша инвентаря WordPress, без сети.
+    """
 
     # Пути к index.html и YAML с WP ссылками
     index_file = config.output_dir / "index.html"
-    wp_links_file = Path("wp_links") / f"wp_links_{Path(data_yaml).stem}.yaml"
+    wp_links_file = get_wp_links_path(data_yaml)
 
     # Проверка существования файлов
-    if not index_file.exists() or not wp_links_file.exists():
-        logger.error(
-            f"Файл {'index.html' if not index_file.exists() else wp_links_file} не найден"
-        )
+    if not index_file.exists():
+        logger.error("Файл index.html не найден")
         return False
 
-    # Загружаем WP ссылки и основной YAML
-    wp_data = yaml.safe_load(wp_links_file.read_text(encoding="utf-8"))
-    meta_data = yaml.safe_load(Path(data_yaml).read_text(encoding="utf-8"))
-
-    # Проверка совпадения метаданных (год и степень)
-    if (wp_data.get("year"), wp_data.get("degree")) != (
-        meta_data.get("metadata", {}).get("year"),
-        meta_data.get("metadata", {}).get("degree"),
-    ):
-        logger.error(
-            f"Метаданные не совпадают: WP ({wp_data.get('year')}/{wp_data.get('degree')}) "
-            f"vs YAML ({meta_data.get('metadata', {}).get('year')}/{meta_data.get('metadata', {}).get('degree')})"
-        )
-        return False
+    if wp_links_file.exists():
+        links = load_wp_links(data_yaml, wp_links_file)
+        if links is None:
+            return False
+    else:
+        links = resolve_cached_links(data_yaml)
+        if not links:
+            logger.error(f"Файл {wp_links_file} не найден, кеш инвентаря пуст")
+            return False
+        logger.info(f"Ссылки взяты из кеша инвентаря WordPress: {len(links)}")
 
     # Чтение HTML и поиск всех ссылок на дисциплины по шаблону
     html = index_file.read_text(encoding="utf-8")
@@ -46,7 +43,7 @@ def parse_index_links(data_yaml: str | Path) -> bool:
 
     # Замена найденных href на соответствующие WP ссылки или "#" если нет соответствия
     html = pattern.sub(
-        lambda m: f'href="{wp_data.get("links", {}).get(m.group(1).replace("_", " ").strip(), "#")}"',
+        lambda m: f'href="{links.get(m.group(1).replace("_", " ").strip(), "#")}"',
         html,
     )
 
@@ -0,0 +1,157 @@
+# core/rate_limiter.py
+import threading
+import time
+
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class TokenBucket:
+    """
+    Потокобезпечний token bucket для обмеження частоти запитів.
+
+    Токени поповнюються зі швидкістю rate за секунду до capacity, кожен запит
+    забирає один токен. Якщо токенів немає, acquire() чекає на наступний.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate має бути додатним")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Забирає один токен, чекаючи за потреби. Повертає час очікування в секундах"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD-обмежувач кількості одночасних запитів.
+
+    Поки p95 затримки тримається біля базового рівня, ліміт зростає після
+    кожного вікна з window відповідей, у якому ліміт був вичерпаний: до
+    першого зменшення подвоюється (slow start), далі - на один.
+    На 429/5xx або p95 вище за latency_tolerance * базовий рівень ліміт
+    множиться на decrease_factor. Ліміт лишається в межах [min_limit, max_limit],
+    кожна зміна записується в trajectory.
+    """
+
+    def __init__(
+        self,
+        min_limit: int,
+        max_limit: int,
+        initial: int | None = None,
+        window: int = 10,
+        latency_tolerance: float = 1.5,
+        decrease_factor: float = 0.5,
+    ) -> None:
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("потрібно 1 <= min_limit <= max_limit")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = initial if initial is not None else min_limit
+        self.window = window
+        self.latency_tolerance = latency_tolerance
+        self.decrease_factor = decrease_factor
+        self.in_flight = 0
+        self.baseline: float | None = None
+        # (секунд від старту, ліміт, причина)
+        self.trajectory: list[tuple[float, int, str]] = [(0.0, self.limit, "старт")]
+        self._samples: list[float] = []
+        self._saturated = False
+        self._slow_start = True
+        # Відповідей після останнього зменшення: одна хвиля помилок - одне зменшення
+        self._since_decrease = self.limit
+        self._started = time.monotonic()
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """Чекає, поки кількість запитів у польоті менша за ліміт"""
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._saturated = True
+                self._condition.wait()
+            self.in_flight += 1
+            if self.in_flight >= self.limit:
+                self._saturated = True
+
+    def release(self, latency: float, overloaded: bool = False) -> None:
+        """
+        Звільняє місце та враховує результат запиту.
+
+        overloaded - сервер відповів 429/5xx (зокрема на повторах); затримка
+        такої відповіді в статистику не йде.
+        """
+        with self._condition:
+            self.in_flight -= 1
+            self._since_decrease += 1
+            if overloaded:
+                self._decrease("429/5xx")
+            else:
+                self._samples.append(latency)
+                if len(self._samples) >= self.window:
+                    self._end_window()
+            self._condition.notify_all()
+
+    def _end_window(self) -> None:
+        p95 = percentile(self._samples, 95)
+        self._samples.clear()
+        saturated, self._saturated = self._saturated, False
+
+        if self.baseline is None or p95 < self.baseline:
+            self.baseline = p95
+        if p95 > self.baseline * self.latency_tolerance:
+            reason = f"p95 {p95 * 1000:.0f} мс > {self.baseline * 1000:.0f} мс"
+            if self.limit == self.min_limit:
+                # Повільніше вже не буде: приймаємо нову норму затримки
+                self.baseline = p95
+            self._decrease(reason)
+        elif saturated and self.limit < self.max_limit:
+            limit = self.limit * 2 if self._slow_start else self.limit + 1
+            self._set_limit(limit, f"p95 {p95 * 1000:.0f} мс")
+
+    def _decrease(self, reason: str) -> None:
+        if self._since_decrease < self.limit:
+            return
+        self._samples.clear()
+        self._since_decrease = 0
+        self._slow_start = False
+        self._set_limit(int(self.limit * self.decrease_factor), reason)
+
+    def _set_limit(self, limit: int, reason: str) -> None:
+        limit = max(self.min_limit, min(self.max_limit, limit))
+        if limit == self.limit:
+            return
+        logger.info(f"Паралельність {self.limit} → {limit} ({reason})")
+        self.limit = limit
+        elapsed = time.monotonic() - self._started
+        self.trajectory.append((elapsed, limit, reason))
+
+    def summary(self) -> str:
+        path = " → ".join(str(limit) for _, limit, _ in self.trajectory)
+        peak = max(limit for _, limit, _ in self.trajectory)
+        return f"Паралельність: {path} (макс. {peak}, межі {self.min_limit}-{self.max_limit})"
+
+
+def percentile(values: list[float], p: int) -> float:
+    """p-й перцентиль методом найближчого рангу"""
+    ordered = sorted(values)
+    return ordered[max(0, -(-len(ordered) * p // 100) - 1)]
@@ -1,6 +1,20 @@
+import os
+import tempfile
+from pathlib import Path
+
 from core.exceptions import TemplateRenderError
 from core.junja_environment import get_jinja_environment
 
+# Скільки фрагментів generate() склеюється в один запис у файл
+STREAM_BUFFER_EVENTS = 256
+# Буфер файлу для потокового рендерингу, байт
+STREAM_FILE_BUFFER = 64 * 1024
+
+# umask процесу: NamedTemporaryFile створює файли з правами 0600, а HTML має
+# отримати звичайні права, як після open()
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 def render_template(template_file_name: str, context: dict) -> str:
     """Рендерить HTML-контент через Jinja2-шаблон"""
@@ -12,3 +26,38 @@ def render_template(template_file_name: str, context: dict) -> str:
         return template.render(context)
     except Exception as e:
         raise TemplateRenderError(f"Error rendering template {template_file_name}: {e}")
+
+
+def render_template_to_file(
+    template_file_name: str, context: dict, output_file: str | Path
+) -> None:
+    """
+    Рендерить шаблон фрагментами прямо у файл, не збираючи весь HTML у рядок.
+
+    Пише в унікальний тимчасовий файл поруч і атомарно перейменовує його після
+    завершення, тож output_file ніколи не буває записаним наполовину, а
+    паралельні записи одного файлу не заважають один одному.
+    """
+    output_path = Path(output_file)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        buffering=STREAM_FILE_BUFFER,
+        dir=output_path.parent,
+        prefix=f".{output_path.name}.",
+        suffix=".tmp",
+        delete=False,
+    )
+    tmp_path = Path(tmp_file.name)
+    try:
+        with tmp_file as f:
+            env = get_jinja_environment()
+            stream = env.get_template(template_file_name).stream(context)
+            stream.enable_buffering(STREAM_BUFFER_EVENTS)
+            stream.dump(f)
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, output_path)
+    except Exception as e:
+        tmp_path.unlink(missing_ok=True)
+        raise TemplateRenderError(f"Error rendering template {template_file_name}: {e}")
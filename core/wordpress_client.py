@@ -1,32 +1,278 @@
 # core/wordpress_pages.py
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 
-from core.config import WordPressConfig
+from core.config import AppConfig, WordPressConfig
+from core.file_utils import (
+    get_inventory_cache_path,
+    load_remote_inventory,
+    save_remote_inventory,
+)
+from core.rate_limiter import AdaptiveConcurrencyLimiter, TokenBucket
 
 config = WordPressConfig()
 
+# Статуси, на які WordPress/проксі відповідають при перевантаженні
+RETRY_STATUSES = (429, 502, 503, 504)
+
+# Статуси, з якими сервер відхиляє запит до його виконання: лише на них
+# безпечно повторювати POST (створення сторінки, /batch/v1). Після 502/504
+# чи обірваного читання сторінка могла вже зберегтися, і повтор створив би
+# копію зі slug-2, якої журнал і інвентар не бачать.
+POST_RETRY_STATUSES = (429, 503)
+
+# Максимум, який WordPress REST API дозволяє для per_page
+MAX_PER_PAGE = 100
+
+# Поля сторінки, потрібні для індексу дочірніх сторінок
+INVENTORY_FIELDS = ("id", "slug", "link", "modified", "parent", "date")
+
+# Простір імен сторінок та пакетний endpoint (WordPress 5.6+)
+REST_NAMESPACE = "/wp/v2"
+BATCH_ROUTE = "/batch/v1"
+MAX_BATCH_SIZE = 25
+
+
+class CountingRetry(Retry):
+    """Retry, що повідомляє про кожен виконаний повтор через on_retry"""
+
+    def __init__(
+        self,
+        *args: object,
+        on_retry: Callable[[], None] | None = None,
+        **kwargs: object,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.on_retry = on_retry
+
+    def new(self, **kwargs: object) -> "CountingRetry":
+        retry = super().new(**kwargs)
+        retry.on_retry = self.on_retry
+        return retry
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if method == "POST":
+            return status_code in POST_RETRY_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(self, *args: object, **kwargs: object) -> "CountingRetry":
+        retry = super().increment(*args, **kwargs)  # MaxRetryError, якщо вичерпано
+        if self.on_retry:
+            self.on_retry()
+        return retry
+
+
+def create_retry_policy(
+    max_retries: int,
+    backoff_factor: float,
+    on_retry: Callable[[], None] | None = None,
+) -> Retry:
+    """
+    Політика повторів з експоненційною затримкою та підтримкою Retry-After.
+
+    POST не входить до allowed_methods, тож після таймауту читання він не
+    повторюється; на статуси його повторює лише CountingRetry.is_retry і
+    тільки для POST_RETRY_STATUSES.
+    """
+    return CountingRetry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+        on_retry=on_retry,
+    )
+
 
 class WordPressClient:
     """Низькорівневий клієнт для WordPress REST API"""
 
-    def __init__(self, api_url: str, auth: HTTPBasicAuth, timeout: int = 30) -> None:
+    def __init__(
+        self,
+        api_url: str,
+        auth: HTTPBasicAuth,
+        timeout: int = config.timeout,
+        pool_size: int = config.pool_size,
+        max_retries: int = config.max_retries,
+        backoff_factor: float = config.backoff_factor,
+        requests_per_second: float | None = None,
+        inventory_ttl: int = config.inventory_ttl,
+        cache_dir: Path | None = None,
+    ) -> None:
         self.api_url = api_url
         self.auth = auth
         self.timeout = timeout
+        # None - без обмеження частоти запитів
+        self.rate_limiter = (
+            TokenBucket(requests_per_second) if requests_per_second else None
+        )
+        self.batch_url = self.api_url.removesuffix(REST_NAMESPACE) + BATCH_ROUTE
+        self._batch_supported: bool | None = None
+        # Вмикається на час завантаження через adaptive_concurrency()
+        self.concurrency_limiter: AdaptiveConcurrencyLimiter | None = None
+        self.retries = 0
+        self._retries_lock = threading.Lock()
+        self._local = threading.local()
+        # Кеш інвентаря дочірніх сторінок: parent_id -> стан з get_inventory()
+        self.inventory_ttl = inventory_ttl
+        self.cache_dir = cache_dir or AppConfig().cache_dir
+        self._inventories: dict[int, dict] = {}
+        self._inventory_lock = threading.Lock()
+        # ID сторінок, на оновлення яких сервер відповів 404
+        self.missing_pages: set[int] = set()
+
+        # Одна сесія на клієнт: keep-alive з'єднання перевикористовуються
+        # між запитами замість нового TLS handshake на кожен запит
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=create_retry_policy(
+                max_retries, backoff_factor, on_retry=self._count_retry
+            ),
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def _request(self, method: str, endpoint: str, **kwargs: dict) -> requests.Response:
         """Виконує HTTP запит"""
-        url = f"{self.api_url}/{endpoint}"
+        return self._send(method, f"{self.api_url}/{endpoint}", **kwargs)
+
+    def _send(self, method: str, url: str, **kwargs: dict) -> requests.Response:
+        """Виконує HTTP запит на повний URL"""
         kwargs.setdefault("auth", self.auth)
         kwargs.setdefault("timeout", self.timeout)
-        return requests.request(method, url, **kwargs)
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        limiter = self.concurrency_limiter
+        if limiter is None:
+            return self.session.request(method, url, **kwargs)
 
-    def get_page(self, page_id: int) -> dict | None:
-        """Отримує сторінку за ID"""
-        response = self._request("GET", f"pages/{page_id}")
+        limiter.acquire()
+        self._local.retried = False
+        start = time.monotonic()
+        overloaded = True
+        try:
+            response = self.session.request(method, url, **kwargs)
+            # Повтори відбуваються всередині urllib3, тож 429/5xx видно лише
+            # через _count_retry цього ж потоку
+            overloaded = self._local.retried or response.status_code in RETRY_STATUSES
+            return response
+        finally:
+            limiter.release(time.monotonic() - start, overloaded=overloaded)
+
+    def _count_retry(self) -> None:
+        self._local.retried = True
+        with self._retries_lock:
+            self.retries += 1
+
+    @contextmanager
+    def adaptive_concurrency(
+        self,
+        min_limit: int = config.min_concurrency,
+        max_limit: int = config.max_concurrency,
+    ) -> Iterator[AdaptiveConcurrencyLimiter]:
+        """
+        Обмежує кількість одночасних запитів AIMD-лімітом на час блоку.
+
+        Потоків завантаження має бути max_limit: зайві чекають у acquire().
+        """
+        limiter = AdaptiveConcurrencyLimiter(min_limit, max_limit)
+        self.concurrency_limiter = limiter
+        try:
+            yield limiter
+        finally:
+            self.concurrency_limiter = None
+
+    def connection_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Статистика перевикористання з'єднань по хостах.
+
+        Returns:
+            dict: host -> {"requests", "connections", "reused"}
+        """
+        stats = {}
+        for adapter in set(self.session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                host = f"{pool.scheme}://{pool.host}:{pool.port}"
+                host_stats = stats.setdefault(
+                    host, {"requests": 0, "connections": 0, "reused": 0}
+                )
+                host_stats["requests"] += pool.num_requests
+                host_stats["connections"] += pool.num_connections
+                host_stats["reused"] += pool.num_requests - pool.num_connections
+        return stats
+
+    def close(self) -> None:
+        """Закриває сесію та всі з'єднання пулу"""
+        self.session.close()
+
+    def get_page(
+        self, page_id: int, fields: Iterable[str] | None = None
+    ) -> dict | None:
+        """Отримує сторінку за ID; з fields - лише ці поля"""
+        params = {"_fields": ",".join(fields)} if fields else None
+        response = self._request("GET", f"pages/{page_id}", params=params)
         return response.json() if response.status_code == 200 else None
 
+    def iter_pages(
+        self,
+        fields: Iterable[str] = INVENTORY_FIELDS,
+        per_page: int = MAX_PER_PAGE,
+        **filters: object,
+    ) -> Iterator[dict]:
+        """
+        Ліниво перебирає сторінки, що відповідають filters (slug, parent, status...).
+
+        Відповідь обмежується полями fields через _fields, тож rendered content
+        не передається і не декодується. Наступна сторінка результатів
+        запитується лише коли споживач дочитав попередню, до X-WP-TotalPages.
+
+        Raises:
+            requests.HTTPError: якщо запит не вдався
+        """
+        params = {**filters, "per_page": per_page, "_fields": ",".join(fields)}
+        page_number = total_pages = 1
+        while page_number <= total_pages:
+            response = self._request(
+                "GET", "pages", params={**params, "page": page_number}
+            )
+            response.raise_for_status()
+
+            total_pages = int(response.headers.get("X-WP-TotalPages", 1))
+            yield from response.json()
+            page_number += 1
+
+    def find_page_id_by_slug(
+        self, slug: str, parent_id: int | None = None
+    ) -> int | None:
+        """Повертає ID першої сторінки з таким slug або None"""
+        filters = {"slug": slug}
+        if parent_id is not None:
+            filters["parent"] = parent_id
+        try:
+            page = next(self.iter_pages(fields=["id"], **filters), None)
+        except requests.HTTPError:
+            return None
+        return page["id"] if page else None
+
     # def get_page_by_slug(self, slug: str) -> dict | None:
     #     """Отримує сторінку за slug"""
     #     response = self._request("GET", "pages", params={"slug": slug})
@@ -50,19 +296,16 @@ class WordPressClient:
             pick_latest (bool): якщо True, беремо найновішу сторінку; інакше найстарішу
 
         Returns:
-            dict | None: знайдена сторінка або None
+            dict | None: знайдена сторінка (лише INVENTORY_FIELDS) або None
         """
-        response = self._request(
-            "GET", "pages", params={"slug": slug, "status": status}
-        )
-        if response.status_code != 200:
-            return None
-
-        pages = response.json()
-
-        # Фільтруємо по батьківській сторінці
+        filters = {"slug": slug, "status": status}
+        # Фільтруємо по батьківській сторінці на сервері
         if parent_id is not None:
-            pages = [p for p in pages if p.get("parent") == parent_id]
+            filters["parent"] = parent_id
+        try:
+            pages = list(self.iter_pages(**filters))
+        except requests.HTTPError:
+            return None
 
         if not pages:
             return None
@@ -72,12 +315,213 @@ class WordPressClient:
 
         return pages[0]
 
+    def list_children(
+        self,
+        parent_id: int,
+        status: str = "publish",
+        pick_latest: bool = True,
+    ) -> dict[str, dict] | None:
+        """
+        Отримує всі дочірні сторінки parent_id як індекс slug -> сторінка.
+
+        Сторінки запитуються через iter_pages лише з полями INVENTORY_FIELDS.
+        При дублікатах slug діє те саме правило, що й у get_page_by_slug.
+
+        Returns:
+            dict | None: індекс сторінок або None, якщо запит не вдався
+        """
+        pages_by_slug: dict[str, list[dict]] = defaultdict(list)
+        try:
+            for page in self.iter_pages(parent=parent_id, status=status):
+                pages_by_slug[page["slug"]].append(page)
+        except requests.HTTPError:
+            return None
+
+        choose = max if pick_latest else min
+        return {
+            slug: choose(pages, key=lambda p: p.get("date"))
+            for slug, pages in pages_by_slug.items()
+        }
+
+    def get_inventory(
+        self, parent_id: int, refresh: bool = False
+    ) -> dict[str, dict] | None:
+        """
+        Індекс дочірніх сторінок parent_id, як у list_children, з кешем на диску.
+
+        Кеш, молодший за inventory_ttl, повертається без жодного запиту.
+        Старіший доповнюється лише сторінками з modified_after останньої
+        синхронізації. Без кешу або з refresh=True індекс завантажується
+        повністю: видалення та зняття з публікації видно лише так.
+        Сторінки, записані клієнтом, одразу потрапляють в індекс.
+
+        Returns:
+            dict | None: індекс сторінок або None, якщо запит не вдався
+        """
+        cache_file = get_inventory_cache_path(parent_id, self.cache_dir)
+        inventory = {} if refresh else load_remote_inventory(cache_file)
+        if inventory.get("api_url") != self.api_url:
+            inventory = {}
+
+        age = time.time() - inventory.get("synced_at", 0)
+        if not inventory or age >= self.inventory_ttl:
+            synced_at = time.time()
+            synced = self._sync_inventory(parent_id, inventory)
+            if synced is None:
+                return None
+            pages, watermark = synced
+            inventory = {
+                "api_url": self.api_url,
+                "synced_at": synced_at,
+                "watermark": watermark,
+                "pages": pages,
+            }
+            save_remote_inventory(inventory, cache_file)
+
+        with self._inventory_lock:
+            self._inventories[parent_id] = inventory
+        return inventory["pages"]
+
+    def _sync_inventory(
+        self, parent_id: int, inventory: dict
+    ) -> tuple[dict[str, dict], str | None] | None:
+        """Оновлює сторінки інвентаря з сервера; повертає (pages, watermark)"""
+        watermark = inventory.get("watermark")
+        if not watermark:
+            pages = self.list_children(parent_id)
+            if pages is None:
+                return None
+            return pages, max(
+                (p.get("modified") or "" for p in pages.values()), default=None
+            )
+
+        pages = dict(inventory["pages"])
+        # Запас у секунду: modified_after строгий, а modified - з точністю до секунди
+        since = datetime.fromisoformat(watermark) - timedelta(seconds=1)
+        try:
+            for page in self.iter_pages(
+                parent=parent_id, status="publish", modified_after=since.isoformat()
+            ):
+                current = pages.get(page["slug"])
+                # При дублікатах slug, як і в list_children, перемагає найновіша
+                if (
+                    current is None
+                    or current.get("id") == page["id"]
+                    or page.get("date", "") >= current.get("date", "")
+                ):
+                    pages[page["slug"]] = page
+                watermark = max(watermark, page.get("modified") or "")
+        except requests.HTTPError:
+            return None
+        return pages, watermark
+
+    def _remember_page(self, page: dict | None) -> dict | None:
+        """Записує щойно збережену сторінку в завантажений інвентар її батька"""
+        if page:
+            with self._inventory_lock:
+                inventory = self._inventories.get(page.get("parent"))
+                if inventory is not None and page.get("slug"):
+                    inventory["pages"][page["slug"]] = {
+                        key: page[key] for key in INVENTORY_FIELDS if key in page
+                    }
+        return page
+
+    def _forget_page(self, page_id: int) -> None:
+        """Прибирає з інвентарів сторінку, видалену на сервері"""
+        with self._inventory_lock:
+            self.missing_pages.add(page_id)
+            for inventory in self._inventories.values():
+                pages = inventory["pages"]
+                for slug in [s for s, p in pages.items() if p.get("id") == page_id]:
+                    del pages[slug]
+
+    def save_inventory(self, parent_id: int) -> None:
+        """Зберігає на диск інвентар parent_id разом із записаними сторінками"""
+        with self._inventory_lock:
+            inventory = self._inventories.get(parent_id)
+            if inventory is not None:
+                save_remote_inventory(
+                    inventory, get_inventory_cache_path(parent_id, self.cache_dir)
+                )
+
     def create_page(self, data: dict) -> dict | None:
         """Створює нову сторінку"""
         response = self._request("POST", "pages", json=data)
-        return response.json() if response.status_code == 201 else None
+        if response.status_code != 201:
+            return None
+        return self._remember_page(response.json())
 
     def update_page(self, page_id: int, data: dict) -> dict | None:
         """Оновлює сторінку за ID"""
         response = self._request("POST", f"pages/{page_id}", json=data)
-        return response.json() if response.status_code == 200 else None
+        if response.status_code == 404:
+            self._forget_page(page_id)
+        if response.status_code != 200:
+            return None
+        return self._remember_page(response.json())
+
+    def supports_batch(self) -> bool:
+        """
+        Чи дозволяє сервер пакетні запити до сторінок.
+
+        WordPress 5.6+ позначає такі маршрути як allow_batch у відповіді на
+        OPTIONS; результат перевірки кешується на час життя клієнта.
+        """
+        if self._batch_supported is None:
+            try:
+                response = self._request("OPTIONS", "pages")
+                allow_batch = (
+                    response.json().get("allow_batch", {})
+                    if response.status_code == 200
+                    else {}
+                )
+                self._batch_supported = bool(allow_batch.get("v1"))
+            except (requests.RequestException, ValueError, AttributeError):
+                self._batch_supported = False
+        return self._batch_supported
+
+    def _batch(self, sub_requests: list[dict]) -> list[dict | None]:
+        """
+        Виконує запити пакетами по MAX_BATCH_SIZE через /batch/v1.
+
+        Returns:
+            list: тіло відповіді для кожного успішного запиту або None
+        """
+        results: list[dict | None] = []
+        for start in range(0, len(sub_requests), MAX_BATCH_SIZE):
+            chunk = sub_requests[start : start + MAX_BATCH_SIZE]
+            response = self._send("POST", self.batch_url, json={"requests": chunk})
+            if response.status_code not in (200, 207):
+                results.extend([None] * len(chunk))
+                continue
+
+            sub_responses = response.json().get("responses", [])
+            for i in range(len(chunk)):
+                sub_response = sub_responses[i] if i < len(sub_responses) else {}
+                ok = sub_response.get("status") in (200, 201)
+                results.append(
+                    self._remember_page(sub_response.get("body")) if ok else None
+                )
+        return results
+
+    def batch_create_pages(self, pages: list[dict]) -> list[dict | None]:
+        """Створює сторінки пакетами; результат у тому ж порядку, що й pages"""
+        return self._batch(
+            [
+                {"method": "POST", "path": f"{REST_NAMESPACE}/pages", "body": data}
+                for data in pages
+            ]
+        )
+
+    def batch_update_pages(self, updates: list[tuple[int, dict]]) -> list[dict | None]:
+        """Оновлює сторінки (page_id, data) пакетами; результат у тому ж порядку"""
+        return self._batch(
+            [
+                {
+                    "method": "POST",
+                    "path": f"{REST_NAMESPACE}/pages/{page_id}",
+                    "body": data,
+                }
+                for page_id, data in updates
+            ]
+        )
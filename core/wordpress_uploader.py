@@ -1,12 +1,33 @@
 # core/wordpress_uploader.py
+import hashlib
+import queue
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
 
-from slugify import slugify
-
 from core.config import AppConfig
-from core.file_utils import get_safe_filename, load_yaml_data
+from core.data_manipulation import load_program_bundle
+from core.file_utils import (
+    append_jsonl_record,
+    get_safe_filename,
+    load_jsonl_records,
+    load_upload_ledger,
+    save_generation_manifest,
+    save_html_file,
+    save_upload_ledger,
+)
+from core.html_generator import (
+    get_discipline_input_hash,
+    get_discipline_output_path,
+    load_incremental_manifest,
+    render_discipline_page,
+)
+from core.link_resolver import get_discipline_slug
 from core.logging_config import ColorFormatter, get_logger
-from core.models import WordPressPage
+from core.models import Discipline, WordPressPage
 from core.wordpress_client import WordPressClient
 
 logger = get_logger(__name__)
@@ -19,24 +40,196 @@ link_logger = get_logger(
 config = AppConfig()
 
 
-def upload_discipline_page(
+class UploadLedger:
+    """
+    Журнал завантажень: що саме і коли вже відправлено на WordPress.
+
+    Для кожної дисципліни зберігає id, slug, title, parent, хеш відправленого
+    HTML та серверний modified. Сторінка, що не змінилась, не відправляється.
+
+    З journal_file кожна завершена сторінка одразу дописується в JSONL-журнал
+    відновлення. Після падіння запуск з resume=True читає з нього завершені
+    сторінки (resumed); сторінка з тим самим хешем не завантажується повторно.
+    Запуск, що дійшов до кінця, закриває журнал (finish_journal).
+    """
+
+    def __init__(
+        self,
+        ledger_file: Path,
+        force: bool = False,
+        journal_file: Path | None = None,
+        resume: bool = False,
+    ) -> None:
+        self.ledger_file = ledger_file
+        self.force = force
+        self.journal_file = journal_file
+        self.entries = load_upload_ledger(ledger_file)
+        self.resumed: dict[str, dict] = {}
+        # Посилання на сторінки, завершені цим запуском або відновлені з журналу
+        self.links: dict[str, str] = {}
+        self.sent = self.skipped = self.restored = 0
+        self.bytes_sent = self.bytes_saved = 0
+        self._lock = threading.Lock()
+
+        if journal_file is not None:
+            if resume:
+                for record in load_jsonl_records(journal_file):
+                    code = record.pop("code")
+                    self.resumed[code] = record
+                self.entries.update(self.resumed)
+            else:
+                # Новий запуск - новий журнал
+                journal_file.unlink(missing_ok=True)
+
+    def find_unchanged(
+        self,
+        discipline_code: str,
+        state: dict,
+        existing_pages: dict[str, dict] | None = None,
+    ) -> dict | None:
+        """
+        Повертає запис журналу, якщо сторінку можна не відправляти.
+
+        Якщо є індекс existing_pages, сторінка на сервері теж має збігатися
+        (той самий id і modified), інакше її змінили або видалили вручну.
+        """
+        entry = self.entries.get(discipline_code)
+        if self.force or not _matches_state(entry, state):
+            return None
+        if existing_pages is not None:
+            remote = existing_pages.get(state["slug"])
+            if (
+                not remote
+                or remote.get("id") != entry.get("id")
+                or remote.get("modified") != entry.get("modified")
+            ):
+                return None
+        return entry
+
+    def find_resumed(self, discipline_code: str, state: dict) -> dict | None:
+        """
+        Запис журналу відновлення, якщо перерваний запуск відправив саме цей стан.
+
+        Сторінку, HTML якої змінився після падіння, треба відправити знову.
+        """
+        record = self.resumed.get(discipline_code)
+        return record if _matches_state(record, state) else None
+
+    def skip_if_done(
+        self,
+        discipline_code: str,
+        page: dict,
+        existing_pages: dict[str, dict] | None = None,
+    ) -> bool:
+        """
+        Відмічає сторінку завершеною, якщо її не треба відправляти: вона є в
+        журналі відновлення з тим самим хешем або не змінилась з минулого разу.
+        """
+        record = self.find_resumed(discipline_code, page["state"])
+        if record:
+            with self._lock:
+                self.links[discipline_code] = record["link"]
+                self.restored += 1
+            logger.debug(f"Відновлено з журналу: {page['slug']}")
+            return True
+
+        entry = self.find_unchanged(discipline_code, page["state"], existing_pages)
+        if entry:
+            self.record_skipped(discipline_code, entry, page["size"])
+            logger.info(f"⏭️ Без змін, пропускаємо: {page['slug']}")
+            return True
+        return False
+
+    def record_sent(
+        self, discipline_code: str, state: dict, result: dict, size: int
+    ) -> None:
+        entry = {
+            **state,
+            "id": result.get("id"),
+            "link": result.get("link"),
+            "modified": result.get("modified"),
+        }
+        with self._lock:
+            self.entries[discipline_code] = entry
+            self.links[discipline_code] = entry["link"]
+            self.sent += 1
+            self.bytes_sent += size
+            self._append_journal(discipline_code, entry)
+
+    def record_skipped(self, discipline_code: str, entry: dict, size: int) -> None:
+        with self._lock:
+            self.links[discipline_code] = entry["link"]
+            self.skipped += 1
+            self.bytes_saved += size
+            self._append_journal(discipline_code, entry)
+
+    def _append_journal(self, discipline_code: str, entry: dict) -> None:
+        if self.journal_file is not None:
+            append_jsonl_record({"code": discipline_code, **entry}, self.journal_file)
+
+    def ordered_links(self, codes: Iterable[str]) -> dict[str, str]:
+        """Посилання завершених сторінок у порядку codes"""
+        return {code: self.links[code] for code in codes if code in self.links}
+
+    def save(self) -> None:
+        save_upload_ledger(self.entries, self.ledger_file)
+
+    def finish_journal(self) -> None:
+        """Запуск дійшов до кінця: відновлювати більше нічого"""
+        if self.journal_file is not None:
+            self.journal_file.unlink(missing_ok=True)
+
+    def summary(self) -> str:
+        summary = (
+            f"Відправлено: {self.sent} ({self.bytes_sent / 1024:.0f} КіБ), "
+            f"пропущено без змін: {self.skipped} "
+            f"(заощаджено {self.bytes_saved / 1024:.0f} КіБ)"
+        )
+        if self.restored:
+            summary += f", відновлено з журналу: {self.restored}"
+        return summary
+
+
+def _matches_state(entry: dict | None, state: dict) -> bool:
+    """Запис журналу описує саме цей стан сторінки (хеш, title, slug, parent)"""
+    return bool(entry) and all(entry.get(key) == value for key, value in state.items())
+
+
+def get_upload_ledger_path(yaml_file: Path) -> Path:
+    """Шлях до журналу завантажень програми: wp_links/.upload_state_<program>.json"""
+    return config.wp_links_dir / f".upload_state_{Path(yaml_file).stem}.json"
+
+
+def get_upload_journal_path(yaml_file: Path) -> Path:
+    """Шлях до журналу відновлення: wp_links/.upload_journal_<program>.jsonl"""
+    return config.wp_links_dir / f".upload_journal_{Path(yaml_file).stem}.jsonl"
+
+
+def prepare_discipline_page(
     discipline_code: str,
-    discipline_info: dict,
+    discipline_info: Discipline,
     programm_year: str,
     parent_id: int,
-    client: WordPressClient,
-) -> WordPressPage | None:
-    """Завантажує сторінку дисципліни на WordPress"""
-    try:
-        # Формуємо title та slug
-        discipline_code_safe = get_safe_filename(discipline_code)
-        title = f"{discipline_code}: {discipline_info['name']}"
-        slug = slugify(
-            f"{discipline_code_safe}: {discipline_info['name']}-{programm_year}"
-        )
-
+    html_content: str | None = None,
+    html_dir: Path | None = None,
+) -> dict | None:
+    """
+    Готує дані сторінки дисципліни для WordPress.
+
+    Якщо html_content не передано, HTML читається з html_dir (типово
+    config.output_dir).
+
+    Returns:
+        dict | None: {"slug", "post_data", "state", "size"} або None, якщо HTML немає
+    """
+    # Формуємо title та slug
+    discipline_code_safe = get_safe_filename(discipline_code)
+    title = f"{discipline_code}: {discipline_info.name}"
+    slug = get_discipline_slug(discipline_code, discipline_info, programm_year)
+
+    if html_content is None:
         # Шлях до HTML файлу
-        html_file = config.output_dir / f"{discipline_code_safe}.html"
+        html_file = (html_dir or config.output_dir) / f"{discipline_code_safe}.html"
 
         if not html_file.exists():
             logger.debug(f"❌ HTML file not found: {html_file}")
@@ -45,41 +238,123 @@ def upload_discipline_page(
         # Читаємо HTML контент
         html_content = html_file.read_text(encoding="utf-8")
 
+    encoded = html_content.encode("utf-8")
+    return {
+        "slug": slug,
         # Готуємо дані для WordPress
-        post_data = {
+        "post_data": {
             "title": title,
             "content": html_content,
             "slug": slug,
             "status": "publish",
             "parent": parent_id,
-        }
+        },
+        # Стан для журналу завантажень
+        "state": {
+            "hash": hashlib.sha256(encoded).hexdigest(),
+            "title": title,
+            "slug": slug,
+            "parent": parent_id,
+        },
+        "size": len(encoded),
+    }
 
-        # Шукаємо існуючу сторінку
-        existing_page = client.get_page_by_slug(slug, parent_id=parent_id)
 
-        if existing_page:
-            # Оновлюємо існуючу сторінку
-            page_id = existing_page.get("id")
-            logger.info(f"♻️ Оновлюємо існуючу сторінку: {slug} (id={page_id})")
-            result = client.update_page(page_id, post_data)
-            action = "оновлено"
-        else:
-            # Створюємо нову сторінку
-            logger.info(f"Створюємо нову сторінку: {slug}")
-            result = client.create_page(post_data)
-            action = "створено"
+def write_page(
+    client: WordPressClient, post_data: dict, existing_page: dict | None
+) -> dict | None:
+    """Оновлює існуючу сторінку або створює нову"""
+    slug = post_data["slug"]
+    if existing_page:
+        # Оновлюємо існуючу сторінку
+        page_id = existing_page.get("id")
+        logger.info(f"♻️ Оновлюємо існуючу сторінку: {slug} (id={page_id})")
+        result = client.update_page(page_id, post_data)
+        if result is not None or page_id not in client.missing_pages:
+            return result
+        # Сторінку видалено на сервері, а інвентар її ще пам'ятав
+        logger.warning(f"⚠️ Сторінки {slug} (id={page_id}) вже немає, створюємо заново")
 
+    # Створюємо нову сторінку
+    logger.info(f"Створюємо нову сторінку: {slug}")
+    return client.create_page(post_data)
+
+
+def find_existing_page(
+    client: WordPressClient,
+    slug: str,
+    parent_id: int,
+    existing_pages: dict[str, dict] | None = None,
+) -> dict | None:
+    """Шукає існуючу сторінку в індексі або, без індексу, окремим запитом"""
+    if existing_pages is not None:
+        return existing_pages.get(slug)
+    return client.get_page_by_slug(slug, parent_id=parent_id)
+
+
+def upload_discipline_page(
+    discipline_code: str,
+    discipline_info: Discipline,
+    programm_year: str,
+    parent_id: int,
+    client: WordPressClient,
+    html_content: str | None = None,
+    existing_pages: dict[str, dict] | None = None,
+    ledger: UploadLedger | None = None,
+) -> WordPressPage | None:
+    """
+    Завантажує сторінку дисципліни на WordPress.
+
+    Якщо html_content не передано, HTML читається з config.output_dir.
+    existing_pages - індекс slug -> сторінка з client.list_children; без нього
+    існуюча сторінка шукається окремим запитом get_page_by_slug.
+    З ledger сторінки, що не змінились з останнього завантаження, пропускаються.
+    """
+    try:
+        page = prepare_discipline_page(
+            discipline_code, discipline_info, programm_year, parent_id, html_content
+        )
+        if page is None:
+            return None
+
+        # Пропускаємо сторінку, якщо саме цей HTML вже відправлено
+        if ledger is not None and ledger.skip_if_done(
+            discipline_code, page, existing_pages
+        ):
+            return {discipline_code: ledger.links[discipline_code]}
+
+        return upload_prepared_page(
+            discipline_code, page, parent_id, client, existing_pages, ledger
+        )
+
+    except Exception as e:
+        logger.error(f"Помилка завантаження {discipline_code}: {e}")
+        return None
+
+
+def upload_prepared_page(
+    discipline_code: str,
+    page: dict,
+    parent_id: int,
+    client: WordPressClient,
+    existing_pages: dict[str, dict] | None = None,
+    ledger: UploadLedger | None = None,
+) -> dict | None:
+    """Записує сторінку з prepare_discipline_page без повторної перевірки ledger"""
+    try:
+        # Шукаємо існуючу сторінку
+        existing_page = find_existing_page(
+            client, page["slug"], parent_id, existing_pages
+        )
+        result = write_page(client, page["post_data"], existing_page)
+
+        title = page["state"]["title"]
         if result:
-            page = WordPressPage(
-                id=result.get("id"),
-                title=title,
-                content=html_content,
-                slug=slug,
-                link=result.get("link"),
-                parent=parent_id,
-            )
-            logger.debug(f"Сторінку {action}: {title} (ID: {page.id}) завантажено")
-            return {discipline_code: page.link}
+            link = result.get("link")
+            logger.debug(f"Сторінку завантажено: {title} (ID: {result.get('id')})")
+            if ledger is not None:
+                ledger.record_sent(discipline_code, page["state"], result, page["size"])
+            return {discipline_code: link}
         else:
             logger.debug(f"Не вдалося завантажити сторінку: {title}")
             return None
@@ -89,14 +364,139 @@ def upload_discipline_page(
         return None
 
 
+def batch_upload_pages(
+    pages: dict[str, dict],
+    parent_id: int,
+    client: WordPressClient,
+    existing_pages: dict[str, dict] | None = None,
+    ledger: UploadLedger | None = None,
+) -> list[dict | None]:
+    """
+    Завантажує підготовлені сторінки дисциплін пакетами через /batch/v1.
+
+    pages - код -> сторінка з prepare_discipline_page, вже звірена з журналом
+    (див. skip_unchanged_pages). Сторінки групуються в пакетні оновлення та
+    створення; запит, що не пройшов у пакеті, повторюється окремо. Повертає
+    {код: посилання} або None для кожної сторінки по порядку.
+    """
+    links: dict[str, str] = {}
+    # (код, підготовлена сторінка, існуюча сторінка або None)
+    updates: list[tuple[str, dict, dict]] = []
+    creates: list[tuple[str, dict, None]] = []
+
+    for discipline_code, page in pages.items():
+        existing_page = find_existing_page(
+            client, page["slug"], parent_id, existing_pages
+        )
+        if existing_page:
+            updates.append((discipline_code, page, existing_page))
+        else:
+            creates.append((discipline_code, page, None))
+
+    logger.info(
+        f"📦 Пакетне завантаження: {len(updates)} оновлень, {len(creates)} створень"
+    )
+    results = client.batch_update_pages(
+        [(existing["id"], page["post_data"]) for _, page, existing in updates]
+    ) + client.batch_create_pages([page["post_data"] for _, page, _ in creates])
+
+    for (discipline_code, page, existing_page), result in zip(
+        updates + creates, results
+    ):
+        if result is None:
+            logger.warning(f"⚠️ {discipline_code} не пройшов у пакеті, окремий запит")
+            if existing_page is None:
+                # Пакет міг зберегти сторінку до помилки: не створюємо копію
+                existing_page = client.get_page_by_slug(page["slug"], parent_id)
+            result = write_page(client, page["post_data"], existing_page)
+        if result:
+            links[discipline_code] = result.get("link")
+            if ledger is not None:
+                ledger.record_sent(discipline_code, page["state"], result, page["size"])
+        else:
+            logger.debug(f"Не вдалося завантажити сторінку: {page['slug']}")
+
+    return [{code: links[code]} if code in links else None for code in pages]
+
+
+def load_existing_pages(
+    client: WordPressClient, parent_id: int, refresh: bool = False
+) -> dict[str, dict] | None:
+    """
+    Індекс дочірніх сторінок parent_id; None - шукати кожну сторінку окремо.
+
+    Береться з кешу інвентаря клієнта; refresh=True завантажує його повністю.
+    """
+    existing_pages = client.get_inventory(parent_id, refresh=refresh)
+    if existing_pages is None:
+        logger.warning(
+            f"⚠️ Не вдалося отримати дочірні сторінки {parent_id}, "
+            "шукаємо кожну сторінку за slug"
+        )
+    else:
+        logger.debug(f"Знайдено {len(existing_pages)} дочірніх сторінок {parent_id}")
+    return existing_pages
+
+
+def skip_unchanged_pages(
+    disciplines: dict[str, dict],
+    programm_year: str,
+    parent_id: int,
+    existing_pages: dict[str, dict] | None,
+    ledger: UploadLedger,
+    html_dir: Path | None = None,
+) -> dict[str, dict]:
+    """
+    Відмічає в ledger сторінки без змін або відновлені з журналу і повертає
+    підготовлені сторінки решти дисциплін: код -> prepare_discipline_page.
+
+    HTML кожної сторінки читається й хешується лише тут. Дисципліни без HTML
+    пропускаються; якщо змінених сторінок немає, завантаження не робить
+    жодного запиту.
+    """
+    changed = {}
+    for discipline_code, discipline_info in disciplines.items():
+        page = prepare_discipline_page(
+            discipline_code,
+            discipline_info,
+            programm_year,
+            parent_id,
+            html_dir=html_dir,
+        )
+        if page and not ledger.skip_if_done(discipline_code, page, existing_pages):
+            changed[discipline_code] = page
+    return changed
+
+
 def upload_all_pages(
-    yaml_file: Path, client: WordPressClient
+    yaml_file: Path,
+    client: WordPressClient,
+    concurrency: int = 1,
+    force: bool = False,
+    resume: bool = False,
+    adaptive: bool = False,
+    html_dir: Path | None = None,
 ) -> list[WordPressPage] | None:
-    """Завантажує всі HTML сторінки з директорії на WordPress використовуючи upload_discipline_page"""
-    wp_links = {}
+    """
+    Завантажує всі HTML сторінки з директорії на WordPress використовуючи upload_prepared_page
+
+    HTML читається з html_dir, типово config.output_dir.
+
+    При concurrency > 1 або adaptive сторінки завантажуються пулом потоків;
+    частоту запитів обмежує rate_limiter клієнта. Інакше, якщо сервер
+    підтримує /batch/v1, вони записуються пакетами. Посилання зберігають
+    порядок дисциплін у YAML.
+    Сторінки без змін з журналу завантажень пропускаються, якщо не force;
+    існуючі сторінки беруться з кешу інвентаря клієнта, тож якщо змін немає,
+    запуск не робить жодного запиту. З resume сторінки, завершені перерваним
+    запуском, беруться з журналу відновлення і не завантажуються повторно.
+    З adaptive пул має max_concurrency потоків, а кількість одночасних
+    запитів підбирає AIMD-обмежувач клієнта.
+    """
 
     # Завантажуємо дані з YAML
-    yaml_data = load_yaml_data(yaml_file)
+    bundle = load_program_bundle(yaml_file)
+    yaml_data = bundle.data
 
     # Отримуємо рік дисципліни для slug
     programm_year = yaml_data.get("metadata").get("year")
@@ -106,35 +506,73 @@ def upload_all_pages(
         return None
 
     # Отримуємо всі дисципліни
-    all_disciplines = {
-        **yaml_data.get("disciplines", {}),
-        **yaml_data.get("elevative_disciplines", {}),
-    }
+    all_disciplines = bundle.all_disciplines
 
     if not all_disciplines:
         logger.error("❌ No disciplines found in YAML file")
         return None
 
-    total = len(all_disciplines)
+    ledger = UploadLedger(
+        get_upload_ledger_path(yaml_file),
+        force=force,
+        journal_file=get_upload_journal_path(yaml_file),
+        resume=resume,
+    )
+    parent_id = yaml_data["metadata"]["page_id"]
+    existing_pages = load_existing_pages(client, parent_id, refresh=force)
+    pending = skip_unchanged_pages(
+        all_disciplines, programm_year, parent_id, existing_pages, ledger, html_dir
+    )
+    if resume:
+        logger.info(
+            f"Відновлено з журналу {ledger.restored} сторінок, "
+            f"залишилось {len(pending)}"
+        )
+
+    total = len(pending)
     logger.info(f"📤 Uploading {total} pages to WordPress...")
 
-    for i, (discipline_code, discipline_info) in enumerate(
-        all_disciplines.items(), start=1
-    ):
-        # Використовуємо upload_discipline_page для кожної дисципліни
-        link = upload_discipline_page(
-            discipline_code=discipline_code,
-            discipline_info=discipline_info,
-            parent_id=yaml_data["metadata"]["page_id"],
-            programm_year=programm_year,
-            client=client,
+    def upload(item: tuple[int, tuple[str, dict]]) -> dict | None:
+        i, (discipline_code, page) = item
+        # Сторінка вже прочитана й звірена з журналом у skip_unchanged_pages
+        link = upload_prepared_page(
+            discipline_code, page, parent_id, client, existing_pages, ledger
         )
         logger.info(f"[{i}/{total}] Generating {discipline_code}...")
-        link_logger.info(link.get(discipline_code))
-        if link:
-            wp_links.update(link)
-
+        return link
+
+    items = enumerate(pending.items(), start=1)
+    limiter_scope = client.adaptive_concurrency() if adaptive else nullcontext()
+    with limiter_scope as limiter:
+        if limiter:
+            concurrency = limiter.max_limit
+        if not pending:
+            logger.info("Змінених сторінок немає, нічого не відправляємо")
+        elif concurrency <= 1 and not adaptive and client.supports_batch():
+            # До 25 записів сторінок за один HTTP запит; явно задані потоки
+            # чи adaptive важливіші за пакетний режим
+            batch_upload_pages(
+                pending,
+                parent_id,
+                client,
+                existing_pages=existing_pages,
+                ledger=ledger,
+            )
+        else:
+            _map_uploads(upload, items, concurrency)
+    if limiter:
+        logger.info(limiter.summary())
+
+    # Посилання збирає журнал: порядок дисциплін у YAML, а не завершення
+    wp_links = ledger.ordered_links(all_disciplines)
+    for link in wp_links.values():
+        link_logger.info(link)
+
+    ledger.save()
+    ledger.finish_journal()
+    client.save_inventory(parent_id)
     logger.debug(f"Завантажено {len(wp_links)}/{len(all_disciplines)} сторінок")
+    logger.info(ledger.summary())
 
     metadata = {
         "year": yaml_data.get("metadata", {}).get("year", ""),
@@ -150,6 +588,205 @@ def upload_all_pages(
     return wp_data
 
 
+def _map_uploads(
+    upload: Callable[[tuple], dict | None], items: Iterable[tuple], concurrency: int
+) -> None:
+    """Виконує upload для кожного елемента: пулом потоків або послідовно"""
+    if concurrency > 1:
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="upload"
+        ) as executor:
+            list(executor.map(upload, items))
+    else:
+        for item in items:
+            upload(item)
+
+
+def _upload_queued_pages(
+    pages: queue.Queue,
+    upload: Callable[..., dict | None],
+    disciplines: dict[str, Discipline],
+    manifest: dict[str, str] | None,
+    failed: list[str],
+) -> None:
+    """
+    Потік-завантажувач конвеєра: бере (код, HTML, запис маніфесту) з черги до
+    отримання None. Запис маніфесту додається лише після вдалого завантаження,
+    коди невдалих сторінок збираються в failed.
+    """
+    while (item := pages.get()) is not None:
+        discipline_code, html_content, manifest_entry = item
+        link = upload(
+            discipline_code=discipline_code,
+            discipline_info=disciplines[discipline_code],
+            html_content=html_content,
+        )
+        if not link:
+            failed.append(discipline_code)
+            continue
+        link_logger.info(link.get(discipline_code))
+        if manifest is not None:
+            file_name, input_hash = manifest_entry
+            manifest[file_name] = input_hash
+
+
+def _render_or_reuse_page(
+    yaml_file: Path,
+    discipline_code: str,
+    output_dir: Path,
+    manifest: dict[str, str] | None,
+) -> tuple[str | None, bool, tuple[str, str | None]]:
+    """
+    HTML сторінки для конвеєра, чи його щойно відрендерено, і запис маніфесту
+    (ім'я HTML файлу, хеш вхідних даних).
+
+    З manifest сторінка, хеш вхідних даних якої не змінився, читається з
+    output_dir. Запис сторінки вилучається з маніфесту, доки потік-завантажувач
+    не поверне його після вдалого завантаження.
+    """
+    output_path = get_discipline_output_path(output_dir / f"{discipline_code}.html")
+    input_hash = None
+    rendered = True
+    if manifest is not None:
+        input_hash = get_discipline_input_hash(yaml_file, discipline_code)
+        rendered = manifest.pop(output_path.name, None) != input_hash
+    manifest_entry = (output_path.name, input_hash)
+
+    if not rendered and output_path.exists():
+        return output_path.read_text(encoding="utf-8"), False, manifest_entry
+
+    html_content = render_discipline_page(yaml_file, discipline_code)
+    if html_content is not None:
+        save_html_file(html_content, output_path)
+    return html_content, True, manifest_entry
+
+
+def _report_failed_pages(failed: list[str], disciplines: dict) -> None:
+    """Попередження зі списком незавантажених сторінок у порядку дисциплін"""
+    if failed:
+        codes = [code for code in disciplines if code in failed]
+        logger.warning(
+            f"Не вдалося завантажити {len(codes)} сторінок: {', '.join(codes)}"
+        )
+
+
+def pipeline_upload_all_pages(
+    yaml_file: Path,
+    output_dir: Path,
+    client: WordPressClient,
+    workers: int = config.pipeline_upload_workers,
+    queue_size: int = config.pipeline_queue_size,
+    force: bool = False,
+    resume: bool = False,
+    adaptive: bool = False,
+    incremental: bool = False,
+) -> dict | None:
+    """
+    Генерує та завантажує сторінки дисциплін конвеєром.
+
+    Головний потік рендерить сторінки та кладе HTML в обмежену чергу, а
+    потоки-завантажувачі одразу відправляють його на WordPress, тож мережеві
+    запити перекриваються з рендерингом. HTML також зберігається в output_dir
+    для перегляду, але назад з диску не читається. Як і в upload_all_pages,
+    сторінки без змін з журналу завантажень пропускаються, якщо не force,
+    а з resume - ще й завершені перерваним запуском. З adaptive потоків
+    max_concurrency, а одночасні запити обмежує AIMD-обмежувач клієнта.
+    З incremental сторінки, чий хеш вхідних даних збігається з маніфестом
+    генерації в output_dir, не рендеряться: HTML береться з диску, а сторінки
+    прибраних з програми дисциплін видаляються. Маніфест запам'ятовує лише
+    завантажені сторінки, тож невдалі наступного разу рендеряться знову.
+    """
+    bundle = load_program_bundle(yaml_file)
+    metadata = bundle.metadata
+    all_disciplines = bundle.all_disciplines
+
+    if not all_disciplines:
+        logger.error("❌ No disciplines found in YAML file")
+        return None
+
+    total = len(all_disciplines)
+    logger.info(f"📤 Generating and uploading {total} pages ({workers} upload workers)")
+
+    existing_pages = load_existing_pages(client, metadata["page_id"], refresh=force)
+    ledger = UploadLedger(
+        get_upload_ledger_path(yaml_file),
+        force=force,
+        journal_file=get_upload_journal_path(yaml_file),
+        resume=resume,
+    )
+    manifest_file = output_dir / config.generation_manifest
+    # None - без маніфесту, рендеримо всі сторінки
+    manifest = (
+        load_incremental_manifest(output_dir, all_disciplines) if incremental else None
+    )
+    pages: queue.Queue = queue.Queue(maxsize=queue_size)
+    failed: list[str] = []
+    upload = partial(
+        upload_discipline_page,
+        programm_year=metadata.get("year"),
+        parent_id=metadata["page_id"],
+        client=client,
+        existing_pages=existing_pages,
+        ledger=ledger,
+    )
+
+    limiter_scope = client.adaptive_concurrency() if adaptive else nullcontext()
+    with limiter_scope as limiter:
+        if limiter:
+            workers = limiter.max_limit
+        threads = [
+            threading.Thread(
+                target=_upload_queued_pages,
+                args=(pages, upload, all_disciplines, manifest, failed),
+                name=f"upload-{n}",
+                daemon=True,
+            )
+            for n in range(max(1, workers))
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            for i, discipline_code in enumerate(all_disciplines, start=1):
+                html_content, rendered, manifest_entry = _render_or_reuse_page(
+                    yaml_file, discipline_code, output_dir, manifest
+                )
+                if html_content is None:
+                    continue
+                action = "Rendered" if rendered else "Unchanged"
+                logger.info(
+                    f"[{i}/{total}] {action} {discipline_code}, queued for upload"
+                )
+                # Блокується, якщо завантаження відстає від рендерингу
+                pages.put((discipline_code, html_content, manifest_entry))
+        finally:
+            for _ in threads:
+                pages.put(None)
+            for thread in threads:
+                thread.join()
+            # Зберігаємо журнал навіть якщо рендеринг обірвався
+            ledger.save()
+            if manifest is not None:
+                save_generation_manifest(manifest, manifest_file)
+            client.save_inventory(metadata["page_id"])
+    # Сюди доходимо лише якщо рендеринг не обірвався
+    ledger.finish_journal()
+    if limiter:
+        logger.info(limiter.summary())
+
+    # Стабільний порядок посилань - порядок дисциплін у YAML
+    wp_links = ledger.ordered_links(all_disciplines)
+    logger.debug(f"Завантажено {len(wp_links)}/{total} сторінок")
+    logger.info(ledger.summary())
+    _report_failed_pages(failed, all_disciplines)
+
+    return {
+        "year": metadata.get("year", ""),
+        "degree": metadata.get("degree", ""),
+        "links": wp_links,
+    }
+
+
 def upload_index(yaml_file: Path, client: WordPressClient) -> WordPressPage | None:
     """Завантажує індексну сторінку на WordPress"""
     try:
@@ -160,7 +797,7 @@ def upload_index(yaml_file: Path, client: WordPressClient) -> WordPressPage | No
             return None
 
         # Отримуємо title з YAML
-        yaml_data = load_yaml_data(yaml_file)
+        yaml_data = load_program_bundle(yaml_file).data
         page_id = yaml_data["metadata"]["page_id"]
         title = f"Освітні компоненти: {yaml_data['metadata'].get('degree', '')} {yaml_data['metadata'].get('year', '')}"
 
@@ -207,7 +844,7 @@ def upload_syllabus(yaml_file: Path, client: WordPressClient) -> WordPressPage |
             return None
 
         # Отримуємо title з YAML
-        yaml_data = load_yaml_data(yaml_file)
+        yaml_data = load_program_bundle(yaml_file).data
         syllabus_page_id = yaml_data["metadata"]["syllabus_page_id"]
         title = f"Силабуси: {yaml_data['metadata'].get('degree', '')} {yaml_data['metadata'].get('year', '')}"
 
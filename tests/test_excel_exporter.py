@@ -0,0 +1,45 @@
+# tests/test_excel_exporter.py
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.excel_exporter import generate_excel_report
+
+PROGRAM_FILES = sorted(
+    (Path(__file__).resolve().parents[1] / "programm_data").glob("*.yaml")
+)
+
+
+def read_workbook(path):
+    """Назви аркушів і значення всіх комірок книги"""
+    # Не read_only: write-only книга не пише розмірів аркуша, і read_only
+    # читач повертає її порожні рядки як () замість рядка з None
+    workbook = load_workbook(path)
+    return {
+        sheet.title: list(sheet.iter_rows(values_only=True))
+        for sheet in workbook.worksheets
+    }
+
+
+class TestExcelReport:
+    """Тести для Excel звіту програми"""
+
+    @pytest.mark.parametrize("yaml_file", PROGRAM_FILES, ids=lambda path: path.stem)
+    def test_stream_matches_pandas(self, yaml_file, tmp_path):
+        """Тест, що --stream книга збігається з pandas книгою аркушами та значеннями"""
+        pandas_file = tmp_path / "pandas.xlsx"
+        stream_file = tmp_path / "stream.xlsx"
+        generate_excel_report(str(yaml_file), pandas_file)
+        generate_excel_report(str(yaml_file), stream_file, stream=True)
+
+        expected = read_workbook(pandas_file)
+        actual = read_workbook(stream_file)
+
+        assert list(actual) == list(expected)
+        for title, rows in expected.items():
+            assert actual[title] == rows, title
@@ -0,0 +1,73 @@
+# tests/test_file_utils.py
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core import file_utils
+from core.file_utils import _read_yaml_cache, _write_yaml_cache, load_yaml_data
+
+
+class TestYamlCache:
+    """Тести для дискового кешу розпарсених YAML"""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(file_utils.config, "cache_dir", cache_dir)
+        return cache_dir
+
+    def test_edit_prunes_stale_entry(self, tmp_path, cache_dir):
+        """Тест, що після зміни файлу в кеші лишається лише новий запис"""
+        yaml_file = tmp_path / "program.yaml"
+        other_file = tmp_path / "other.yaml"
+        other_file.write_text("b: 1\n", encoding="utf-8")
+        load_yaml_data(other_file)
+        for value in range(3):
+            yaml_file.write_text(f"a: {value}\n", encoding="utf-8")
+            assert load_yaml_data(yaml_file) == {"a": value}
+
+        assert len(list(cache_dir.glob("*.pickle"))) == 2
+        assert load_yaml_data(other_file) == {"b": 1}
+
+    def test_empty_yaml_is_cached(self, tmp_path, cache_dir, monkeypatch):
+        """Тест, що YAML, який розбирається в None, береться з кешу"""
+        yaml_file = tmp_path / "empty.yaml"
+        yaml_file.write_text("# порожньо\n", encoding="utf-8")
+        monkeypatch.setitem(file_utils.yaml_cache_stats, "hits", 0)
+        monkeypatch.setitem(file_utils.yaml_cache_stats, "misses", 0)
+
+        assert load_yaml_data(yaml_file) is None
+        assert load_yaml_data(yaml_file) is None
+
+        assert file_utils.yaml_cache_stats["misses"] == 1
+        assert file_utils.yaml_cache_stats["hits"] == 1
+
+    def test_concurrent_writes_of_same_entry(self, tmp_path, caplog, monkeypatch):
+        """Тест, що потоки, які пишуть один запис кешу, не заважають один одному"""
+        replace = os.replace
+
+        def slow_replace(src, dst):
+            # Розширюємо вікно між записом тимчасового файлу і перейменуванням
+            time.sleep(0.01)
+            replace(src, dst)
+
+        monkeypatch.setattr(file_utils.os, "replace", slow_replace)
+        cache_path = tmp_path / "entry.pickle"
+        threads = [
+            threading.Thread(target=_write_yaml_cache, args=(cache_path, {"n": i}))
+            for i in range(16)
+        ]
+        with caplog.at_level("WARNING", logger=file_utils.logger.name):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert not caplog.records
+        assert [p.name for p in tmp_path.iterdir()] == ["entry.pickle"]
+        assert _read_yaml_cache(cache_path)["n"] in range(16)
@@ -0,0 +1,145 @@
+# tests/test_handlers.py
+import argparse
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import cli
+from core import data_manipulation, handlers, html_generator
+from core.handlers import handle_generate_all_disciplines
+
+REPO_DIR = Path(__file__).resolve().parents[1]
+PROGRAM_YAML = REPO_DIR / "programm_data" / "PhD2024.yaml"
+
+
+class TestIncrementalGeneration:
+    """Тести для інкрементальної генерації сторінок дисциплін"""
+
+    @pytest.fixture
+    def program(self, tmp_path):
+        yaml_file = tmp_path / "program.yaml"
+        shutil.copy(PROGRAM_YAML, yaml_file)
+        return yaml_file
+
+    @pytest.fixture
+    def rendered(self, monkeypatch):
+        """Коди дисциплін, сторінки яких справді рендерилися"""
+        codes = []
+        generate = handlers.generate_discipline_page
+
+        def spy(yaml_file, discipline_code, *args, **kwargs):
+            codes.append(discipline_code)
+            return generate(yaml_file, discipline_code, *args, **kwargs)
+
+        monkeypatch.setattr(handlers, "generate_discipline_page", spy)
+        return codes
+
+    @staticmethod
+    def read_manifest(output_dir):
+        return json.loads((output_dir / ".manifest.json").read_text(encoding="utf-8"))
+
+    def test_unchanged_pages_are_skipped(self, program, tmp_path, rendered):
+        """Тест, що другий запуск без змін нічого не рендерить"""
+        output_dir = tmp_path / "out"
+        results = handle_generate_all_disciplines(program, output_dir, incremental=True)
+        assert len(rendered) == len(results) == 12
+        assert set(self.read_manifest(output_dir)) == {
+            f"{code.replace(' ', '_')}.html" for code in results
+        }
+
+        rendered.clear()
+        assert all(
+            handle_generate_all_disciplines(
+                program, output_dir, incremental=True
+            ).values()
+        )
+        assert rendered == []
+
+    def test_missing_html_is_rendered_again(self, program, tmp_path, rendered):
+        """Тест, що сторінка без HTML файлу рендериться, навіть якщо є в маніфесті"""
+        output_dir = tmp_path / "out"
+        handle_generate_all_disciplines(program, output_dir, incremental=True)
+        (output_dir / "НК_03.html").unlink()
+
+        rendered.clear()
+        handle_generate_all_disciplines(program, output_dir, incremental=True)
+        assert rendered == ["НК 03"]
+
+    def test_template_change_invalidates_pages(
+        self, program, tmp_path, rendered, monkeypatch
+    ):
+        """Тест, що зміна шаблону сторінки дисципліни перегенеровує всі сторінки"""
+        template_dir = tmp_path / "templates"
+        shutil.copytree(REPO_DIR / "templates", template_dir)
+        monkeypatch.setattr(html_generator.config, "template_dir", template_dir)
+        output_dir = tmp_path / "out"
+        handle_generate_all_disciplines(program, output_dir, incremental=True)
+
+        template = template_dir / "discipline_template.html"
+        template.write_text(template.read_text("utf-8") + "\n<!-- -->\n", "utf-8")
+
+        rendered.clear()
+        handle_generate_all_disciplines(program, output_dir, incremental=True)
+        assert len(rendered) == 12
+
+    def test_glossary_change_invalidates_pages(
+        self, program, tmp_path, rendered, monkeypatch
+    ):
+        """Тест, що зміна глосарію з extra_data перегенеровує всі сторінки"""
+        glossary = tmp_path / "glossary.yaml"
+        shutil.copy(data_manipulation.config.glossary_yaml, glossary)
+        monkeypatch.setattr(data_manipulation.config, "glossary_yaml", glossary)
+        output_dir = tmp_path / "out"
+        handle_generate_all_disciplines(program, output_dir, incremental=True)
+
+        glossary.write_text(
+            glossary.read_text("utf-8") + "\nextra_term:\n  name: Новий термін\n",
+            "utf-8",
+        )
+
+        rendered.clear()
+        handle_generate_all_disciplines(program, output_dir, incremental=True)
+        assert len(rendered) == 12
+
+    def test_removed_discipline_page_is_deleted(self, program, tmp_path, rendered):
+        """Тест, що сторінка прибраної з програми дисципліни видаляється"""
+        output_dir = tmp_path / "out"
+        handle_generate_all_disciplines(program, output_dir, incremental=True)
+        assert (output_dir / "ВК_03.html").exists()
+
+        data = yaml.safe_load(program.read_text(encoding="utf-8"))
+        del data["elevative_disciplines"]["ВК 03"]
+        program.write_text(
+            yaml.safe_dump(data, allow_unicode=True, sort_keys=False), "utf-8"
+        )
+
+        rendered.clear()
+        results = handle_generate_all_disciplines(program, output_dir, incremental=True)
+        assert "ВК 03" not in results
+        assert rendered == []
+        assert not (output_dir / "ВК_03.html").exists()
+        assert "ВК_03.html" not in self.read_manifest(output_dir)
+
+    def test_all_uses_manifest_per_program(self, tmp_path):
+        """Тест, що all --incremental веде окрему папку та маніфест для кожної програми"""
+        folder = tmp_path / "programs"
+        folder.mkdir()
+        for name in ("PhD2024.yaml", "PhD2025.yaml"):
+            shutil.copy(PROGRAM_YAML.parent / name, folder / name)
+        output_dir = tmp_path / "out"
+        args = argparse.Namespace(incremental=True, upload=False, jobs=1)
+
+        cli.handle_all(args, folder, output_dir, tmp_path / "reports", None)
+
+        assert not (output_dir / ".manifest.json").exists()
+        for stem in ("PhD2024", "PhD2025"):
+            manifest = self.read_manifest(output_dir / stem)
+            assert len(manifest) == 12
+            assert all((output_dir / stem / name).exists() for name in manifest)
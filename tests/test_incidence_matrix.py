@@ -0,0 +1,126 @@
+# tests/test_incidence_matrix.py
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.data_manipulation import load_program_bundle
+from core.incidence_matrix import build_incidence_matrix
+
+PROGRAM_FILES = sorted(
+    (Path(__file__).resolve().parents[1] / "programm_data").glob("*.yaml")
+)
+
+
+def get_mapped_competencies(discipline_code, mappings, all_competencies):
+    """Еталон: колишня data_manipulation.get_mapped_competencies"""
+    if discipline_code not in mappings:
+        return [], []
+
+    general_competencies = []
+    professional_competencies = []
+    for comp_code in mappings[discipline_code].get("competencies", []):
+        if comp_code in all_competencies:
+            comp_desc = all_competencies[comp_code]
+            if comp_code.startswith("ЗК"):
+                general_competencies.append((comp_code, comp_desc))
+            elif comp_code.startswith("ФК"):
+                professional_competencies.append((comp_code, comp_desc))
+    return general_competencies, professional_competencies
+
+
+def get_mapped_program_results(discipline_code, mappings, all_program_results):
+    """Еталон: колишня data_manipulation.get_mapped_program_results"""
+    if discipline_code not in mappings:
+        return []
+
+    return [
+        (prn_code, all_program_results[prn_code])
+        for prn_code in mappings[discipline_code].get("program_results", [])
+        if prn_code in all_program_results
+    ]
+
+
+class TestBuildIncidenceMatrix:
+    """Тести для булевої матриці відповідностей"""
+
+    @pytest.fixture
+    def matrix(self):
+        links = {
+            "D1": {"ЗК 1", "ФК 1"},
+            "D2": {"ЗК 9"},  # немає серед рядків
+            "D3": {"ФК 1"},
+            "D9": {"ЗК 2"},  # немає серед колонок
+        }
+        return build_incidence_matrix(
+            ["ЗК 1", "ЗК 2", "ФК 1"], ["D1", "D2", "D3"], links
+        )
+
+    def test_cells_and_counts(self, matrix):
+        """Тест, що комірки відповідають links, а невідомі коди ігноруються"""
+        assert matrix.cells.dtype == bool
+        assert matrix.cells.tolist() == [
+            [True, False, False],
+            [False, False, False],
+            [True, False, True],
+        ]
+        assert matrix.row_counts.tolist() == [1, 0, 2]
+        assert matrix.column_counts.tolist() == [2, 0, 1]
+
+    def test_empty_links(self):
+        """Тест, що без відповідностей матриця порожня, але правильної форми"""
+        matrix = build_incidence_matrix(["ЗК 1"], ["D1", "D2"], {})
+        assert matrix.cells.shape == (1, 2)
+        assert not matrix.cells.any()
+
+    def test_to_report(self, matrix):
+        """Тест рядкової моделі для HTML звіту"""
+        report = matrix.to_report({"ЗК 1": "Здатність 1", "ФК 1": "Фахова 1"})
+        assert [(row.code, row.description, row.cells) for row in report.rows] == [
+            ("ЗК 1", "Здатність 1", [True, False, False]),
+            ("ЗК 2", "", [False, False, False]),
+            ("ФК 1", "Фахова 1", [True, False, True]),
+        ]
+
+    def test_to_frame(self, matrix):
+        """Тест DataFrame з "+"/"" для Excel"""
+        frame = matrix.to_frame()
+        assert list(frame.index) == ["ЗК 1", "ЗК 2", "ФК 1"]
+        assert list(frame.columns) == ["D1", "D2", "D3"]
+        assert frame.loc["ФК 1"].tolist() == ["+", "", "+"]
+        assert matrix.to_frame("x", "-").loc["ЗК 2"].tolist() == ["-", "-", "-"]
+
+    @pytest.mark.parametrize("yaml_file", PROGRAM_FILES, ids=lambda path: path.stem)
+    def test_matches_mapped_lookups(self, yaml_file):
+        """Тест, що матриці програм збігаються з колишніми get_mapped_* пошуками"""
+        bundle = load_program_bundle(yaml_file)
+        data, catalog = bundle.data, bundle.catalog
+        disciplines, mappings = data["disciplines"], data.get("mappings", {})
+
+        competencies = build_incidence_matrix(
+            data["competencies"], disciplines, catalog.competencies_by_code
+        )
+        program_results = build_incidence_matrix(
+            data["program_results"], disciplines, catalog.program_results_by_code
+        )
+
+        for j, code in enumerate(disciplines):
+            general, professional = get_mapped_competencies(
+                code, mappings, data["competencies"]
+            )
+            expected = {comp_code for comp_code, _ in general + professional}
+            rows = np.flatnonzero(competencies.cells[:, j])
+            assert {competencies.rows[i] for i in rows} == expected
+
+            expected = {
+                prn_code
+                for prn_code, _ in get_mapped_program_results(
+                    code, mappings, data["program_results"]
+                )
+            }
+            rows = np.flatnonzero(program_results.cells[:, j])
+            assert {program_results.rows[i] for i in rows} == expected
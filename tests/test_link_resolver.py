@@ -0,0 +1,100 @@
+# tests/test_link_resolver.py
+import os
+import sys
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core import link_resolver
+from core.data_manipulation import load_program_bundle
+from core.file_utils import get_inventory_cache_path, save_remote_inventory
+from core.link_resolver import (
+    LinkResolver,
+    get_discipline_slug,
+    load_link_resolver,
+    resolve_cached_links,
+)
+
+PROGRAM_YAML = Path(__file__).resolve().parents[1] / "programm_data" / "PhD2024.yaml"
+API_URL = "https://wp.test/wp-json/wp/v2"
+
+
+class TestLinkResolver:
+    """Тести для адрес сторінок дисциплін у шаблонах"""
+
+    def test_local_links_without_wordpress(self):
+        """Тест, що без посилань ведемо на локальні HTML файли"""
+        resolver = LinkResolver()
+        assert resolver("НК 01") == "НК_01.html"
+        assert resolver("ПО 1.2/3") == "ПО_1.2_3.html"
+
+    def test_wordpress_links(self):
+        """Тест, що дисципліни без сторінки на WordPress отримують missing"""
+        resolver = LinkResolver({"НК 01": "https://wp.test/nk-01/"})
+        assert resolver("НК 01") == "https://wp.test/nk-01/"
+        assert resolver("НК 02") == "#"
+        assert LinkResolver({}, missing="")("НК 02") == ""
+
+
+class TestResolveCachedLinks:
+    """Тести для посилань з кешу інвентаря сторінок WordPress"""
+
+    @pytest.fixture
+    def inventory_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            link_resolver,
+            "get_inventory_cache_path",
+            partial(get_inventory_cache_path, cache_dir=tmp_path),
+        )
+        monkeypatch.setattr(link_resolver.config, "wp_links_dir", tmp_path)
+        bundle = load_program_bundle(PROGRAM_YAML)
+        return get_inventory_cache_path(bundle.metadata["page_id"], tmp_path)
+
+    @staticmethod
+    def save_inventory(inventory_file, codes, api_url=API_URL):
+        """Кеш інвентаря зі сторінками дисциплін codes"""
+        bundle = load_program_bundle(PROGRAM_YAML)
+        year = bundle.metadata.get("year")
+        pages = {}
+        for code in codes:
+            slug = get_discipline_slug(code, bundle.all_disciplines[code], year)
+            pages[slug] = {"id": len(pages) + 1, "link": f"https://wp.test/{slug}/"}
+        save_remote_inventory({"api_url": api_url, "pages": pages}, inventory_file)
+
+    def test_links_from_inventory(self, inventory_file):
+        """Тест, що посилання беруться з кешу, а відсутні дисципліни пропускаються"""
+        self.save_inventory(inventory_file, ["НК 01", "ВК 02"])
+
+        links = resolve_cached_links(PROGRAM_YAML, API_URL)
+
+        assert list(links) == ["НК 01", "ВК 02"]
+        assert links["НК 01"].startswith("https://wp.test/")
+
+    def test_inventory_of_other_site_is_ignored(self, inventory_file):
+        """Тест, що кеш, знятий з іншого api_url, не дає посилань"""
+        self.save_inventory(
+            inventory_file, ["НК 01"], api_url="https://old.test/wp-json/wp/v2"
+        )
+
+        assert resolve_cached_links(PROGRAM_YAML, API_URL) == {}
+
+    def test_default_api_url_from_config(self, inventory_file):
+        """Тест, що без api_url порівнюємо з адресою з WordPressConfig"""
+        api_url = link_resolver.WordPressConfig().api_url
+        self.save_inventory(inventory_file, ["НК 01"], api_url=api_url)
+
+        assert list(resolve_cached_links(PROGRAM_YAML)) == ["НК 01"]
+
+    def test_link_resolver_falls_back_to_inventory(self, inventory_file):
+        """Тест, що без wp_links YAML LinkResolver бере посилання з кешу"""
+        self.save_inventory(inventory_file, ["НК 01"])
+
+        resolver = load_link_resolver(PROGRAM_YAML, API_URL)
+        assert resolver("НК 01").startswith("https://wp.test/")
+        assert resolver("НК 02") == "#"
+
+        other_site = load_link_resolver(PROGRAM_YAML, "https://old.test/wp-json/wp/v2")
+        assert other_site("НК 01") == "НК_01.html"
@@ -0,0 +1,88 @@
+# tests/test_render_html.py
+import os
+import stat
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.data_manipulation import load_program_bundle
+from core.exceptions import TemplateRenderError
+from core.file_utils import save_html_file
+from core.link_resolver import LinkResolver
+from core.render_html import render_template, render_template_to_file
+
+PROGRAM_YAML = Path(__file__).resolve().parents[1] / "programm_data" / "PhD2024.yaml"
+
+
+class TestRenderTemplateToFile:
+    """Тести для потокового рендерингу шаблону у файл"""
+
+    @pytest.fixture
+    def context(self):
+        bundle = load_program_bundle(PROGRAM_YAML)
+        return {
+            "metadata": bundle.metadata,
+            "disciplines": bundle.all_disciplines,
+            "discipline_groups": {
+                prefix: [(code, bundle.all_disciplines[code]) for code in codes]
+                for prefix, codes in bundle.catalog.codes_by_group.items()
+            },
+            "discipline_url": LinkResolver(),
+        }
+
+    def test_output_matches_render_template(self, context, tmp_path):
+        """Тест, що файл байт у байт збігається з render_template"""
+        output_file = tmp_path / "index.html"
+
+        render_template_to_file("index_template.html", context, output_file)
+
+        expected = render_template("index_template.html", context)
+        assert output_file.read_bytes() == expected.encode("utf-8")
+        assert [path.name for path in tmp_path.iterdir()] == ["index.html"]
+
+    def test_file_mode_matches_save_html_file(self, context, tmp_path):
+        """Тест, що права файлу такі ж, як у звичайного запису з урахуванням umask"""
+        streamed = tmp_path / "streamed.html"
+        saved = tmp_path / "saved.html"
+
+        render_template_to_file("index_template.html", context, streamed)
+        save_html_file("<p></p>", saved)
+
+        assert stat.S_IMODE(streamed.stat().st_mode) == stat.S_IMODE(
+            saved.stat().st_mode
+        )
+
+    def test_concurrent_renders_of_same_file(self, context, tmp_path):
+        """Тест, що потоки, які пишуть один файл, не ділять тимчасовий файл"""
+        output_file = tmp_path / "index.html"
+        errors = []
+
+        def render():
+            try:
+                render_template_to_file("index_template.html", context, output_file)
+            except TemplateRenderError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=render) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        expected = render_template("index_template.html", context)
+        assert output_file.read_text(encoding="utf-8") == expected
+        assert [path.name for path in tmp_path.iterdir()] == ["index.html"]
+
+    def test_failed_render_leaves_no_files(self, tmp_path):
+        """Тест, що помилка рендерингу не лишає ні результату, ні тимчасового файлу"""
+        output_file = tmp_path / "missing.html"
+
+        with pytest.raises(TemplateRenderError):
+            render_template_to_file("no_such_template.html", {}, output_file)
+
+        assert list(tmp_path.iterdir()) == []
@@ -1,15 +1,20 @@
 # tests/test_wordpress_client.py
+import json
 import os
 import sys
 
 import pytest
+import requests
 import responses
 from requests.auth import HTTPBasicAuth
+from responses import matchers
+from urllib3.exceptions import ReadTimeoutError
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from core.config import WordPressConfig
-from core.wordpress_client import WordPressClient
+from core.rate_limiter import AdaptiveConcurrencyLimiter
+from core.wordpress_client import WordPressClient, create_retry_policy
 
 
 class TestWordPressConfig:
@@ -216,3 +221,419 @@ class TestWordPressClientEdgeCases:
         # Має повернути ID першої знайденої сторінки
         result = wp_client.find_page_id_by_slug("тест")
         assert result == 1
+
+
+class TestWordPressClientRetries:
+    """Тести для повторів запитів і пулу з'єднань"""
+
+    @pytest.fixture
+    def wp_client(self):
+        auth = HTTPBasicAuth("user", "pass")
+        return WordPressClient(
+            "https://test.com", auth, max_retries=2, backoff_factor=0
+        )
+
+    @responses.activate
+    def test_retry_on_service_unavailable(self, wp_client):
+        """Тест повтору запиту після 503"""
+        responses.add(responses.GET, "https://test.com/pages/1", status=503)
+        responses.add(
+            responses.GET, "https://test.com/pages/1", json={"id": 1}, status=200
+        )
+
+        result = wp_client.get_page(1)
+        assert result == {"id": 1}
+        assert len(responses.calls) == 2
+        assert wp_client.retries == 1
+
+    @responses.activate
+    def test_retry_after_on_too_many_requests(self, wp_client):
+        """Тест повтору POST після 429 з Retry-After"""
+        responses.add(
+            responses.POST,
+            "https://test.com/pages",
+            status=429,
+            headers={"Retry-After": "0"},
+        )
+        responses.add(
+            responses.POST, "https://test.com/pages", json={"id": 5}, status=201
+        )
+
+        result = wp_client.create_page({"title": "New"})
+        assert result == {"id": 5}
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_no_post_retry_after_gateway_error(self, wp_client):
+        """Тест, що POST не повторюється після 502: сторінка могла зберегтися"""
+        responses.add(responses.POST, "https://test.com/pages", status=502)
+
+        assert wp_client.create_page({"title": "New"}) is None
+        assert len(responses.calls) == 1
+        assert wp_client.retries == 0
+
+    def test_no_post_retry_after_read_timeout(self):
+        """Тест, що POST не повторюється після таймауту читання, а GET - так"""
+        policy = create_retry_policy(max_retries=2, backoff_factor=0)
+        error = ReadTimeoutError(None, "https://test.com/pages", "timed out")
+
+        with pytest.raises(ReadTimeoutError):
+            policy.increment(method="POST", url="/pages", error=error)
+        assert policy.increment(method="GET", url="/pages", error=error).total == 1
+
+    @responses.activate
+    def test_retries_exhausted(self, wp_client):
+        """Тест вичерпання повторів"""
+        responses.add(responses.GET, "https://test.com/pages/1", status=502)
+
+        result = wp_client.get_page(1)
+        assert result is None
+        assert len(responses.calls) == 3
+        assert wp_client.retries == 2
+
+    @responses.activate
+    def test_no_retry_on_client_error(self, wp_client):
+        """Тест відсутності повторів для 404"""
+        responses.add(responses.GET, "https://test.com/pages/1", status=404)
+
+        assert wp_client.get_page(1) is None
+        assert len(responses.calls) == 1
+        assert wp_client.retries == 0
+
+    def test_connection_stats_empty(self, wp_client):
+        """Тест статистики з'єднань до першого запиту"""
+        assert wp_client.connection_stats() == {}
+
+    @responses.activate
+    def test_rate_limited_client(self):
+        """Тест клієнта з обмеженням частоти запитів"""
+        auth = HTTPBasicAuth("user", "pass")
+        wp_client = WordPressClient("https://test.com", auth, requests_per_second=100)
+        responses.add(
+            responses.GET, "https://test.com/pages/1", json={"id": 1}, status=200
+        )
+
+        assert wp_client.rate_limiter is not None
+        assert wp_client.get_page(1) == {"id": 1}
+
+    @responses.activate
+    def test_adaptive_concurrency_grows(self, wp_client):
+        """Тест зростання ліміту, поки затримка стабільна"""
+        responses.add(
+            responses.GET, "https://test.com/pages/1", json={"id": 1}, status=200
+        )
+
+        with wp_client.adaptive_concurrency(1, 4) as limiter:
+            for _ in range(limiter.window):
+                wp_client.get_page(1)
+
+        assert limiter.limit == 2
+        assert [limit for _, limit, _ in limiter.trajectory] == [1, 2]
+        assert wp_client.concurrency_limiter is None
+
+    @responses.activate
+    def test_adaptive_concurrency_backs_off(self, wp_client):
+        """Тест мультиплікативного зменшення ліміту після 503"""
+        responses.add(responses.GET, "https://test.com/pages/1", status=503)
+        responses.add(
+            responses.GET, "https://test.com/pages/1", json={"id": 1}, status=200
+        )
+        limiter = AdaptiveConcurrencyLimiter(1, 8, initial=4)
+        wp_client.concurrency_limiter = limiter
+
+        assert wp_client.get_page(1) == {"id": 1}
+        assert limiter.limit == 2
+        assert limiter.in_flight == 0
+
+
+class TestWordPressClientInventory:
+    """Тести для індексу дочірніх сторінок"""
+
+    @pytest.fixture
+    def wp_client(self):
+        auth = HTTPBasicAuth("user", "pass")
+        return WordPressClient("https://test.com", auth)
+
+    @responses.activate
+    def test_list_children_paginated(self, wp_client):
+        """Тест обходу всіх сторінок результату за X-WP-TotalPages"""
+        for page_number, pages in [
+            (1, [{"id": 1, "slug": "a", "date": "2024-01-01T00:00:00"}]),
+            (2, [{"id": 2, "slug": "b", "date": "2024-01-02T00:00:00"}]),
+        ]:
+            responses.add(
+                responses.GET,
+                "https://test.com/pages",
+                json=pages,
+                status=200,
+                headers={"X-WP-TotalPages": "2"},
+                match=[
+                    matchers.query_param_matcher(
+                        {"parent": "7", "page": str(page_number), "per_page": "100"},
+                        strict_match=False,
+                    )
+                ],
+            )
+
+        result = wp_client.list_children(7)
+        assert set(result) == {"a", "b"}
+        assert result["b"]["id"] == 2
+        assert len(responses.calls) == 2
+        assert "_fields=id%2Cslug%2Clink%2Cmodified%2Cparent%2Cdate" in (
+            responses.calls[0].request.url
+        )
+
+    @responses.activate
+    def test_list_children_picks_latest_duplicate(self, wp_client):
+        """Тест вибору найновішої сторінки серед дублікатів slug"""
+        responses.add(
+            responses.GET,
+            "https://test.com/pages",
+            json=[
+                {"id": 1, "slug": "dup", "date": "2024-01-01T00:00:00"},
+                {"id": 2, "slug": "dup", "date": "2024-03-01T00:00:00"},
+                {"id": 3, "slug": "dup", "date": "2024-02-01T00:00:00"},
+            ],
+            status=200,
+        )
+
+        assert wp_client.list_children(7)["dup"]["id"] == 2
+        assert wp_client.list_children(7, pick_latest=False)["dup"]["id"] == 1
+
+    @responses.activate
+    def test_list_children_failure(self, wp_client):
+        """Тест невдалого запиту дочірніх сторінок"""
+        responses.add(responses.GET, "https://test.com/pages", status=400)
+
+        assert wp_client.list_children(7) is None
+
+    @responses.activate
+    def test_iter_pages_is_lazy(self, wp_client):
+        """Тест, що наступна сторінка результату запитується лише на вимогу"""
+        responses.add(
+            responses.GET,
+            "https://test.com/pages",
+            json=[{"id": 1}, {"id": 2}],
+            status=200,
+            headers={"X-WP-TotalPages": "5"},
+            match=[matchers.query_param_matcher({"_fields": "id"}, strict_match=False)],
+        )
+
+        pages = wp_client.iter_pages(fields=["id"], parent=7)
+        assert next(pages) == {"id": 1}
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_iter_pages_failure(self, wp_client):
+        """Тест помилки посередині перебору"""
+        responses.add(
+            responses.GET,
+            "https://test.com/pages",
+            json=[{"id": 1}],
+            status=200,
+            headers={"X-WP-TotalPages": "2"},
+            match=[matchers.query_param_matcher({"page": "1"}, strict_match=False)],
+        )
+        responses.add(responses.GET, "https://test.com/pages", status=500)
+
+        with pytest.raises(requests.HTTPError):
+            list(wp_client.iter_pages())
+
+    @responses.activate
+    def test_get_page_by_slug_projected(self, wp_client):
+        """Тест пошуку за slug лише з полями індексу"""
+        responses.add(
+            responses.GET,
+            "https://test.com/pages",
+            json=[{"id": 4, "slug": "a", "parent": 7, "date": "2024-01-01T00:00:00"}],
+            status=200,
+            match=[
+                matchers.query_param_matcher(
+                    {
+                        "slug": "a",
+                        "parent": "7",
+                        "_fields": "id,slug,link,modified,parent,date",
+                    },
+                    strict_match=False,
+                )
+            ],
+        )
+
+        assert wp_client.get_page_by_slug("a", parent_id=7)["id"] == 4
+
+
+class TestWordPressClientInventoryCache:
+    """Тести для дискового кешу інвентаря сторінок"""
+
+    @pytest.fixture
+    def make_client(self, tmp_path):
+        def make_client(inventory_ttl=900):
+            auth = HTTPBasicAuth("user", "pass")
+            return WordPressClient(
+                "https://test.com",
+                auth,
+                inventory_ttl=inventory_ttl,
+                cache_dir=tmp_path,
+            )
+
+        return make_client
+
+    @staticmethod
+    def add_children(pages, **params):
+        responses.add(
+            responses.GET,
+            "https://test.com/pages",
+            json=pages,
+            status=200,
+            match=[matchers.query_param_matcher(params, strict_match=False)],
+        )
+
+    @responses.activate
+    def test_warm_cache_skips_network(self, make_client):
+        """Тест, що свіжий кеш не робить запитів"""
+        self.add_children(
+            [{"id": 1, "slug": "a", "link": "l1", "modified": "2024-01-01T00:00:00"}]
+        )
+
+        assert make_client().get_inventory(7)["a"]["id"] == 1
+        assert make_client().get_inventory(7)["a"]["link"] == "l1"
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_stale_cache_refreshes_modified_after(self, make_client):
+        """Тест інкрементного оновлення застарілого кешу"""
+        self.add_children(
+            [
+                {"id": 1, "slug": "a", "modified": "2024-01-01T00:00:00"},
+                {"id": 2, "slug": "b", "modified": "2024-01-02T00:00:00"},
+            ]
+        )
+        make_client().get_inventory(7)
+
+        responses.reset()
+        self.add_children(
+            [{"id": 2, "slug": "b", "link": "new", "modified": "2024-02-01T00:00:00"}],
+            modified_after="2024-01-01T23:59:59",
+        )
+        pages = make_client(inventory_ttl=0).get_inventory(7)
+
+        assert set(pages) == {"a", "b"}
+        assert pages["b"]["link"] == "new"
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_written_pages_are_remembered(self, make_client):
+        """Тест, що записані сторінки потрапляють у кеш"""
+        self.add_children([{"id": 1, "slug": "a", "modified": "2024-01-01T00:00:00"}])
+        responses.add(
+            responses.POST,
+            "https://test.com/pages",
+            json={"id": 3, "slug": "c", "parent": 7, "link": "l3", "content": {}},
+            status=201,
+        )
+        wp_client = make_client()
+        wp_client.get_inventory(7)
+        wp_client.create_page({"slug": "c", "parent": 7})
+        wp_client.save_inventory(7)
+
+        pages = make_client().get_inventory(7)
+        assert pages["c"] == {"id": 3, "slug": "c", "parent": 7, "link": "l3"}
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_deleted_page_is_forgotten(self, make_client):
+        """Тест, що сторінка, видалена на сервері, зникає з кешу після 404"""
+        self.add_children([{"id": 1, "slug": "a", "modified": "2024-01-01T00:00:00"}])
+        responses.add(responses.POST, "https://test.com/pages/1", status=404)
+        wp_client = make_client()
+        wp_client.get_inventory(7)
+
+        assert wp_client.update_page(1, {"slug": "a"}) is None
+        wp_client.save_inventory(7)
+
+        assert wp_client.missing_pages == {1}
+        assert make_client().get_inventory(7) == {}
+
+
+class TestWordPressClientBatch:
+    """Тести для пакетних запитів /batch/v1"""
+
+    @pytest.fixture
+    def wp_client(self):
+        auth = HTTPBasicAuth("user", "pass")
+        return WordPressClient("https://test.com/wp-json/wp/v2", auth)
+
+    @responses.activate
+    def test_supports_batch(self, wp_client):
+        """Тест визначення підтримки пакетних запитів"""
+        responses.add(
+            responses.OPTIONS,
+            "https://test.com/wp-json/wp/v2/pages",
+            json={"namespace": "wp/v2", "allow_batch": {"v1": True}},
+            status=200,
+        )
+
+        assert wp_client.supports_batch() is True
+        assert wp_client.supports_batch() is True
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_batch_not_supported(self, wp_client):
+        """Тест сервера без пакетних запитів"""
+        responses.add(
+            responses.OPTIONS,
+            "https://test.com/wp-json/wp/v2/pages",
+            json={"namespace": "wp/v2"},
+            status=200,
+        )
+
+        assert wp_client.supports_batch() is False
+
+    @responses.activate
+    def test_batch_create_pages_chunked(self, wp_client):
+        """Тест розбиття на пакети по 25 запитів"""
+
+        def batch_callback(request):
+            sub_requests = json.loads(request.body)["requests"]
+            body = {
+                "responses": [
+                    {"status": 201, "body": {"slug": r["body"]["slug"]}}
+                    for r in sub_requests
+                ]
+            }
+            return 207, {}, json.dumps(body)
+
+        responses.add_callback(
+            responses.POST,
+            "https://test.com/wp-json/batch/v1",
+            callback=batch_callback,
+            content_type="application/json",
+        )
+
+        pages = [{"slug": f"page-{i}"} for i in range(30)]
+        result = wp_client.batch_create_pages(pages)
+        assert [page["slug"] for page in result] == [p["slug"] for p in pages]
+        assert len(responses.calls) == 2
+        first_batch = json.loads(responses.calls[0].request.body)["requests"]
+        assert len(first_batch) == 25
+        assert first_batch[0]["path"] == "/wp/v2/pages"
+
+    @responses.activate
+    def test_batch_update_pages_partial_failure(self, wp_client):
+        """Тест пакету, в якому один запит не пройшов"""
+        responses.add(
+            responses.POST,
+            "https://test.com/wp-json/batch/v1",
+            json={
+                "responses": [
+                    {"status": 200, "body": {"id": 1}},
+                    {"status": 400, "body": {"code": "rest_invalid_param"}},
+                ]
+            },
+            status=207,
+        )
+
+        result = wp_client.batch_update_pages([(1, {}), (2, {})])
+        assert result == [{"id": 1}, None]
+        sub_requests = json.loads(responses.calls[0].request.body)["requests"]
+        assert sub_requests[1]["path"] == "/wp/v2/pages/2"
@@ -0,0 +1,269 @@
+# tests/test_wordpress_uploader.py
+import json
+import os
+import queue
+import shutil
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+import responses
+from requests.auth import HTTPBasicAuth
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.fake_wordpress import FakeWordPress, FakeWordPressConfig
+from core import wordpress_uploader
+from core.models import Discipline
+from core.wordpress_client import WordPressClient
+from core.wordpress_uploader import (
+    UploadLedger,
+    pipeline_upload_all_pages,
+    prepare_discipline_page,
+    skip_unchanged_pages,
+    write_page,
+)
+
+PROGRAM_YAML = Path(__file__).resolve().parents[1] / "programm_data" / "PhD2024.yaml"
+
+DISCIPLINES = {
+    "ЗО 01": Discipline(code="ЗО 01", name="Математика"),
+    "ЗО 02": Discipline(code="ЗО 02", name="Фізика"),
+}
+
+
+class TestUploadLedgerResume:
+    """Тести для журналу завантажень і журналу відновлення"""
+
+    @pytest.fixture
+    def paths(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(wordpress_uploader.config, "output_dir", tmp_path)
+        return tmp_path / "state.json", tmp_path / "journal.jsonl"
+
+    @staticmethod
+    def write_html(tmp_path, code, html):
+        (tmp_path / f"{code.replace(' ', '_')}.html").write_text(html, "utf-8")
+
+    @staticmethod
+    def send(ledger, code, html):
+        page = prepare_discipline_page(code, DISCIPLINES[code], "2024", 7, html)
+        result = {"id": 1, "link": f"https://wp/{page['slug']}", "modified": "m"}
+        ledger.record_sent(code, page["state"], result, page["size"])
+
+    def make_ledger(self, paths, resume=False, force=False):
+        ledger_file, journal_file = paths
+        return UploadLedger(
+            ledger_file, force=force, journal_file=journal_file, resume=resume
+        )
+
+    def test_resume_skips_pages_sent_before_crash(self, paths, tmp_path):
+        """Тест, що resume пропускає сторінки з журналу з тим самим HTML"""
+        self.write_html(tmp_path, "ЗО 01", "<p>1</p>")
+        self.write_html(tmp_path, "ЗО 02", "<p>2</p>")
+        # Перерваний запуск встиг відправити лише ЗО 01
+        self.send(self.make_ledger(paths), "ЗО 01", "<p>1</p>")
+
+        ledger = self.make_ledger(paths, resume=True, force=True)
+        pending = skip_unchanged_pages(DISCIPLINES, "2024", 7, None, ledger)
+
+        assert list(pending) == ["ЗО 02"]
+        assert ledger.restored == 1
+        assert ledger.links["ЗО 01"].startswith("https://wp/")
+
+    def test_resume_resends_changed_page(self, paths, tmp_path):
+        """Тест, що сторінка, змінена після падіння, відправляється знову"""
+        self.send(self.make_ledger(paths), "ЗО 01", "<p>old</p>")
+        self.write_html(tmp_path, "ЗО 01", "<p>new</p>")
+        self.write_html(tmp_path, "ЗО 02", "<p>2</p>")
+
+        ledger = self.make_ledger(paths, resume=True, force=True)
+        pending = skip_unchanged_pages(DISCIPLINES, "2024", 7, None, ledger)
+
+        assert list(pending) == ["ЗО 01", "ЗО 02"]
+        assert ledger.restored == 0
+
+    def test_finished_run_is_not_replayed(self, paths, tmp_path):
+        """Тест, що після завершеного запуску resume нічого не відновлює"""
+        ledger = self.make_ledger(paths)
+        self.send(ledger, "ЗО 01", "<p>1</p>")
+        self.send(ledger, "ЗО 02", "<p>2</p>")
+        ledger.finish_journal()
+
+        assert not paths[1].exists()
+        resumed = self.make_ledger(paths, resume=True, force=True)
+        assert resumed.resumed == {}
+
+    def test_new_run_discards_journal(self, paths):
+        """Тест, що запуск без resume починає новий журнал"""
+        self.send(self.make_ledger(paths), "ЗО 01", "<p>1</p>")
+
+        self.make_ledger(paths)
+
+        assert not paths[1].exists()
+
+
+class TestWritePage:
+    """Тести для запису сторінки"""
+
+    @responses.activate
+    def test_recreates_page_deleted_on_server(self, tmp_path):
+        """Тест, що сторінка з 404 на оновлення створюється заново"""
+        responses.add(responses.POST, "https://test.com/pages/1", status=404)
+        responses.add(
+            responses.POST,
+            "https://test.com/pages",
+            json={"id": 2, "slug": "a", "link": "l2"},
+            status=201,
+        )
+        client = WordPressClient(
+            "https://test.com", HTTPBasicAuth("user", "pass"), cache_dir=tmp_path
+        )
+
+        result = write_page(client, {"slug": "a"}, {"id": 1, "slug": "a"})
+
+        assert result["id"] == 2
+        assert [call.request.url for call in responses.calls] == [
+            "https://test.com/pages/1",
+            "https://test.com/pages",
+        ]
+
+
+class RecordingQueue(queue.Queue):
+    """Черга, що запам'ятовує свій найбільший розмір"""
+
+    instances = []
+
+    def __init__(self, maxsize=0):
+        super().__init__(maxsize)
+        self.peak = 0
+        RecordingQueue.instances.append(self)
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        self.peak = max(self.peak, self.qsize())
+
+
+class TestPipelineUpload:
+    """Тести для конвеєра рендерингу та завантаження на фейковий WordPress"""
+
+    @pytest.fixture
+    def fake(self):
+        config = FakeWordPressConfig(
+            latency=0.0, jitter=0.0, write_time=0.0, allow_batch=False
+        )
+        with FakeWordPress(config) as fake:
+            yield fake
+
+    @pytest.fixture
+    def run(self, fake, tmp_path, monkeypatch):
+        """Запуск конвеєра для копії програми з журналами в tmp_path"""
+        monkeypatch.setattr(wordpress_uploader.config, "wp_links_dir", tmp_path)
+        yaml_file = tmp_path / "program.yaml"
+        shutil.copy(PROGRAM_YAML, yaml_file)
+        output_dir = tmp_path / "out"
+
+        def run(**kwargs):
+            client = WordPressClient(
+                fake.api_url,
+                HTTPBasicAuth("user", "pass"),
+                backoff_factor=0,
+                cache_dir=tmp_path / "cache",
+            )
+            try:
+                return pipeline_upload_all_pages(
+                    yaml_file, output_dir, client, **kwargs
+                )
+            finally:
+                client.close()
+
+        run.output_dir = output_dir
+        return run
+
+    @staticmethod
+    def upload_threads():
+        return [t for t in threading.enumerate() if t.name.startswith("upload-")]
+
+    @staticmethod
+    def fail_writes(fake, monkeypatch, codes):
+        """Фейковий WordPress відхиляє запис сторінок дисциплін з codes"""
+        write = fake.write_page
+
+        def write_page(page_id, data):
+            if data.get("title", "").split(":")[0] in codes:
+                return 400, {"code": "rest_invalid_param"}
+            return write(page_id, data)
+
+        monkeypatch.setattr(fake, "write_page", write_page)
+
+    def test_uploads_all_pages_through_bounded_queue(self, fake, run, monkeypatch):
+        """Тест, що всі сторінки завантажено, а черга не росте понад queue_size"""
+        RecordingQueue.instances.clear()
+        monkeypatch.setattr(wordpress_uploader.queue, "Queue", RecordingQueue)
+
+        result = run(workers=2, queue_size=2)
+
+        assert len(result["links"]) == len(fake.pages) == fake.stats.writes == 12
+        assert len(list(run.output_dir.glob("*.html"))) == 12
+        (pages,) = RecordingQueue.instances
+        assert pages.maxsize == 2
+        assert 0 < pages.peak <= 2
+        assert self.upload_threads() == []
+
+    def test_failed_upload_is_reported(self, fake, run, monkeypatch, caplog):
+        """Тест, що незавантажена сторінка потрапляє в попередження, а не в посилання"""
+        self.fail_writes(fake, monkeypatch, {"НК 02"})
+
+        with caplog.at_level("WARNING", logger=wordpress_uploader.logger.name):
+            result = run()
+
+        assert "НК 02" not in result["links"]
+        assert len(result["links"]) == 11
+        assert any("НК 02" in record.getMessage() for record in caplog.records)
+
+    def test_manifest_records_only_uploaded_pages(self, fake, run, monkeypatch):
+        """Тест, що маніфест отримує лише завантажені сторінки, а решта повторюється"""
+        failing = {"НК 02"}
+        self.fail_writes(fake, monkeypatch, failing)
+        run(incremental=True)
+        manifest_file = run.output_dir / ".manifest.json"
+        manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+        assert len(manifest) == 11
+        assert "НК_02.html" not in manifest
+
+        failing.clear()
+        rendered = []
+        render = wordpress_uploader.render_discipline_page
+
+        def spy(yaml_file, discipline_code):
+            rendered.append(discipline_code)
+            return render(yaml_file, discipline_code)
+
+        monkeypatch.setattr(wordpress_uploader, "render_discipline_page", spy)
+        result = run(incremental=True)
+
+        assert rendered == ["НК 02"]
+        assert len(result["links"]) == 12
+        assert fake.stats.writes == 12
+        assert len(json.loads(manifest_file.read_text(encoding="utf-8"))) == 12
+
+    def test_render_error_stops_upload_workers(self, fake, run, monkeypatch):
+        """Тест, що помилка рендерингу зупиняє потоки та зберігає журнал"""
+        render = wordpress_uploader.render_discipline_page
+
+        def render_or_fail(yaml_file, discipline_code):
+            if discipline_code == "НК 05":
+                raise RuntimeError("template error")
+            return render(yaml_file, discipline_code)
+
+        monkeypatch.setattr(
+            wordpress_uploader, "render_discipline_page", render_or_fail
+        )
+
+        with pytest.raises(RuntimeError):
+            run(workers=3)
+
+        assert self.upload_threads() == []
+        ledger_file = run.output_dir.parent / ".upload_state_program.json"
+        ledger = json.loads(ledger_file.read_text(encoding="utf-8"))
+        assert set(ledger) == {"НК 01", "НК 02", "НК 03", "НК 04"}